@@ -5,16 +5,20 @@ except ModuleNotFoundError:
     gym = None
     wrappers = None
 
-import sys
-
-sys.setrecursionlimit(25000)
-
-from random_map import generate_random_map_custom 
+from random_map import FastFrozenLakeEnv, generate_random_map_custom
+from grid_model import TILE_HOLE, compile_grid, read_desc_rows
+from busquedas_numpy import bfs_numpy, random_walks_numpy, uniform_cost_numpy
+from map_cache import SIN_DISTANCIA, cached_map_info, map_info
+from profiling import active_stats, container_bytes
+from array import array
 from collections import deque
 import heapq
 
-def deterministic_random_100_environment():
-    env, start, goal = generate_random_map_custom(100, 0.92)
+# Marca de "estado todavía no alcanzado" en el arreglo de profundidades de DLS/IDDFS
+SIN_PROFUNDIDAD = 2**31 - 1
+
+def deterministic_random_100_environment(seed=None):
+    env, start, goal = generate_random_map_custom(100, 0.92, seed)
     if wrappers is not None:
         env = wrappers.TimeLimit(env, 1000)
     elif hasattr(env, "max_steps"):
@@ -24,6 +28,8 @@ def deterministic_random_100_environment():
 def random_search(env, start, goal, max_steps=1000, verbose=False):
     env.unwrapped.s = start
     env.reset()
+    stats = active_stats()
+    step = env.step if stats is None else stats.timed_step(env.step)
 
     done = False
     truncated = False
@@ -42,7 +48,7 @@ def random_search(env, start, goal, max_steps=1000, verbose=False):
         else:
             costo += 10
 
-        next_state, reward, done, truncated_flag, _ = env.step(action)
+        next_state, reward, done, truncated_flag, _ = step(action)
         truncated = truncated_flag or acciones >= max_steps
 
         if verbose:
@@ -58,213 +64,398 @@ def random_search(env, start, goal, max_steps=1000, verbose=False):
 
     return None, None, None
 
-def bfs_search(env, start, goal, verbose=False):
-    env.unwrapped.s = start
-    env.reset()
+def random_search_walkers(env, start, goal, walkers=1000, max_steps=1000, seed=None):
+    """Versión Monte Carlo de random_search: `walkers` caminatas independientes a la vez.
+
+    Devuelve arreglos NumPy (exitos, acciones, costos) con un valor por caminata;
+    para las exitosas, los estados explorados son acciones + 1 como en random_search.
+    """
+    base = env.unwrapped
+    if not hasattr(base, "step_batch"):
+        # Entornos de Gymnasium: se usa la tabla de transiciones de FastFrozenLakeEnv
+        rows = [row.decode("ascii") for row in read_desc_rows(env)]
+        base = FastFrozenLakeEnv(rows, start, goal)
+    return random_walks_numpy(base, start, walkers, max_steps, seed)
+
+def _check_backend(backend):
+    if backend not in ("python", "numpy"):
+        raise ValueError(f"Backend desconocido: {backend}")
+
+def _informar(resultado, verbose):
+    estados_explorados, acciones, costo = resultado
+    if verbose:
+        if estados_explorados is None:
+            print("No se encontró camino al objetivo.")
+        else:
+            print(f"Objetivo alcanzado con {acciones} acciones y costo {costo}")
+    return resultado
+
+def bfs_search(env, start, goal, verbose=False, backend="python"):
+    _check_backend(backend)
+    grid = compile_grid(env)
+    if backend == "numpy":
+        return _informar(bfs_numpy(grid, start, goal), verbose)
+
+    indptr, indices, costs = grid.indptr, grid.indices, grid.costs
 
     visited = {start}
     queue = deque()
     queue.append((start, 0, 0))  # (estado, acciones acumuladas, costo acumulado)
     estados_explorados = 1
+    expandidos = pico_frontera = 0
+    resultado = None, None, None
     while queue:
+        if len(queue) > pico_frontera:
+            pico_frontera = len(queue)
         current_state, acciones, costo = queue.popleft()
         if current_state == goal:
-            if verbose:
-                print(f"Objetivo alcanzado con {acciones} acciones y costo {costo}")
-            return estados_explorados, acciones, costo
-        for action in range(env.action_space.n):
-            env.unwrapped.s = current_state
-            next_state, _, _, _, _ = env.step(action)
-
-            # Evitar casilleros 'H' (Hole)
-            if env.unwrapped.desc.flatten()[next_state] == b'H':
-                continue
-
+            resultado = estados_explorados, acciones, costo
+            break
+        expandidos += 1
+        # Los casilleros 'H' (Hole) ya no figuran como vecinos en el grafo compilado
+        for idx in range(indptr[current_state], indptr[current_state + 1]):
+            next_state = indices[idx]
             if next_state in visited:
                 continue
 
             visited.add(next_state)
             estados_explorados += 1
+            queue.append((next_state, acciones + 1, costo + costs[idx]))
 
-            if action == 0 or action == 2:
-                acciones_sig = acciones + 1
-                nuevo_costo = costo + 1
-            else:
-                acciones_sig = acciones + 1
-                nuevo_costo = costo + 10
-
-            queue.append((next_state, acciones_sig, nuevo_costo))
-    if verbose:
-        print("No se encontró camino al objetivo.")
-    return None, None, None
+    stats = active_stats()
+    if stats is not None:
+        stats.record(
+            nodes_expanded=expandidos,
+            peak_frontier=pico_frontera,
+            peak_visited_bytes=container_bytes(visited),
+        )
+    return _informar(resultado, verbose)
 
 def dfs_search(env, start, goal, verbose=False):
-    env.unwrapped.s = start
-    env.reset()
-
-    visited = {start}
-    estados_explorados = 1
+    grid = compile_grid(env)
+    indptr, indices, costs = grid.indptr, grid.indices, grid.costs
 
-    def dfs(current_state, acciones, costo):
-        nonlocal estados_explorados
+    if start == goal:
+        return _informar((1, 0, 0), verbose)
 
-        if current_state == goal:
-            if verbose:
-                print(f"Objetivo alcanzado con {acciones} acciones y costo {costo}")
-            return estados_explorados, acciones, costo
+    visited = bytearray(grid.n_states)
+    visited[start] = 1
+    estados_explorados = 1
+    pico_frontera = 1
+    resultado = None, None, None
+
+    # Pila explícita: por cada nivel, el estado, su costo, sus acciones y la próxima arista a revisar
+    pila_estados = [start]
+    pila_acciones = [0]
+    pila_costos = [0]
+    pila_aristas = [indptr[start]]
+    while pila_estados:
+        current_state = pila_estados[-1]
+        idx = pila_aristas[-1]
+        fin = indptr[current_state + 1]
+        while idx < fin:
+            next_state = indices[idx]
+            idx += 1
+            if not visited[next_state]:
+                break
+        else:
+            pila_estados.pop()
+            pila_acciones.pop()
+            pila_costos.pop()
+            pila_aristas.pop()
+            continue
+        pila_aristas[-1] = idx
 
-        for action in range(env.action_space.n):
-            env.unwrapped.s = current_state
-            next_state, _, _, _, _ = env.step(action)
+        visited[next_state] = 1
+        estados_explorados += 1
+        acciones = pila_acciones[-1] + 1
+        costo = pila_costos[-1] + costs[idx - 1]
+
+        if next_state == goal:
+            resultado = estados_explorados, acciones, costo
+            break
+
+        pila_estados.append(next_state)
+        pila_acciones.append(acciones)
+        pila_costos.append(costo)
+        pila_aristas.append(indptr[next_state])
+        if len(pila_estados) > pico_frontera:
+            pico_frontera = len(pila_estados)
+
+    stats = active_stats()
+    if stats is not None:
+        # Cada estado descubierto se apila y se expande arista por arista
+        stats.record(
+            nodes_expanded=estados_explorados,
+            peak_frontier=pico_frontera,
+            peak_visited_bytes=container_bytes(visited),
+        )
+    return _informar(resultado, verbose)
+
+
+def _dfs_limitado(grid, start, goal, limit, profundidades, tocados):
+    """DFS con límite de profundidad sobre una pila explícita.
+
+    `profundidades` guarda la menor profundidad con la que se alcanzó cada
+    estado (SIN_PROFUNDIDAD si todavía no se alcanzó) y `tocados` anota los
+    estados escritos para poder limpiar el arreglo sin recorrerlo entero.
+    Devuelve (resultado, estados_explorados, hubo_corte, expandidos, pico_frontera).
+    """
+    indptr, indices, costs = grid.indptr, grid.indices, grid.costs
+
+    profundidades[start] = 0
+    tocados.append(start)
+    estados_explorados = 1
 
-            if env.unwrapped.desc.flatten()[next_state] == b'H':
-                continue
+    if start == goal:
+        return (estados_explorados, 0, 0), estados_explorados, False, 0, 1
+    if limit <= 0:
+        return None, estados_explorados, indptr[start] < indptr[start + 1], 0, 1
+
+    # La profundidad de cada nivel es su posición en la pila (y coincide con las acciones)
+    pila_estados = [start]
+    pila_costos = [0]
+    pila_aristas = [indptr[start]]
+    hubo_corte = False
+    expandidos = pico_frontera = 1
+    while pila_estados:
+        current_state = pila_estados[-1]
+        idx = pila_aristas[-1]
+        fin = indptr[current_state + 1]
+        profundidad_nueva = len(pila_estados)
+        while idx < fin:
+            next_state = indices[idx]
+            idx += 1
+            # Descarta también los estados del camino actual, que tienen menor profundidad
+            if profundidades[next_state] > profundidad_nueva:
+                break
+        else:
+            pila_estados.pop()
+            pila_costos.pop()
+            pila_aristas.pop()
+            continue
+        pila_aristas[-1] = idx
 
-            if next_state in visited:
-                continue
+        if profundidades[next_state] == SIN_PROFUNDIDAD:
+            tocados.append(next_state)
+        profundidades[next_state] = profundidad_nueva
+        estados_explorados += 1
+        costo = pila_costos[-1] + costs[idx - 1]
 
-            visited.add(next_state)
-            estados_explorados += 1
+        if next_state == goal:
+            return (estados_explorados, profundidad_nueva, costo), estados_explorados, hubo_corte, expandidos, pico_frontera
+        if profundidad_nueva >= limit:
+            hubo_corte = True
+            continue
 
-            if action == 0 or action == 2:
-                nuevo_costo = costo + 1
-                nuevas_acciones = acciones + 1
-            else:
-                nuevo_costo = costo + 10
-                nuevas_acciones = acciones + 1
+        pila_estados.append(next_state)
+        pila_costos.append(costo)
+        pila_aristas.append(indptr[next_state])
+        expandidos += 1
+        if len(pila_estados) > pico_frontera:
+            pico_frontera = len(pila_estados)
 
-            resultado = dfs(next_state, nuevas_acciones, nuevo_costo)
-            if resultado is not None:
-                return resultado
+    return None, estados_explorados, hubo_corte, expandidos, pico_frontera
 
-        return None
 
-    resultado = dfs(start, 0, 0)
+def limited_dfs_search(env, limit, start, goal, verbose=False):
+    grid = compile_grid(env)
+    profundidades = array("i", [SIN_PROFUNDIDAD]) * grid.n_states
+
+    resultado, _, _, expandidos, pico_frontera = _dfs_limitado(grid, start, goal, limit, profundidades, [])
+    stats = active_stats()
+    if stats is not None:
+        # Los estados que llegan al límite se alcanzan pero no se apilan ni se expanden
+        stats.record(
+            nodes_expanded=expandidos,
+            peak_frontier=pico_frontera,
+            peak_visited_bytes=container_bytes(profundidades),
+        )
     if resultado is not None:
-        return resultado
+        return _informar(resultado, verbose)
 
     if verbose:
-        print("No se encontró camino al objetivo.")
+        print("No se encontró camino al objetivo dentro del límite.")
     return None, None, None
 
 
-def limited_dfs_search(env, limit, start, goal, verbose=False):
-    env.unwrapped.s = start
-    env.reset()
-
-    mejores_profundidades = {start: 0}
-    estados_explorados = 1
-
-    def dfs_limit(current_state, acciones, costo, profundidad, en_camino):
-        nonlocal estados_explorados
-        if current_state == goal:
-            if verbose:
-                print(f"Objetivo alcanzado con {acciones} acciones y costo {costo}")
-            return estados_explorados, acciones, costo
-
-        if profundidad >= limit:
-            return None
-
-        for action in range(env.action_space.n):
-            env.unwrapped.s = current_state
-            next_state, _, _, _, _ = env.step(action)
-
-            if env.unwrapped.desc.flatten()[next_state] == b'H':
-                continue
-
-            if next_state in en_camino:
-                continue
-
-            if action == 0 or action == 2:
-                paso = 1
-            else:
-                paso = 10
-            nuevo_costo = costo + paso
-            nuevas_acciones = acciones + 1
-
-            profundidad_nueva = profundidad + 1
-            mejor_prev = mejores_profundidades.get(next_state)
-            if mejor_prev is not None and profundidad_nueva >= mejor_prev:
-                continue
-
-            mejores_profundidades[next_state] = profundidad_nueva
-            estados_explorados += 1
-
-            en_camino.add(next_state)
-            resultado = dfs_limit(next_state, nuevas_acciones, nuevo_costo, profundidad + 1, en_camino)
-            en_camino.remove(next_state)
-
-            if resultado is not None:
-                return resultado
-
-        return None
-
-    resultado = dfs_limit(start, 0, 0, 0, {start})
+def iterative_deepening_search(env, start, goal, max_limit=None, step=None, verbose=False):
+    """IDDFS: repite DLS con límites 0, step, 2*step, ... hasta max_limit.
+
+    Por defecto `step` es un décimo del lado mayor de la grilla: con step=1
+    un mapa de 100x100 explora millones de estados repitiendo cientos de
+    iteraciones casi iguales. Con step > 1 el camino encontrado puede tener
+    hasta step - 1 acciones más que el mínimo; step=1 recupera el IDDFS clásico.
+
+    Todas las iteraciones comparten un único arreglo de profundidades que se
+    limpia solo en los estados tocados. `estados_explorados` acumula los
+    estados de todas las iteraciones. Se detiene antes de max_limit si una
+    iteración termina sin podar ningún estado por profundidad.
+    """
+    grid = compile_grid(env)
+    if max_limit is None:
+        max_limit = grid.n_states
+    if step is None:
+        step = max(1, max(grid.nrow, grid.ncol) // 10)
+    profundidades = array("i", [SIN_PROFUNDIDAD]) * grid.n_states
+    tocados = []
+    estados_explorados = 0
+    expandidos = pico_frontera = 0
+    resultado = None
+
+    for limit in range(0, max_limit + 1, step):
+        resultado, estados, hubo_corte, expandidos_iteracion, pico_iteracion = _dfs_limitado(
+            grid, start, goal, limit, profundidades, tocados
+        )
+        estados_explorados += estados
+        expandidos += expandidos_iteracion
+        pico_frontera = max(pico_frontera, pico_iteracion)
+        if resultado is not None or not hubo_corte:
+            break
+
+        for state in tocados:
+            profundidades[state] = SIN_PROFUNDIDAD
+        tocados.clear()
+
+    stats = active_stats()
+    if stats is not None:
+        # Acumulado sobre todas las iteraciones, como estados_explorados
+        stats.record(
+            nodes_expanded=expandidos,
+            peak_frontier=pico_frontera,
+            peak_visited_bytes=container_bytes(profundidades),
+        )
     if resultado is not None:
-        return resultado
+        _, acciones, costo = resultado
+        return _informar((estados_explorados, acciones, costo), verbose)
 
     if verbose:
         print("No se encontró camino al objetivo dentro del límite.")
     return None, None, None
 
-def uniform_cost_search(env, start, goal, verbose=False):
-    env.unwrapped.s = start
+def _registrar_heap(expandidos, pushes, pops, pico_frontera, costos, visitados):
+    """Vuelca los contadores de UCS/A* al SearchStats activo, si lo hay.
+
+    `costos` tiene una entrada por estado encolado, así que el resto de los
+    pushes son reinserciones del mismo estado (borrado perezoso).
+    """
+    stats = active_stats()
+    if stats is not None:
+        stats.record(
+            nodes_expanded=expandidos,
+            heap_pushes=pushes,
+            heap_pops=pops,
+            duplicate_pushes=pushes - len(costos),
+            peak_frontier=pico_frontera,
+            peak_visited_bytes=container_bytes(costos, visitados),
+        )
+
+def _descartado(grid, start, goal):
+    """True si el caché del mapa ya sabe que no hay camino.
+
+    No calcula el análisis si falta: el runner lo precalcula fuera del tiempo
+    medido, y sin él la búsqueda agota la componente del inicio y devuelve None.
+    """
+    info = cached_map_info(grid)
+    return info is not None and not info.reachable(start, goal)
+
+def _sin_camino(verbose):
+    """Resultado de UCS/A* cuando el caché del mapa ya descarta el objetivo: no se expande nada."""
+    _registrar_heap(0, 0, 0, 0, {}, {})
+    return _informar((None, None, None), verbose)
+
+def uniform_cost_search(env, start, goal, verbose=False, backend="python"):
+    _check_backend(backend)
+    grid = compile_grid(env)
+    if _descartado(grid, start, goal):
+        return _sin_camino(verbose)
+    if backend == "numpy":
+        return _informar(uniform_cost_numpy(grid, start, goal), verbose)
+
+    indptr, indices, costs = grid.indptr, grid.indices, grid.costs
+
     heap = []
     heapq.heappush(heap, (0, 0, start))  # (costo acumulado, acciones, estado)
-    env.reset()
     costos = {start: 0}
     acciones_minimas = {start: 0}
     estados_explorados = 0
+    pushes, pops, pico_frontera = 1, 0, 0
+    resultado = None, None, None
     while heap:
+        if len(heap) > pico_frontera:
+            pico_frontera = len(heap)
         costo, acciones, current_state = heapq.heappop(heap)
+        pops += 1
         if costo > costos.get(current_state, float("inf")):
             continue
 
         estados_explorados += 1
 
         if current_state == goal:
-            if verbose:
-                print(f"Objetivo alcanzado con {acciones} acciones y costo {costo}")
-            return estados_explorados, acciones, costo
-
-        for action in range(env.action_space.n):
-            env.unwrapped.s = current_state
-            next_state, _, _, _, _ = env.step(action)
-            if env.unwrapped.desc.flatten()[next_state] != b'H':
-                # Costo según acción
-                if action == 0 or action == 2:
-                    new_cost = costo + 1
-                    new_actions = acciones + 1
-                else:
-                    new_cost = costo + 10
-                    new_actions = acciones + 1
-
-                if new_cost < costos.get(next_state, float("inf")):
-                    costos[next_state] = new_cost
-                    acciones_minimas[next_state] = new_actions
-                    heapq.heappush(heap, (new_cost, new_actions, next_state))
-                elif new_cost == costos.get(next_state) and new_actions < acciones_minimas.get(next_state, float("inf")):
-                    acciones_minimas[next_state] = new_actions
-                    heapq.heappush(heap, (new_cost, new_actions, next_state))
-    if verbose:
-        print("No se encontró camino al objetivo.")
-    return None, None, None
+            resultado = estados_explorados, acciones, costo
+            break
+
+        for idx in range(indptr[current_state], indptr[current_state + 1]):
+            next_state = indices[idx]
+            # Costo según acción, precalculado en el grafo
+            new_cost = costo + costs[idx]
+            new_actions = acciones + 1
+
+            if new_cost < costos.get(next_state, float("inf")):
+                costos[next_state] = new_cost
+                acciones_minimas[next_state] = new_actions
+                heapq.heappush(heap, (new_cost, new_actions, next_state))
+                pushes += 1
+            elif new_cost == costos.get(next_state) and new_actions < acciones_minimas.get(next_state, float("inf")):
+                acciones_minimas[next_state] = new_actions
+                heapq.heappush(heap, (new_cost, new_actions, next_state))
+                pushes += 1
+
+    _registrar_heap(estados_explorados, pushes, pops, pico_frontera, costos, acciones_minimas)
+    return _informar(resultado, verbose)
+
+def manhattan(state, goal, ncol):
+    x1, y1 = divmod(state, ncol)
+    x2, y2 = divmod(goal, ncol)
+    return abs(x1 - x2) + abs(y1 - y2)
+
+def manhattan_ponderada(state, goal, ncol):
+    # Los movimientos verticales (Down/Up) cuestan 10 en el escenario 2
+    x1, y1 = divmod(state, ncol)
+    x2, y2 = divmod(goal, ncol)
+    return abs(x1 - x2) * 10 + abs(y1 - y2)
+
+def a_star_search_1(env, start, goal, verbose=False, exact_heuristic=False):
+    grid = compile_grid(env)
+    indptr, indices = grid.indptr, grid.indices
+    if _descartado(grid, start, goal):
+        return _sin_camino(verbose)
+
+    if exact_heuristic:
+        # Distancia real al objetivo (BFS inverso cacheado por mapa)
+        distancias = map_info(grid).distances(goal, unit_cost=True)
+        if distancias[start] == SIN_DISTANCIA:
+            return _sin_camino(verbose)
+
+        def heuristic(state, goal):
+            return distancias[state]
+    else:
+        def heuristic(state, goal):
+            return manhattan(state, goal, grid.ncol)
 
-def a_star_search_1(env, start, goal, verbose=False):
-    def heuristic(state, goal):
-        x1, y1 = divmod(state, env.unwrapped.ncol)
-        x2, y2 = divmod(goal, env.unwrapped.ncol)
-        return abs(x1 - x2) + abs(y1 - y2)
-
-    env.unwrapped.s = start
     costos = {start: 0}
     heap = []
     heapq.heappush(heap, (heuristic(start, goal), 0, 0, start))  # (f, g, acciones, estado)
     visited = set()
     estados_explorados = 0
+    pushes, pops, pico_frontera = 1, 0, 0
+    resultado = None, None, None
 
     while heap:
+        if len(heap) > pico_frontera:
+            pico_frontera = len(heap)
         f, g, acciones, current_state = heapq.heappop(heap)
+        pops += 1
 
         if current_state in visited:
             continue
@@ -272,43 +463,53 @@ def a_star_search_1(env, start, goal, verbose=False):
         estados_explorados += 1
 
         if current_state == goal:
-            if verbose:
-                print(f"Objetivo alcanzado con {acciones} acciones y costo {g}")
-            return estados_explorados, acciones, g
-
-        for action in range(env.action_space.n):
-            env.unwrapped.s = current_state
-            next_state, _, _, _, _ = env.step(action)
-
-            if env.unwrapped.desc.flatten()[next_state] == b'H':  # Hielo => hueco, ignorar
-                continue
+            resultado = estados_explorados, acciones, g
+            break
 
+        for idx in range(indptr[current_state], indptr[current_state + 1]):
+            next_state = indices[idx]
             new_g = g + 1
             nuevas_acciones = acciones + 1
             if new_g < costos.get(next_state, float('inf')):
                 costos[next_state] = new_g
                 new_f = new_g + heuristic(next_state, goal)
                 heapq.heappush(heap, (new_f, new_g, nuevas_acciones, next_state))
+                pushes += 1
 
-    if verbose:
-        print("No se encontró camino al objetivo.")
-    return None, None, None
+    _registrar_heap(estados_explorados, pushes, pops, pico_frontera, costos, visited)
+    return _informar(resultado, verbose)
 
-def a_star_search_2(env, start, goal, verbose=False):
-    def heuristic(state, goal):
-        x1, y1 = divmod(state, env.unwrapped.ncol)
-        x2, y2 = divmod(goal, env.unwrapped.ncol)
-        return abs(x1 - x2) * 10 + abs(y1 - y2)
+def a_star_search_2(env, start, goal, verbose=False, exact_heuristic=False):
+    grid = compile_grid(env)
+    indptr, indices, costs = grid.indptr, grid.indices, grid.costs
+    if _descartado(grid, start, goal):
+        return _sin_camino(verbose)
+
+    if exact_heuristic:
+        # Costo real al objetivo (Dijkstra inverso cacheado por mapa)
+        distancias = map_info(grid).distances(goal)
+        if distancias[start] == SIN_DISTANCIA:
+            return _sin_camino(verbose)
+
+        def heuristic(state, goal):
+            return distancias[state]
+    else:
+        def heuristic(state, goal):
+            return manhattan_ponderada(state, goal, grid.ncol)
 
-    env.unwrapped.s = start
     costos = {start: 0}
     heap = []
     heapq.heappush(heap, (heuristic(start, goal), 0, 0, start))  # (f, g, acciones, estado)
     visited = set()
     estados_explorados = 0
+    pushes, pops, pico_frontera = 1, 0, 0
+    resultado = None, None, None
 
     while heap:
+        if len(heap) > pico_frontera:
+            pico_frontera = len(heap)
         f, g, acciones, current_state = heapq.heappop(heap)
+        pops += 1
 
         if current_state in visited:
             continue
@@ -316,32 +517,274 @@ def a_star_search_2(env, start, goal, verbose=False):
         estados_explorados += 1
 
         if current_state == goal:
-            if verbose:
-                print(f"Objetivo alcanzado con {acciones} acciones y costo {g}")
-            return estados_explorados, acciones, g
-
-        for action in range(env.action_space.n):
-            env.unwrapped.s = current_state
-            next_state, _, _, _, _ = env.step(action)
+            resultado = estados_explorados, acciones, g
+            break
 
-            if env.unwrapped.desc.flatten()[next_state] == b'H':  # Hielo => hueco, ignorar
-                continue
+        for idx in range(indptr[current_state], indptr[current_state + 1]):
+            next_state = indices[idx]
+            new_g = g + costs[idx]
+            nuevas_acciones = acciones + 1
 
-            if action == 0 or action == 2:
-                new_g = g + 1
-                nuevas_acciones = acciones + 1
-            else: 
-                new_g = g + 10
-                nuevas_acciones = acciones + 1
-                
             if new_g < costos.get(next_state, float('inf')):
                 costos[next_state] = new_g
                 new_f = new_g + heuristic(next_state, goal)
                 heapq.heappush(heap, (new_f, new_g, nuevas_acciones, next_state))
+                pushes += 1
+
+    _registrar_heap(estados_explorados, pushes, pops, pico_frontera, costos, visited)
+    return _informar(resultado, verbose)
+
+def bidirectional_bfs_search(env, start, goal, verbose=False):
+    """BFS desde el inicio y desde el objetivo a la vez.
+
+    El grafo es simétrico (cada movimiento tiene su inverso con el mismo
+    costo), así que la búsqueda hacia atrás usa las mismas aristas. En cada
+    paso se expande una capa completa del lado con la frontera más chica;
+    cada estado guarda el menor costo entre sus caminos de menos acciones
+    desde la raíz de su lado. Cuando una capa toca al otro lado, se une por
+    el encuentro de menos acciones y, entre esos, de menor costo.
+
+    Las acciones siempre coinciden con `bfs_search`. El costo es el más barato
+    entre los caminos de menos acciones (igual que el backend "numpy" de BFS),
+    así que puede ser menor que el de `bfs_search`, que sigue el primer camino
+    que encuentra en orden de expansión.
+    """
+    grid = compile_grid(env)
+    indptr, indices, costs = grid.indptr, grid.indices, grid.costs
+
+    if start == goal:
+        return _informar((1, 0, 0), verbose)
+
+    # Por lado: (acciones, costo) de cada estado alcanzado y la frontera actual
+    visitados = [{start: (0, 0)}, {goal: (0, 0)}]
+    fronteras = [[start], [goal]]
+    estados_explorados = 2
+    expandidos, pico_frontera = 0, 2
+    resultado = None, None, None
+
+    while fronteras[0] and fronteras[1]:
+        lado = 0 if len(fronteras[0]) <= len(fronteras[1]) else 1
+        propios, otros = visitados[lado], visitados[1 - lado]
+        nueva_frontera = []
+        expandidos += len(fronteras[lado])
+
+        for current_state in fronteras[lado]:
+            acciones, costo = propios[current_state]
+            for idx in range(indptr[current_state], indptr[current_state + 1]):
+                next_state = indices[idx]
+                nuevo = (acciones + 1, costo + costs[idx])
+                previo = propios.get(next_state)
+                if previo is None:
+                    propios[next_state] = nuevo
+                    nueva_frontera.append(next_state)
+                    estados_explorados += 1
+                elif previo[0] == nuevo[0] and nuevo[1] < previo[1]:
+                    # Otro padre de la misma capa llega más barato
+                    propios[next_state] = nuevo
+
+        # Los encuentros se evalúan con la capa completa, cuando sus costos ya son definitivos
+        mejor = None
+        for next_state in nueva_frontera:
+            if next_state in otros:
+                acciones, costo = propios[next_state]
+                acciones_otro, costo_otro = otros[next_state]
+                candidato = (acciones + acciones_otro, costo + costo_otro)
+                if mejor is None or candidato < mejor:
+                    mejor = candidato
+
+        if mejor is not None:
+            resultado = estados_explorados, mejor[0], mejor[1]
+            break
+        fronteras[lado] = nueva_frontera
+        pico_frontera = max(pico_frontera, len(fronteras[0]) + len(fronteras[1]))
+
+    stats = active_stats()
+    if stats is not None:
+        # La frontera es la suma de las capas abiertas de los dos lados
+        stats.record(
+            nodes_expanded=expandidos,
+            peak_frontier=pico_frontera,
+            peak_visited_bytes=container_bytes(*visitados),
+        )
+    return _informar(resultado, verbose)
+
+def _bidirectional_a_star(grid, start, goal, heuristic, unit_cost):
+    """A* bidireccional con potenciales promediados.
+
+    Cada lado ordena por g + p, con p(v) = (h(v, goal) - h(start, v)) / 2 hacia
+    adelante y -p(v) hacia atrás: las dos claves son consistentes y suman el
+    costo del camino que pasa por v, así que se puede cortar apenas el mínimo
+    de una frontera más el de la otra alcanza al mejor camino conocido. Las
+    claves se guardan multiplicadas por 2 para trabajar con enteros.
+    """
+    indptr, indices, costs = grid.indptr, grid.indices, grid.costs
+
+    if start == goal:
+        return 1, 0, 0
+
+    def potencial(state):
+        return heuristic(state, goal) - heuristic(start, state)
+
+    # Lado 0 avanza desde el inicio hacia el objetivo; lado 1, al revés
+    signos = (1, -1)
+    costos = ({start: 0}, {goal: 0})
+    acciones_camino = ({start: 0}, {goal: 0})
+    heaps = ([(potencial(start), 0, 0, start)], [(-potencial(goal), 0, 0, goal)])
+    cerrados = (set(), set())
+    mejor = None  # (costo, acciones) del mejor camino completo encontrado
+    estados_explorados = 0
+    pushes, pops, pico_frontera = 2, 0, 0
+
+    while heaps[0] and heaps[1]:
+        if len(heaps[0]) + len(heaps[1]) > pico_frontera:
+            pico_frontera = len(heaps[0]) + len(heaps[1])
+        # Todo camino sin descubrir suma al menos los dos mínimos (en claves x2)
+        if mejor is not None and heaps[0][0][0] + heaps[1][0][0] >= 2 * mejor[0]:
+            break
+
+        lado = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        heap, propios, otros, signo = heaps[lado], costos[lado], costos[1 - lado], signos[lado]
+        _, g, acciones, current_state = heapq.heappop(heap)
+        pops += 1
+        if current_state in cerrados[lado] or g > propios[current_state]:
+            continue
+        cerrados[lado].add(current_state)
+        estados_explorados += 1
 
-    if verbose:
-        print("No se encontró camino al objetivo.")
-    return None, None, None
+        for idx in range(indptr[current_state], indptr[current_state + 1]):
+            next_state = indices[idx]
+            new_g = g + (1 if unit_cost else costs[idx])
+            nuevas_acciones = acciones + 1
+            if new_g < propios.get(next_state, float('inf')):
+                propios[next_state] = new_g
+                acciones_camino[lado][next_state] = nuevas_acciones
+                clave = 2 * new_g + signo * potencial(next_state)
+                heapq.heappush(heap, (clave, new_g, nuevas_acciones, next_state))
+                pushes += 1
+
+                if next_state in otros:
+                    candidato = (new_g + otros[next_state], nuevas_acciones + acciones_camino[1 - lado][next_state])
+                    if mejor is None or candidato < mejor:
+                        mejor = candidato
+
+    stats = active_stats()
+    if stats is not None:
+        # Cada lado tiene su propio heap; un estado puede encolarse una vez por lado
+        stats.record(
+            nodes_expanded=estados_explorados,
+            heap_pushes=pushes,
+            heap_pops=pops,
+            duplicate_pushes=pushes - len(costos[0]) - len(costos[1]),
+            peak_frontier=pico_frontera,
+            peak_visited_bytes=container_bytes(*costos, *acciones_camino, *cerrados),
+        )
+    if mejor is None:
+        return None, None, None
+    return estados_explorados, mejor[1], mejor[0]
+
+def bidirectional_a_star_search_1(env, start, goal, verbose=False):
+    grid = compile_grid(env)
+
+    def heuristic(state, goal):
+        return manhattan(state, goal, grid.ncol)
+
+    return _informar(_bidirectional_a_star(grid, start, goal, heuristic, unit_cost=True), verbose)
+
+def bidirectional_a_star_search_2(env, start, goal, verbose=False):
+    grid = compile_grid(env)
+
+    def heuristic(state, goal):
+        return manhattan_ponderada(state, goal, grid.ncol)
+
+    return _informar(_bidirectional_a_star(grid, start, goal, heuristic, unit_cost=False), verbose)
+
+def jump_point_search(env, start, goal, verbose=False):
+    """A* con Jump Point Search para el caso de costo uniforme (escenario 1).
+
+    En grillas de 4 vecinos se usa el orden canónico "primero horizontal":
+    un salto horizontal prueba saltos verticales en cada casillero y uno
+    vertical solo se detiene en el objetivo o ante un vecino forzado (un
+    lateral libre cuyo casillero de atrás está bloqueado). Solo se expanden
+    puntos de salto, que son los que cuenta `estados_explorados`.
+    """
+    grid = compile_grid(env)
+    nrow, ncol, tiles = grid.nrow, grid.ncol, grid.tiles
+    goal_row, goal_col = divmod(goal, ncol)
+
+    def libre(row, col):
+        return 0 <= row < nrow and 0 <= col < ncol and tiles[row * ncol + col] != TILE_HOLE
+
+    def forzado(row, col, dr, dc):
+        return libre(row, col + dc) and not libre(row - dr, col + dc)
+
+    def saltar_vertical(row, col, dr):
+        while True:
+            row += dr
+            if not libre(row, col):
+                return None
+            if (row == goal_row and col == goal_col) or forzado(row, col, dr, -1) or forzado(row, col, dr, 1):
+                return row, col
+
+    def saltar_horizontal(row, col, dc):
+        while True:
+            col += dc
+            if not libre(row, col):
+                return None
+            if row == goal_row and col == goal_col:
+                return row, col
+            if saltar_vertical(row, col, 1) is not None or saltar_vertical(row, col, -1) is not None:
+                return row, col
+
+    def direcciones(row, col, dr, dc):
+        if dr == 0 and dc == 0:
+            return ((0, -1), (1, 0), (0, 1), (-1, 0))
+        if dr == 0:
+            return ((0, dc), (1, 0), (-1, 0))
+        return ((dr, 0),) + tuple((0, lado) for lado in (-1, 1) if forzado(row, col, dr, lado))
+
+    costos = {start: 0}
+    heap = [(manhattan(start, goal, ncol), 0, start, 0, 0)]  # (f, g, estado, dirección de llegada)
+    visited = set()
+    estados_explorados = 0
+    pushes, pops, pico_frontera = 1, 0, 0
+    resultado = None, None, None
+
+    while heap:
+        if len(heap) > pico_frontera:
+            pico_frontera = len(heap)
+        f, g, current_state, dr, dc = heapq.heappop(heap)
+        pops += 1
+        if current_state in visited:
+            continue
+        visited.add(current_state)
+        estados_explorados += 1
+
+        if current_state == goal:
+            # Con costo uniforme, el costo del camino coincide con las acciones
+            resultado = estados_explorados, g, g
+            break
+
+        row, col = divmod(current_state, ncol)
+        for new_dr, new_dc in direcciones(row, col, dr, dc):
+            if new_dr:
+                salto = saltar_vertical(row, col, new_dr)
+            else:
+                salto = saltar_horizontal(row, col, new_dc)
+            if salto is None:
+                continue
+
+            jump_row, jump_col = salto
+            next_state = jump_row * ncol + jump_col
+            new_g = g + abs(jump_row - row) + abs(jump_col - col)
+            if new_g < costos.get(next_state, float('inf')):
+                costos[next_state] = new_g
+                new_f = new_g + manhattan(next_state, goal, ncol)
+                heapq.heappush(heap, (new_f, new_g, next_state, new_dr, new_dc))
+                pushes += 1
+
+    # Solo se cuentan los puntos de salto, no los casilleros recorridos al saltar
+    _registrar_heap(estados_explorados, pushes, pops, pico_frontera, costos, visited)
+    return _informar(resultado, verbose)
 
 def main():
     env, start, goal = deterministic_random_100_environment()
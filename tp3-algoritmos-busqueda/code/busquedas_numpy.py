@@ -0,0 +1,188 @@
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None
+
+from grid_model import ACTION_COSTS, ACTION_DELTAS, move_masks
+from profiling import active_stats, container_bytes
+
+HAS_NUMPY = np is not None
+
+
+def _require_numpy():
+    if np is None:
+        raise ModuleNotFoundError("El backend 'numpy' requiere tener NumPy instalado.")
+
+
+def _moves(grid):
+    """Return ``(offset, cost, valid)`` per action, see ``move_masks``."""
+    masks = move_masks(grid.tiles, grid.nrow, grid.ncol)
+    return [
+        (dr * grid.ncol + dc, ACTION_COSTS[action], masks[action])
+        for action, (dr, dc) in enumerate(ACTION_DELTAS)
+    ]
+
+
+def bfs_numpy(grid, start, goal):
+    """Frontier-at-a-time BFS over a compiled grid.
+
+    Whole BFS layers are expanded at once, so ``estados_explorados`` counts
+    every state up to the goal's layer and ``costo`` is the cheapest path
+    among the ones with the minimum number of actions.
+    """
+    _require_numpy()
+    moves = _moves(grid)
+    sin_costo = np.iinfo(np.int64).max
+
+    visited = np.zeros(grid.n_states, dtype=bool)
+    costos = np.full(grid.n_states, sin_costo, dtype=np.int64)
+    visited[start] = True
+    costos[start] = 0
+
+    frontier = np.array([start], dtype=np.int64)
+    estados_explorados = 1
+    acciones = 0
+    expandidos = pico_frontera = 0
+    resultado = None, None, None
+    while frontier.size:
+        pico_frontera = max(pico_frontera, frontier.size)
+        if visited[goal]:
+            resultado = estados_explorados, acciones, int(costos[goal])
+            break
+        expandidos += frontier.size
+
+        destinos = []
+        for offset, paso, valid in moves:
+            origen = frontier[valid[frontier]]
+            destino = origen + offset
+            nuevos = ~visited[destino]
+            origen, destino = origen[nuevos], destino[nuevos]
+            np.minimum.at(costos, destino, costos[origen] + paso)
+            destinos.append(destino)
+
+        frontier = np.unique(np.concatenate(destinos))
+        visited[frontier] = True
+        estados_explorados += frontier.size
+        acciones += 1
+
+    stats = active_stats()
+    if stats is not None:
+        stats.record(
+            nodes_expanded=int(expandidos),
+            peak_frontier=int(pico_frontera),
+            peak_visited_bytes=container_bytes(visited, costos),
+        )
+    return resultado
+
+
+def uniform_cost_numpy(grid, start, goal):
+    """Bucketed (Dial) Dijkstra over a compiled grid.
+
+    Action costs are small integers, so pending states are kept in a ring of
+    ``max(ACTION_COSTS) + 1`` buckets indexed by path cost and each bucket is
+    settled in one vectorized step. Ties in cost are broken by the number of
+    actions, like ``uniform_cost_search``; ``estados_explorados`` includes the
+    whole bucket where the goal is settled.
+    """
+    _require_numpy()
+    moves = _moves(grid)
+    sin_costo = np.iinfo(np.int64).max
+
+    costos = np.full(grid.n_states, sin_costo, dtype=np.int64)
+    acciones = np.full(grid.n_states, sin_costo, dtype=np.int64)
+    costos[start] = 0
+    acciones[start] = 0
+
+    n_buckets = max(ACTION_COSTS) + 1
+    buckets = [[] for _ in range(n_buckets)]
+    buckets[0].append(np.array([start], dtype=np.int64))
+    pendientes = 1
+    estados_explorados = 0
+    costo = 0
+    # Los buckets hacen de heap: se cuentan estados encolados y desencolados
+    pushes, pops, en_cola, pico_frontera = 1, 0, 1, 1
+    resultado = None, None, None
+
+    while pendientes:
+        bucket = buckets[costo % n_buckets]
+        if bucket:
+            pendientes -= len(bucket)
+            nodos = np.concatenate(bucket)
+            bucket.clear()
+            pops += nodos.size
+            en_cola -= nodos.size
+            nodos = np.unique(nodos)
+            # Descartar entradas viejas que luego se mejoraron (borrado perezoso)
+            nodos = nodos[costos[nodos] == costo]
+            estados_explorados += nodos.size
+
+            if costos[goal] == costo:
+                resultado = estados_explorados, int(acciones[goal]), costo
+                break
+
+            for offset, paso, valid in moves:
+                origen = nodos[valid[nodos]]
+                destino = origen + offset
+                nuevo_costo = costo + paso
+                previo = costos[destino]
+
+                mejora = nuevo_costo < previo
+                mejorados = destino[mejora]
+                costos[mejorados] = nuevo_costo
+                acciones[mejorados] = sin_costo
+
+                empate = nuevo_costo <= previo
+                np.minimum.at(acciones, destino[empate], acciones[origen[empate]] + 1)
+
+                if mejorados.size:
+                    buckets[nuevo_costo % n_buckets].append(mejorados)
+                    pendientes += 1
+                    pushes += mejorados.size
+                    en_cola += mejorados.size
+            pico_frontera = max(pico_frontera, en_cola)
+        costo += 1
+
+    stats = active_stats()
+    if stats is not None:
+        stats.record(
+            nodes_expanded=int(estados_explorados),
+            heap_pushes=int(pushes),
+            heap_pops=int(pops),
+            duplicate_pushes=int(pushes - np.count_nonzero(costos != sin_costo)),
+            peak_frontier=int(pico_frontera),
+            peak_visited_bytes=container_bytes(costos, acciones),
+        )
+    return resultado
+
+
+def random_walks_numpy(stepper, start, walkers, max_steps, seed=None):
+    """Simulate ``walkers`` independent uniform random walks from ``start``.
+
+    ``stepper`` must provide ``step_batch`` (see ``FastFrozenLakeEnv``); every
+    walker stops when it reaches the goal, falls into a hole or takes
+    ``max_steps`` actions, exactly like one call to ``random_search``.
+    Returns ``(exitos, acciones, costos)`` arrays with one entry per walker.
+    """
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    costo_accion = np.array(ACTION_COSTS, dtype=np.int64)
+
+    estados = np.full(walkers, start, dtype=np.int64)
+    activos = np.arange(walkers)
+    exitos = np.zeros(walkers, dtype=bool)
+    acciones = np.zeros(walkers, dtype=np.int64)
+    costos = np.zeros(walkers, dtype=np.int64)
+
+    for _ in range(max_steps):
+        if not activos.size:
+            break
+        elegidas = rng.integers(0, len(ACTION_COSTS), size=activos.size)
+        siguientes, recompensas, terminados = stepper.step_batch(estados[activos], elegidas)
+
+        estados[activos] = siguientes
+        acciones[activos] += 1
+        costos[activos] += costo_accion[elegidas]
+        exitos[activos[recompensas == 1.0]] = True
+        activos = activos[~terminados]
+
+    return exitos, acciones, costos
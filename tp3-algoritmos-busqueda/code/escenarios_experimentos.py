@@ -1,22 +1,31 @@
 import csv
 import json
+import math
 import os
+import random
 import statistics
-import time
 from collections import defaultdict
 from pathlib import Path
 
 from busquedas import (
-    deterministic_random_100_environment,
     random_search,
+    random_search_walkers,
     bfs_search,
     dfs_search,
     limited_dfs_search,
+    iterative_deepening_search,
     uniform_cost_search,
     a_star_search_1,
     a_star_search_2,
+    bidirectional_bfs_search,
+    bidirectional_a_star_search_1,
+    bidirectional_a_star_search_2,
+    jump_point_search,
 )
-from random_map import SimpleFrozenLakeEnv, gym
+from busquedas_numpy import HAS_NUMPY
+from experiment_pool import PROFILE, SEED, WORKERS, run_jobs
+from profiling import COLUMNS as PROFILE_COLUMNS, SearchStats
+from random_map import FastFrozenLakeEnv, gym
 
 try:
     from gymnasium import wrappers
@@ -26,14 +35,31 @@ except ModuleNotFoundError:  # Gymnasium no disponible en algunos entornos
 
 TOTAL_RUNS = int(os.environ.get("RUN_TOTAL", 30))
 DFS_LIMITS = [50, 75, 100]
+# Caminatas por mapa de la versión Monte Carlo de la búsqueda aleatoria
+RANDOM_WALKERS = int(os.environ.get("RUN_WALKERS", 1000))
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 OUTPUT_CSV = BASE_DIR / "resultados_escenarios.csv"
 STATS_JSON = BASE_DIR / "estadisticas_escenarios.json"
 IMAGES_DIR = BASE_DIR / "images"
 
+
+def _random_monte_carlo(env, start, goal):
+    """Promedios de las caminatas exitosas y cantidad de éxitos sobre RANDOM_WALKERS."""
+    # La semilla sale de `random`, que el pool ya sembró para este trabajo
+    exitos, acciones, costos = random_search_walkers(
+        env, start, goal, walkers=RANDOM_WALKERS, seed=random.getrandbits(32)
+    )
+    n_exitos = int(exitos.sum())
+    if not n_exitos:
+        return None, None, None, 0
+    mean_actions = float(acciones[exitos].mean())
+    return mean_actions + 1, mean_actions, float(costos[exitos].mean()), n_exitos
+
+
 ALGORITHMS = [
     ("RANDOM", lambda env, start, goal: random_search(env, start, goal, verbose=False), {1, 2}),
+    *((("RANDOM-MC", _random_monte_carlo, {1, 2}),) if HAS_NUMPY else ()),
     ("BFS", bfs_search, {1, 2}),
     ("DFS", dfs_search, {1, 2}),
     *(
@@ -44,20 +70,37 @@ ALGORITHMS = [
         )
         for limit in DFS_LIMITS
     ),
+    ("IDDFS", iterative_deepening_search, {1, 2}),
     ("UCS", uniform_cost_search, {1, 2}),
+    *(
+        (
+            ("BFS-NP", lambda env, start, goal: bfs_search(env, start, goal, backend="numpy"), {1, 2}),
+            ("UCS-NP", lambda env, start, goal: uniform_cost_search(env, start, goal, backend="numpy"), {1, 2}),
+        )
+        if HAS_NUMPY
+        else ()
+    ),
     ("A1", a_star_search_1, {1}),
     ("A2", a_star_search_2, {2}),
+    ("BiBFS", bidirectional_bfs_search, {1, 2}),
+    ("BiA1", bidirectional_a_star_search_1, {1}),
+    ("BiA2", bidirectional_a_star_search_2, {2}),
+    ("JPS", jump_point_search, {1}),
 ]
 
 
-def _build_env(desc_rows, start_idx, goal_idx):
+def _build_env(desc_rows, start_idx, goal_idx, grid=None):
     if gym is not None:
-        env = gym.make("FrozenLake-v1", desc=desc_rows).env
+        env = gym.make("FrozenLake-v1", desc=desc_rows, is_slippery=False).env
         if wrappers is not None:
             env = wrappers.TimeLimit(env, 1000)
-        return env
+    else:
+        env = FastFrozenLakeEnv(desc_rows, start_idx, goal_idx, max_steps=1000)
 
-    return SimpleFrozenLakeEnv(desc_rows, start_idx, goal_idx, max_steps=1000)
+    if grid is not None:
+        # Reutilizar el mapa compilado en lugar de recompilarlo por algoritmo
+        env.unwrapped.grid_model = grid
+    return env
 
 
 def _extract_desc_rows(env):
@@ -96,6 +139,16 @@ def _quartiles(values):
     return min(sorted_vals), q1, median, q3, max(sorted_vals)
 
 
+def _wilson_interval(successes, trials, z=1.96):
+    if not trials:
+        return None, None
+    p = successes / trials
+    denom = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denom
+    half = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
 def _create_boxplot(data, title, xlabel, output_path):
     cleaned = [(name, [v for v in series if v is not None]) for name, series in data.items()]
     cleaned = [(name, series) for name, series in cleaned if series]
@@ -171,58 +224,55 @@ def main():
         2: {"states": defaultdict(list), "actions": defaultdict(list), "cost": defaultdict(list), "time": defaultdict(list)},
     }
 
-    for env_idx in range(1, TOTAL_RUNS + 1):
-        env, start, goal = deterministic_random_100_environment()
-        desc_rows = _extract_desc_rows(env)
-
-        for name, func, scenarios in ALGORITHMS:
-            env_instance = _build_env(desc_rows, start, goal)
-            start_time = time.perf_counter()
-            try:
-                result = func(env_instance, start, goal)
-            except Exception as exc:
-                print(f"[{name}] Error durante la ejecución en entorno {env_idx}: {exc}")
-                result = (None, None, None)
-            elapsed = time.perf_counter() - start_time
-
-            states, actions, cost = result if result else (None, None, None)
-            success = all(value is not None for value in (states, actions, cost))
-
-            if 1 in scenarios:
-                scenario_rows = {
-                    "env": env_idx,
-                    "algorithm": name,
-                    "scenario": 1,
-                    "states_explored": states if success else None,
-                    "actions_taken": actions if success else None,
-                    "total_cost": actions if success else None,
-                    "time_seconds": elapsed,
-                    "solution_found": success,
-                }
-                rows.append(scenario_rows)
-                if success:
-                    scenario_metrics[1]["states"][name].append(states)
-                    scenario_metrics[1]["actions"][name].append(actions)
-                    scenario_metrics[1]["cost"][name].append(actions)
-                scenario_metrics[1]["time"][name].append(elapsed)
-
-            if 2 in scenarios:
-                scenario_rows = {
-                    "env": env_idx,
-                    "algorithm": name,
-                    "scenario": 2,
-                    "states_explored": states if success else None,
-                    "actions_taken": actions if success else None,
-                    "total_cost": cost if success else None,
-                    "time_seconds": elapsed,
-                    "solution_found": success,
-                }
-                rows.append(scenario_rows)
-                if success:
-                    scenario_metrics[2]["states"][name].append(states)
-                    scenario_metrics[2]["actions"][name].append(actions)
-                    scenario_metrics[2]["cost"][name].append(cost)
-                scenario_metrics[2]["time"][name].append(elapsed)
+    algorithm_scenarios = {name: scenarios for name, _, scenarios in ALGORITHMS}
+    walker_successes = []
+
+    for env_idx, name, result, elapsed, profile in run_jobs(__name__, TOTAL_RUNS, WORKERS, SEED):
+        scenarios = algorithm_scenarios[name]
+        profile_columns = (profile or SearchStats()).as_row() if PROFILE else {}
+        states, actions, cost = result[:3] if result else (None, None, None)
+        if name == "RANDOM-MC":
+            # Los mapas descartados por no tener camino cuentan como 0 éxitos
+            walker_successes.append(result[3] if len(result) > 3 else 0)
+        success = all(value is not None for value in (states, actions, cost))
+
+        if 1 in scenarios:
+            scenario_rows = {
+                "env": env_idx,
+                "algorithm": name,
+                "scenario": 1,
+                "states_explored": states if success else None,
+                "actions_taken": actions if success else None,
+                "total_cost": actions if success else None,
+                "time_seconds": elapsed,
+                "solution_found": success,
+                **profile_columns,
+            }
+            rows.append(scenario_rows)
+            if success:
+                scenario_metrics[1]["states"][name].append(states)
+                scenario_metrics[1]["actions"][name].append(actions)
+                scenario_metrics[1]["cost"][name].append(actions)
+            scenario_metrics[1]["time"][name].append(elapsed)
+
+        if 2 in scenarios:
+            scenario_rows = {
+                "env": env_idx,
+                "algorithm": name,
+                "scenario": 2,
+                "states_explored": states if success else None,
+                "actions_taken": actions if success else None,
+                "total_cost": cost if success else None,
+                "time_seconds": elapsed,
+                "solution_found": success,
+                **profile_columns,
+            }
+            rows.append(scenario_rows)
+            if success:
+                scenario_metrics[2]["states"][name].append(states)
+                scenario_metrics[2]["actions"][name].append(actions)
+                scenario_metrics[2]["cost"][name].append(cost)
+            scenario_metrics[2]["time"][name].append(elapsed)
 
     with OUTPUT_CSV.open("w", newline="", encoding="utf-8") as csv_file:
         writer = csv.DictWriter(
@@ -236,6 +286,7 @@ def main():
                 "total_cost",
                 "time_seconds",
                 "solution_found",
+                *(PROFILE_COLUMNS if PROFILE else ()),
             ],
         )
         writer.writeheader()
@@ -260,6 +311,16 @@ def main():
                         "n": len(values),
                     }
 
+    if walker_successes:
+        trials = RANDOM_WALKERS * len(walker_successes)
+        low, high = _wilson_interval(sum(walker_successes), trials)
+        stats_output["random_walkers"] = {
+            "maps": len(walker_successes),
+            "walkers_per_map": RANDOM_WALKERS,
+            "success_rate": sum(walker_successes) / trials,
+            "ci95": [low, high],
+        }
+
     STATS_JSON.write_text(json.dumps(stats_output, indent=2), encoding="utf-8")
 
     IMAGES_DIR.mkdir(parents=True, exist_ok=True)
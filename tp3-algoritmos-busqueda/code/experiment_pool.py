@@ -0,0 +1,158 @@
+"""Ejecución de los experimentos de tp3 repartida en un pool de procesos.
+
+Cada trabajo es un par (mapa, algoritmo). Los mapas y los trabajos usan
+semillas derivadas de `RUN_SEED`, y los resultados se devuelven en el orden
+de los trabajos, así que el CSV y el JSON no dependen de la cantidad de
+procesos (salvo por los tiempos medidos).
+
+Antes de correr un algoritmo se consulta la caché de `map_cache`: si el
+objetivo no es alcanzable desde el inicio, ningún algoritmo puede encontrar
+camino y el trabajo se resuelve sin construir el entorno.
+
+Los mapas se leen de un corpus de `map_corpus.py` (100x100, hielo 0.92, la
+semilla de la corrida). El corpus por defecto vive en `corpus/seed-<semilla>`
+y se genera la primera vez que hace falta, o se regenera si tiene menos mapas
+que los pedidos. `RUN_CORPUS` lo reemplaza: una ruta usa ese corpus (y lo
+genera si no existe) y un valor vacío genera cada mapa al vuelo con
+`deterministic_random_100_environment`, igual que sin NumPy. Con
+`RUN_PROFILE=1` cada trabajo corre dentro de `profiling.collecting()` y
+devuelve además su `SearchStats`.
+"""
+
+import importlib
+import os
+import random
+import time
+from multiprocessing import Pool
+from pathlib import Path
+
+from busquedas import deterministic_random_100_environment
+from grid_model import CompiledGrid, compile_grid
+from map_cache import map_info
+from profiling import collecting
+from random_map import np
+
+WORKERS = int(os.environ.get("RUN_WORKERS", os.cpu_count() or 1))
+SEED = int(os.environ.get("RUN_SEED", 0))
+CORPUS = os.environ.get("RUN_CORPUS")
+CORPUS_DIR = Path(__file__).resolve().parent / "corpus"
+CORPUS_SIZE = 100
+CORPUS_FROZEN_PROB = 0.92
+PROFILE = os.environ.get("RUN_PROFILE", "0") == "1"
+
+# Último mapa usado por este proceso: los trabajos de un mismo mapa llegan juntos
+_mapa_actual = {}
+_corpus_abiertos = {}
+
+
+def derive_seed(*parts):
+    """Entero de 32 bits determinista a partir de las partes dadas."""
+    return random.Random(":".join(str(part) for part in parts)).getrandbits(32)
+
+
+def _abrir_corpus(path):
+    if path not in _corpus_abiertos:
+        from map_corpus import MapCorpus
+
+        _corpus_abiertos[path] = MapCorpus(path)
+    return _corpus_abiertos[path]
+
+
+def resolve_corpus(corpus, total_runs, seed):
+    """Ruta del corpus con al menos `total_runs` mapas, o None para generarlos al vuelo.
+
+    Con `corpus` None se usa (y si hace falta se genera) el corpus por defecto
+    de la semilla; con "" no se usa corpus. Una ruta explícita se genera si no
+    existe, pero nunca se sobrescribe: si le faltan mapas es un error.
+    """
+    if corpus == "" or (corpus is None and np is None):
+        return None
+    from map_corpus import write_corpus
+
+    explicito = corpus is not None
+    path = Path(corpus) if explicito else CORPUS_DIR / f"seed-{seed}"
+    if (path / "meta.json").exists():
+        if len(_abrir_corpus(str(path))) >= total_runs:
+            return str(path)
+        if explicito:
+            raise ValueError(f"El corpus {path} tiene menos de {total_runs} mapas.")
+        del _corpus_abiertos[str(path)]
+
+    print(f"Generando corpus de {total_runs} mapas en {path}...")
+    _corpus_abiertos[str(path)] = write_corpus(path, total_runs, CORPUS_SIZE, CORPUS_FROZEN_PROB, seed)
+    return str(path)
+
+
+def _cargar_mapa(module, seed, env_idx, corpus):
+    key = (module.__name__, seed, env_idx, corpus)
+    if key not in _mapa_actual:
+        if corpus is not None:
+            desc_rows, start, goal = _abrir_corpus(corpus).read(env_idx - 1)
+            grid = CompiledGrid([row.encode("ascii") for row in desc_rows])
+        else:
+            env, start, goal = deterministic_random_100_environment(derive_seed(seed, env_idx))
+            desc_rows, grid = module._extract_desc_rows(env), compile_grid(env)
+        map_info(grid)  # huecos y componentes, fuera del tiempo medido de los algoritmos
+        _mapa_actual.clear()
+        _mapa_actual[key] = (desc_rows, start, goal, grid)
+    return _mapa_actual[key]
+
+
+def _run_job(job):
+    module_name, seed, env_idx, alg_idx, corpus, profile = job
+    module = importlib.import_module(module_name)
+    desc_rows, start, goal, grid = _cargar_mapa(module, seed, env_idx, corpus)
+    name, func, _ = module.ALGORITHMS[alg_idx]
+
+    start_time = time.perf_counter()
+    if not map_info(grid).reachable(start, goal):
+        return env_idx, name, (None, None, None), time.perf_counter() - start_time, None
+
+    env_instance = module._build_env(desc_rows, start, goal, grid)
+    job_seed = derive_seed(seed, env_idx, name)
+    random.seed(job_seed)
+    action_space = getattr(env_instance, "action_space", None)
+    if hasattr(action_space, "seed"):
+        action_space.seed(job_seed)
+
+    stats = None
+    start_time = time.perf_counter()
+    try:
+        if profile:
+            with collecting() as stats:
+                result = func(env_instance, start, goal)
+        else:
+            result = func(env_instance, start, goal)
+    except Exception as exc:
+        print(f"[{name}] Error durante la ejecución en entorno {env_idx}: {exc}")
+        result = (None, None, None)
+    elapsed = time.perf_counter() - start_time
+
+    return env_idx, name, result, elapsed, stats
+
+
+def run_jobs(module_name, total_runs, workers=WORKERS, seed=SEED, corpus=CORPUS, profile=PROFILE):
+    """Ejecuta `ALGORITHMS` de `module_name` sobre `total_runs` mapas.
+
+    El módulo debe exponer `ALGORITHMS`, `_build_env` y `_extract_desc_rows`;
+    los algoritmos se mandan a los procesos por índice porque las lambdas no
+    se pueden serializar. Devuelve una lista de
+    (env_idx, algoritmo, resultado, segundos, stats) ordenada por mapa y
+    algoritmo, donde stats es un `SearchStats` si `profile` está activo y
+    None en otro caso. `corpus` se interpreta como en `resolve_corpus`.
+    """
+    n_algorithms = len(importlib.import_module(module_name).ALGORITHMS)
+    corpus = resolve_corpus(corpus, total_runs, seed)
+
+    jobs = [
+        (module_name, seed, env_idx, alg_idx, corpus, profile)
+        for env_idx in range(1, total_runs + 1)
+        for alg_idx in range(n_algorithms)
+    ]
+
+    if workers <= 1:
+        return [_run_job(job) for job in jobs]
+
+    # Un chunk por mapa: cada proceso genera y compila el mapa una sola vez
+    with Pool(processes=workers) as pool:
+        return list(pool.imap(_run_job, jobs, chunksize=n_algorithms))
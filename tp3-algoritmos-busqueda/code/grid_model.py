@@ -0,0 +1,177 @@
+from array import array
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None
+
+# Códigos de casillero del mapa compilado (un byte por celda).
+TILE_FROZEN = 0
+TILE_HOLE = 1
+TILE_START = 2
+TILE_GOAL = 3
+
+_TILE_TABLE = bytes.maketrans(b"FHSG", bytes((TILE_FROZEN, TILE_HOLE, TILE_START, TILE_GOAL)))
+
+# Mismo orden de acciones que FrozenLake: Left, Down, Right, Up.
+ACTION_DELTAS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+ACTION_COSTS = (1, 10, 1, 10)
+
+
+class CompiledGrid:
+    """Deterministic FrozenLake map compiled into flat arrays.
+
+    ``tiles`` holds one tile code per cell. Edges are stored CSR-style: the
+    neighbours of state ``s`` are ``indices[indptr[s]:indptr[s + 1]]`` with the
+    action taken in ``actions`` and its cost in ``costs``. Moves into holes and
+    moves that bump into the border are dropped, and edges keep the action
+    order used by ``env.step`` so searches explore states in the same order.
+    """
+
+    __slots__ = ("nrow", "ncol", "tiles", "indptr", "indices", "actions", "costs")
+
+    def __init__(self, rows):
+        self.nrow = len(rows)
+        self.ncol = len(rows[0]) if rows else 0
+        self.tiles = bytearray(b"".join(rows).translate(_TILE_TABLE))
+
+        if np is not None:
+            self.indptr, self.indices, self.actions, self.costs = _build_edges_numpy(
+                self.tiles, self.nrow, self.ncol
+            )
+        else:
+            self.indptr, self.indices, self.actions, self.costs = _build_edges(
+                self.tiles, self.nrow, self.ncol
+            )
+
+    @property
+    def n_states(self):
+        return self.nrow * self.ncol
+
+    def is_hole(self, state):
+        return self.tiles[state] == TILE_HOLE
+
+    def neighbors(self, state):
+        """Return ``(next_state, action, cost)`` tuples reachable from ``state``."""
+        lo, hi = self.indptr[state], self.indptr[state + 1]
+        return list(zip(self.indices[lo:hi], self.actions[lo:hi], self.costs[lo:hi]))
+
+
+def _build_edges(tiles, nrow, ncol):
+    indptr = array("i", [0])
+    indices = array("i")
+    actions = bytearray()
+    costs = bytearray()
+
+    append_edge = indices.append
+    append_action = actions.append
+    append_cost = costs.append
+    for row in range(nrow):
+        base = row * ncol
+        for col in range(ncol):
+            state = base + col
+            if tiles[state] != TILE_HOLE:
+                # Left, Down, Right, Up (ver ACTION_DELTAS)
+                if col > 0 and tiles[state - 1] != TILE_HOLE:
+                    append_edge(state - 1)
+                    append_action(0)
+                    append_cost(ACTION_COSTS[0])
+                if row < nrow - 1 and tiles[state + ncol] != TILE_HOLE:
+                    append_edge(state + ncol)
+                    append_action(1)
+                    append_cost(ACTION_COSTS[1])
+                if col < ncol - 1 and tiles[state + 1] != TILE_HOLE:
+                    append_edge(state + 1)
+                    append_action(2)
+                    append_cost(ACTION_COSTS[2])
+                if row > 0 and tiles[state - ncol] != TILE_HOLE:
+                    append_edge(state - ncol)
+                    append_action(3)
+                    append_cost(ACTION_COSTS[3])
+            indptr.append(len(indices))
+
+    return indptr, indices, actions, costs
+
+
+def move_masks(tiles, nrow, ncol):
+    """Return, per action, a flat boolean mask of the states whose move is valid.
+
+    A move is valid when it starts on a non-hole cell and lands on a non-hole
+    cell inside the board. Requires NumPy.
+    """
+    passable = (np.frombuffer(tiles, dtype=np.int8) != TILE_HOLE).reshape(nrow, ncol)
+
+    masks = []
+    for dr, dc in ACTION_DELTAS:
+        valid = np.zeros((nrow, ncol), dtype=bool)
+        r0, r1 = max(0, -dr), nrow - max(0, dr)
+        c0, c1 = max(0, -dc), ncol - max(0, dc)
+        valid[r0:r1, c0:c1] = passable[r0:r1, c0:c1] & passable[r0 + dr:r1 + dr, c0 + dc:c1 + dc]
+        masks.append(valid.ravel())
+    return masks
+
+
+def _build_edges_numpy(tiles, nrow, ncol):
+    valid = np.stack(move_masks(tiles, nrow, ncol), axis=1)
+    offsets = np.array([dr * ncol + dc for dr, dc in ACTION_DELTAS], dtype=np.int32)
+    targets = np.arange(nrow * ncol, dtype=np.int32)[:, None] + offsets
+
+    # Recorrer la máscara por filas conserva el orden de acciones de cada estado
+    edge_actions = np.nonzero(valid)[1].astype(np.uint8)
+    counts = np.concatenate(([0], np.cumsum(valid.sum(axis=1), dtype=np.int32)))
+
+    indptr = array("i")
+    indptr.frombytes(counts.astype(np.int32).tobytes())
+    indices = array("i")
+    indices.frombytes(targets[valid].astype(np.int32).tobytes())
+    actions = bytearray(edge_actions.tobytes())
+    costs = bytearray(np.array(ACTION_COSTS, dtype=np.uint8)[edge_actions].tobytes())
+    return indptr, indices, actions, costs
+
+
+def read_desc_rows(env):
+    """Return the map behind ``env`` as a list of ``bytes`` rows (b"SFFH...")."""
+    base = getattr(env, "unwrapped", env)
+    desc = getattr(base, "desc", None)
+    if desc is None:
+        raise ValueError("El entorno no expone la descripción del mapa.")
+
+    flat = desc.flatten()
+    # El desc de Gymnasium es un arreglo NumPy de tipo "S1"; el de SimpleFrozenLakeEnv, una lista de bytes
+    flat = flat.tobytes() if hasattr(flat, "tobytes") else b"".join(flat)
+    ncol = base.ncol
+    return [flat[start:start + ncol] for start in range(0, len(flat), ncol)]
+
+
+def is_slippery(env):
+    """Tell whether ``env`` has stochastic moves (FrozenLake's ``is_slippery``).
+
+    Gymnasium's FrozenLakeEnv does not keep the flag, so its transition table
+    ``P`` is checked too: a slippery move has more than one outcome.
+    """
+    base = getattr(env, "unwrapped", env)
+    if getattr(base, "is_slippery", False):
+        return True
+    transitions = getattr(base, "P", None)
+    if not transitions:
+        return False
+    return any(len(outcomes) > 1 for actions in transitions.values() for outcomes in actions.values())
+
+
+def compile_grid(env):
+    """Compile the map behind ``env`` once and cache it on the unwrapped env.
+
+    The compiled graph assumes deterministic moves, so slippery environments
+    are rejected: create them with ``is_slippery=False``.
+    """
+    if isinstance(env, CompiledGrid):
+        return env
+
+    base = getattr(env, "unwrapped", env)
+    grid = getattr(base, "grid_model", None)
+    if grid is None:
+        if is_slippery(base):
+            raise ValueError("El entorno es resbaladizo (is_slippery=True); las búsquedas asumen movimientos deterministas.")
+        grid = CompiledGrid(read_desc_rows(env))
+        base.grid_model = grid
+    return grid
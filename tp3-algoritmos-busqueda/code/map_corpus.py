@@ -0,0 +1,98 @@
+"""Corpus binario de mapas FrozenLake para los experimentos de tp3.
+
+Un corpus es un directorio con:
+    - holes.npy: máscaras de huecos empaquetadas en bits, forma (mapas, size, ceil(size / 8)).
+    - endpoints.npy: índices (inicio, objetivo) de cada mapa, forma (mapas, 2).
+    - meta.json: tamaño, probabilidad de hielo y semilla usados al generarlo.
+
+Los .npy se abren con memory-mapping, así que leer un mapa solo toca sus
+páginas en disco. Cada mapa usa una semilla hija de `SeedSequence(seed)`,
+por lo que puede regenerarse de forma independiente.
+"""
+
+import json
+from pathlib import Path
+
+from random_map import map_rows, np, random_map_arrays
+
+
+def _require_numpy():
+    if np is None:
+        raise ModuleNotFoundError("El corpus de mapas requiere tener NumPy instalado.")
+
+
+def write_corpus(path, n_maps, size, frozen_prob, seed=0):
+    """Genera `n_maps` mapas y los escribe en el directorio `path`."""
+    _require_numpy()
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    holes = np.lib.format.open_memmap(
+        path / "holes.npy", mode="w+", dtype=np.uint8, shape=(n_maps, size, (size + 7) // 8)
+    )
+    endpoints = np.lib.format.open_memmap(path / "endpoints.npy", mode="w+", dtype=np.int64, shape=(n_maps, 2))
+    for idx, child_seed in enumerate(np.random.SeedSequence(seed).spawn(n_maps)):
+        mask, start, goal = random_map_arrays(size, frozen_prob, np.random.default_rng(child_seed))
+        holes[idx] = np.packbits(mask, axis=-1)
+        endpoints[idx] = start, goal
+    holes.flush()
+    endpoints.flush()
+    del holes, endpoints
+
+    meta = {"maps": n_maps, "size": size, "frozen_prob": frozen_prob, "seed": seed}
+    (path / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    return MapCorpus(path)
+
+
+class MapCorpus:
+    """Read-only, memory-mapped view of a corpus written by ``write_corpus``."""
+
+    def __init__(self, path):
+        _require_numpy()
+        path = Path(path)
+        meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        self.path = path
+        self.size = meta["size"]
+        self.frozen_prob = meta["frozen_prob"]
+        self.seed = meta["seed"]
+        self._holes = np.load(path / "holes.npy", mmap_mode="r")
+        self._endpoints = np.load(path / "endpoints.npy", mmap_mode="r")
+
+    def __len__(self):
+        return len(self._endpoints)
+
+    def holes(self, idx):
+        """Return the ``(size, size)`` boolean hole mask of map ``idx``."""
+        return np.unpackbits(self._holes[idx], axis=-1, count=self.size).astype(bool)
+
+    def endpoints(self, idx):
+        start, goal = self._endpoints[idx]
+        return int(start), int(goal)
+
+    def read(self, idx):
+        """Return ``(desc_rows, start, goal)`` for map ``idx``."""
+        start, goal = self.endpoints(idx)
+        return map_rows(self.holes(idx), start, goal), start, goal
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self.read(idx)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Genera un corpus binario de mapas FrozenLake.")
+    parser.add_argument("path", help="Directorio de salida del corpus.")
+    parser.add_argument("--maps", type=int, default=30, help="Cantidad de mapas.")
+    parser.add_argument("--size", type=int, default=100, help="Lado de cada mapa.")
+    parser.add_argument("--frozen-prob", type=float, default=0.92, help="Probabilidad de casillero de hielo.")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla raíz del corpus.")
+    opciones = parser.parse_args()
+
+    corpus = write_corpus(opciones.path, opciones.maps, opciones.size, opciones.frozen_prob, opciones.seed)
+    print(f"Corpus con {len(corpus)} mapas de {corpus.size}x{corpus.size} guardado en {corpus.path}")
+
+
+if __name__ == "__main__":
+    main()
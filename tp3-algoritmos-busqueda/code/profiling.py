@@ -0,0 +1,83 @@
+"""Instrumentación opcional de las búsquedas de tp3.
+
+Las búsquedas consultan `active_stats()` una vez al empezar: si no hay un
+`SearchStats` activo no registran nada. Los contadores se llevan en variables
+locales y se vuelcan al final, así que el camino caliente no cambia cuando la
+instrumentación está apagada.
+
+    with collecting() as stats:
+        uniform_cost_search(env, start, goal)
+    print(stats.heap_pushes, stats.duplicate_pushes)
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from typing import Optional
+
+
+@dataclass
+class SearchStats:
+    """Métricas de una ejecución; None significa que el algoritmo no las mide."""
+
+    nodes_expanded: Optional[int] = None
+    heap_pushes: Optional[int] = None
+    heap_pops: Optional[int] = None
+    duplicate_pushes: Optional[int] = None
+    peak_frontier: Optional[int] = None
+    peak_visited_bytes: Optional[int] = None
+    step_calls: Optional[int] = None
+    step_seconds: Optional[float] = None
+
+    def record(self, **valores) -> None:
+        for nombre, valor in valores.items():
+            setattr(self, nombre, valor)
+
+    def timed_step(self, step):
+        """Envuelve `env.step` para acumular llamadas y tiempo dentro del entorno."""
+        self.step_calls = self.step_calls or 0
+        self.step_seconds = self.step_seconds or 0.0
+        perf_counter = time.perf_counter
+
+        def medido(action):
+            inicio = perf_counter()
+            try:
+                return step(action)
+            finally:
+                self.step_seconds += perf_counter() - inicio
+                self.step_calls += 1
+
+        return medido
+
+    def as_row(self) -> dict:
+        """Valores listos para un csv.DictWriter (vacío si no se midió)."""
+        return {campo: ("" if valor is None else valor) for campo, valor in vars(self).items()}
+
+
+COLUMNS = tuple(campo.name for campo in fields(SearchStats))
+
+_activo: Optional[SearchStats] = None
+
+
+def active_stats() -> Optional[SearchStats]:
+    return _activo
+
+
+@contextmanager
+def collecting():
+    """Activa un SearchStats nuevo mientras dura el bloque."""
+    global _activo
+    previo, stats = _activo, SearchStats()
+    _activo = stats
+    try:
+        yield stats
+    finally:
+        _activo = previo
+
+
+def container_bytes(*contenedores) -> int:
+    """Memoria de los contenedores en sí (sin contar los objetos que guardan)."""
+    return sum(sys.getsizeof(contenedor) for contenedor in contenedores)
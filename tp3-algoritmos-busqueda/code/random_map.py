@@ -1,8 +1,16 @@
+import random
+from array import array
+
 try:
     import gymnasium as gym
 except ModuleNotFoundError:
     gym = None
 
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None
+
 
 class _ActionSpace:
     """Minimal action space replicating Gym's interface."""
@@ -11,8 +19,6 @@ class _ActionSpace:
         self.n = n
 
     def sample(self):
-        import random
-
         return random.randrange(self.n)
 
 
@@ -99,17 +105,144 @@ class SimpleFrozenLakeEnv:
         return next_state, reward, terminated, truncated, {}
 
 
-def generate_random_map_custom(size, frozen_prob):
+# Tipo de casillero de llegada en FastFrozenLakeEnv
+_KIND_SAFE = 0
+_KIND_HOLE = 1
+_KIND_GOAL = 2
+
+
+def _next_state_table(nrow, ncol):
+    deltas = [SimpleFrozenLakeEnv._action_map[action] for action in range(4)]
+    table = array('i')
+    if np is not None:
+        rows, cols = np.divmod(np.arange(nrow * ncol), ncol)
+        next_states = np.empty((nrow * ncol, 4), dtype=np.int32)
+        for action, (dr, dc) in enumerate(deltas):
+            next_states[:, action] = np.clip(rows + dr, 0, nrow - 1) * ncol + np.clip(cols + dc, 0, ncol - 1)
+        table.frombytes(next_states.tobytes())
+        return table
+
+    for row in range(nrow):
+        for col in range(ncol):
+            for dr, dc in deltas:
+                table.append(min(max(row + dr, 0), nrow - 1) * ncol + min(max(col + dc, 0), ncol - 1))
+    return table
+
+
+class FastFrozenLakeEnv:
+    """Array-backed drop-in replacement for SimpleFrozenLakeEnv.
+
+    The kind of every tile lives in a bytearray and the next state of every
+    (state, action) pair is precomputed, so ``step`` is two table lookups.
+    ``step_batch`` advances many independent agents at once.
+    """
+
+    __slots__ = (
+        "_desc_rows", "nrow", "ncol", "start_state", "goal_state", "max_steps",
+        "action_space", "desc", "grid_model", "_kind", "_next", "_np_tables",
+        "_s", "steps", "done",
+    )
+
+    def __init__(self, desc_rows, start_idx, goal_idx, max_steps=1000):
+        self._desc_rows = list(desc_rows)
+        self.nrow = len(desc_rows)
+        self.ncol = len(desc_rows[0]) if desc_rows else 0
+        self.start_state = start_idx
+        self.goal_state = goal_idx
+        self.max_steps = max_steps
+
+        self.action_space = _ActionSpace(4)
+        self.desc = _DescWrapper(desc_rows)
+        self.grid_model = None
+        self._np_tables = None
+
+        flat = ''.join(self._desc_rows).encode('ascii')
+        self._kind = bytearray(flat.translate(bytes.maketrans(b'FSHG', bytes((_KIND_SAFE, _KIND_SAFE, _KIND_HOLE, _KIND_GOAL)))))
+
+        # _next[state * 4 + action]: estado siguiente, quedándose en el borde como SimpleFrozenLakeEnv
+        self._next = _next_state_table(self.nrow, self.ncol)
+
+        self._s = start_idx
+        self.steps = 0
+        self.done = False
+
+    @property
+    def unwrapped(self):
+        return self
+
+    @property
+    def s(self):
+        return self._s
+
+    @s.setter
+    def s(self, value):
+        self._s = value
+        self.steps = 0
+        self.done = False
+
+    def clone(self):
+        """Return an independent environment with the same configuration."""
+        return FastFrozenLakeEnv(self._desc_rows, self.start_state, self.goal_state, self.max_steps)
 
-    import random
+    def reset(self):
+        self.s = self.start_state
+        return self.s, {}
+
+    def step(self, action):
+        if self.done:
+            return self._s, 0.0, True, False, {}
+
+        next_state = self._next[self._s * 4 + action] if 0 <= action < 4 else self._s
+        kind = self._kind[next_state]
+        terminated = kind != _KIND_SAFE
+
+        self.steps += 1
+        truncated = self.steps >= self.max_steps and not terminated
+
+        self._s = next_state
+        self.done = terminated or truncated
+
+        return next_state, 1.0 if kind == _KIND_GOAL else 0.0, terminated, truncated, {}
+
+    def _numpy_tables(self):
+        if self._np_tables is None:
+            self._np_tables = (
+                np.frombuffer(self._next, dtype=np.int32).reshape(-1, 4),
+                np.frombuffer(self._kind, dtype=np.uint8),
+            )
+        return self._np_tables
+
+    def step_batch(self, states, actions):
+        """Advance one agent per (state, action) pair; actions must be in 0..3.
+
+        Returns ``(next_states, rewards, terminated)``. NumPy inputs give NumPy
+        outputs, anything else gives lists. The env's own state and step
+        counter are left untouched, so callers track truncation themselves.
+        """
+        if np is not None and isinstance(states, np.ndarray):
+            next_table, kind_table = self._numpy_tables()
+            next_states = next_table[states, actions]
+            kinds = kind_table[next_states]
+            return next_states, (kinds == _KIND_GOAL).astype(float), kinds != _KIND_SAFE
+
+        next_table, kind_table = self._next, self._kind
+        next_states = [next_table[state * 4 + action] for state, action in zip(states, actions)]
+        kinds = [kind_table[state] for state in next_states]
+        return next_states, [1.0 if kind == _KIND_GOAL else 0.0 for kind in kinds], [kind != _KIND_SAFE for kind in kinds]
+
+
+def generate_random_map_custom(size, frozen_prob, seed=None):
+
+    # Con semilla se usa un generador propio; sin ella, el estado global de random
+    rng = random.Random(seed) if seed is not None else random
     desc = [['' for _ in range(size)] for _ in range(size)]
 
 
     # Ubicar aleatoriamente la posición inicial del agente y del objetivo
     positions = [(i, j) for i in range(size) for j in range(size)]
-    start_pos = random.choice(positions)
+    start_pos = rng.choice(positions)
     positions.remove(start_pos)
-    goal_pos = random.choice(positions)
+    goal_pos = rng.choice(positions)
     positions.remove(goal_pos)
 
     # Convertir las posiciones a enteros
@@ -124,12 +257,42 @@ def generate_random_map_custom(size, frozen_prob):
             elif (i, j) == goal_pos:
                 desc[i][j] = 'G'
             else:
-                desc[i][j] = 'F' if random.random() < frozen_prob else 'H'
+                desc[i][j] = 'F' if rng.random() < frozen_prob else 'H'
 
     # Convertir a lista de strings
     desc = [''.join(row) for row in desc]
+    return _make_env(desc, start_idx, goal_idx), start_idx, goal_idx
+
+
+def _make_env(desc, start_idx, goal_idx):
     if gym is not None:
-        env = gym.make('FrozenLake-v1', desc=desc).env
-    else:
-        env = SimpleFrozenLakeEnv(desc, start_idx, goal_idx)
-    return env, start_idx, goal_idx
+        return gym.make('FrozenLake-v1', desc=desc, is_slippery=False).env
+    return FastFrozenLakeEnv(desc, start_idx, goal_idx)
+
+
+def random_map_arrays(size, frozen_prob, rng):
+    """Sample a map with a NumPy Generator.
+
+    Returns a ``(size, size)`` boolean hole mask plus the start and goal
+    indices; start and goal are never holes.
+    """
+    holes = rng.random((size, size)) >= frozen_prob
+    start_idx, goal_idx = (int(idx) for idx in rng.choice(size * size, size=2, replace=False))
+    holes.flat[[start_idx, goal_idx]] = False
+    return holes, start_idx, goal_idx
+
+
+def map_rows(holes, start_idx, goal_idx):
+    """Turn a hole mask and start/goal indices into FrozenLake desc rows."""
+    tiles = np.where(holes, ord('H'), ord('F')).astype(np.uint8)
+    tiles.flat[start_idx] = ord('S')
+    tiles.flat[goal_idx] = ord('G')
+    return [row.tobytes().decode('ascii') for row in tiles]
+
+
+def generate_random_map_numpy(size, frozen_prob, seed=None):
+    """Vectorized, seedable counterpart of ``generate_random_map_custom``."""
+    if np is None:
+        raise ModuleNotFoundError("generate_random_map_numpy requiere tener NumPy instalado.")
+    holes, start_idx, goal_idx = random_map_arrays(size, frozen_prob, np.random.default_rng(seed))
+    return _make_env(map_rows(holes, start_idx, goal_idx), start_idx, goal_idx), start_idx, goal_idx
@@ -1,21 +1,27 @@
 import csv
 import os
 import statistics
-import time
 from collections import defaultdict
 from pathlib import Path
 
 from busquedas import (
-    deterministic_random_100_environment,
     random_search,
     bfs_search,
     dfs_search,
     limited_dfs_search,
+    iterative_deepening_search,
     uniform_cost_search,
     a_star_search_1,
     a_star_search_2,
+    bidirectional_bfs_search,
+    bidirectional_a_star_search_1,
+    bidirectional_a_star_search_2,
+    jump_point_search,
 )
-from random_map import SimpleFrozenLakeEnv, gym
+from busquedas_numpy import HAS_NUMPY
+from experiment_pool import PROFILE, SEED, WORKERS, run_jobs
+from profiling import COLUMNS as PROFILE_COLUMNS, SearchStats
+from random_map import FastFrozenLakeEnv, gym
 
 try:
     from gymnasium import wrappers
@@ -29,14 +35,18 @@ OUTPUT_CSV = Path(__file__).resolve().parent.parent / "resultados.csv"
 IMAGES_DIR = Path(__file__).resolve().parent.parent / "images"
 
 
-def _build_env(desc_rows, start_idx, goal_idx):
+def _build_env(desc_rows, start_idx, goal_idx, grid=None):
     if gym is not None:
-        env = gym.make("FrozenLake-v1", desc=desc_rows).env
+        env = gym.make("FrozenLake-v1", desc=desc_rows, is_slippery=False).env
         if wrappers is not None:
             env = wrappers.TimeLimit(env, 1000)
-        return env
+    else:
+        env = FastFrozenLakeEnv(desc_rows, start_idx, goal_idx, max_steps=1000)
 
-    return SimpleFrozenLakeEnv(desc_rows, start_idx, goal_idx, max_steps=1000)
+    if grid is not None:
+        # Reutilizar el mapa compilado en lugar de recompilarlo por algoritmo
+        env.unwrapped.grid_model = grid
+    return env
 
 
 def _extract_desc_rows(env):
@@ -142,56 +152,60 @@ def _create_boxplot(data_map, title, xlabel, output_path):
     output_path.write_text("\n".join(lines), encoding="utf-8")
 
 
-def main():
-    algorithms = [
-        ("RANDOM", lambda env, start, goal: random_search(env, start, goal, verbose=False), {1, 2}),
-        ("BFS", bfs_search, {1, 2}),
-        ("DFS", dfs_search, {1, 2}),
-        *(
-            (
-                f"DLS-{limit}",
-                (lambda limit: (lambda env, start, goal: limited_dfs_search(env, limit, start, goal)))(limit),
-                {1, 2},
-            )
-            for limit in LIMITS
-        ),
-        ("UCS", uniform_cost_search, {1, 2}),
-        ("A* (esc1)", a_star_search_1, {1}),
-        ("A* (esc2)", a_star_search_2, {2}),
-    ]
+ALGORITHMS = [
+    ("RANDOM", lambda env, start, goal: random_search(env, start, goal, verbose=False), {1, 2}),
+    ("BFS", bfs_search, {1, 2}),
+    ("DFS", dfs_search, {1, 2}),
+    *(
+        (
+            f"DLS-{limit}",
+            (lambda limit: (lambda env, start, goal: limited_dfs_search(env, limit, start, goal)))(limit),
+            {1, 2},
+        )
+        for limit in LIMITS
+    ),
+    ("IDDFS", iterative_deepening_search, {1, 2}),
+    ("UCS", uniform_cost_search, {1, 2}),
+    *(
+        (
+            ("BFS-NP", lambda env, start, goal: bfs_search(env, start, goal, backend="numpy"), {1, 2}),
+            ("UCS-NP", lambda env, start, goal: uniform_cost_search(env, start, goal, backend="numpy"), {1, 2}),
+        )
+        if HAS_NUMPY
+        else ()
+    ),
+    ("A* (esc1)", a_star_search_1, {1}),
+    ("A* (esc2)", a_star_search_2, {2}),
+    ("A* exacta (esc1)", lambda env, start, goal: a_star_search_1(env, start, goal, exact_heuristic=True), {1}),
+    ("A* exacta (esc2)", lambda env, start, goal: a_star_search_2(env, start, goal, exact_heuristic=True), {2}),
+    ("BFS bidir", bidirectional_bfs_search, {1, 2}),
+    ("A* bidir (esc1)", bidirectional_a_star_search_1, {1}),
+    ("A* bidir (esc2)", bidirectional_a_star_search_2, {2}),
+    ("JPS (esc1)", jump_point_search, {1}),
+]
 
-    algorithm_scenarios = {name: scenarios for name, _, scenarios in algorithms}
+
+def main():
+    algorithm_scenarios = {name: scenarios for name, _, scenarios in ALGORITHMS}
 
     output_rows = []
 
-    for env_idx in range(1, TOTAL_RUNS + 1):
-        env, start, goal = deterministic_random_100_environment()
-        desc_rows = _extract_desc_rows(env)
-
-        for name, func, _ in algorithms:
-            env_instance = _build_env(desc_rows, start, goal)
-            start_time = time.perf_counter()
-            try:
-                result = func(env_instance, start, goal)
-            except Exception as exc:  # Capture unexpected failures as empty results
-                print(f"[{name}] Error en entorno {env_idx}: {exc}")
-                result = (None, None, None)
-            elapsed = time.perf_counter() - start_time
-
-            states, actions, cost = result if result else (None, None, None)
-            success = all(value is not None for value in (states, actions, cost))
-
-            output_rows.append(
-                {
-                    "algorithm_name": name,
-                    "env_n": env_idx,
-                    "states_n": int(states) if success else 0,
-                    "actions_count": int(actions) if success else 0,
-                    "actions_cost": float(cost) if success else 0.0,
-                    "time": elapsed,
-                    "solution_found": success,
-                }
-            )
+    for env_idx, name, result, elapsed, profile in run_jobs(__name__, TOTAL_RUNS, WORKERS, SEED):
+        states, actions, cost = result if result else (None, None, None)
+        success = all(value is not None for value in (states, actions, cost))
+
+        row = {
+            "algorithm_name": name,
+            "env_n": env_idx,
+            "states_n": int(states) if success else 0,
+            "actions_count": int(actions) if success else 0,
+            "actions_cost": float(cost) if success else 0.0,
+            "time": elapsed,
+            "solution_found": success,
+        }
+        if PROFILE:
+            row.update((profile or SearchStats()).as_row())
+        output_rows.append(row)
 
     with OUTPUT_CSV.open("w", newline="", encoding="utf-8") as csv_file:
         writer = csv.DictWriter(
@@ -204,6 +218,7 @@ def main():
                 "actions_cost",
                 "time",
                 "solution_found",
+                *(PROFILE_COLUMNS if PROFILE else ()),
             ],
         )
         writer.writeheader()
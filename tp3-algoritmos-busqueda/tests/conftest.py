@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(TESTS_DIR.parent / "code"))
+sys.path.insert(0, str(TESTS_DIR))
@@ -0,0 +1,106 @@
+import pytest
+
+import busquedas
+import referencia
+from busquedas_numpy import HAS_NUMPY
+from profiling import collecting
+from random_map import FastFrozenLakeEnv, generate_random_map_custom
+
+# (lado, probabilidad de hielo, semilla): mapas chicos con muchos huecos y los del TP
+MAPAS = [(20, 0.8, semilla) for semilla in range(6)] + [(100, 0.92, semilla) for semilla in range(3)]
+SIN_CAMINO = (None, None, None)
+
+
+def _ids(mapa):
+    return "{}x{}-p{}-s{}".format(mapa[0], *mapa)
+
+
+@pytest.fixture(scope="module", params=MAPAS, ids=_ids)
+def mapa(request):
+    size, frozen_prob, semilla = request.param
+    env, start, goal = generate_random_map_custom(size, frozen_prob, semilla)
+    return env, start, goal, referencia.bfs_search(env, start, goal), referencia.uniform_cost_search(env, start, goal)
+
+
+@pytest.fixture(scope="module")
+def sin_camino():
+    # El objetivo queda encerrado por huecos
+    return FastFrozenLakeEnv(["SFFH", "FFHF", "FHHG", "FFFH"], 0, 11), 0, 11
+
+
+@pytest.mark.parametrize("nombre", ["bfs_search", "uniform_cost_search", "a_star_search_1", "a_star_search_2"])
+def test_igual_a_la_version_original(mapa, nombre):
+    env, start, goal, _, _ = mapa
+    assert getattr(busquedas, nombre)(env, start, goal) == getattr(referencia, nombre)(env, start, goal)
+
+
+def test_dfs_igual_a_la_version_original(mapa):
+    env, start, goal, _, _ = mapa
+    if env.unwrapped.nrow > 20:
+        pytest.skip("la versión original es recursiva")
+    assert busquedas.dfs_search(env, start, goal) == referencia.dfs_search(env, start, goal)
+
+
+@pytest.mark.parametrize("limite", [0, 5, 20, 50])
+def test_dls_igual_a_la_version_original(mapa, limite):
+    env, start, goal, _, _ = mapa
+    assert busquedas.limited_dfs_search(env, limite, start, goal) == referencia.limited_dfs_search(env, limite, start, goal)
+
+
+def test_iddfs(mapa):
+    env, start, goal, bfs, _ = mapa
+    if bfs == SIN_CAMINO:
+        assert busquedas.iterative_deepening_search(env, start, goal) == SIN_CAMINO
+        return
+    # Con step=1 encuentra un camino de la menor cantidad de acciones
+    assert busquedas.iterative_deepening_search(env, start, goal, step=1)[1] == bfs[1]
+    step = max(1, env.unwrapped.ncol // 10)
+    assert bfs[1] <= busquedas.iterative_deepening_search(env, start, goal)[1] < bfs[1] + step
+
+
+def test_heuristica_exacta(mapa):
+    env, start, goal, bfs, ucs = mapa
+    assert busquedas.a_star_search_1(env, start, goal, exact_heuristic=True)[1] == bfs[1]
+    assert busquedas.a_star_search_2(env, start, goal, exact_heuristic=True)[2] == ucs[2]
+
+
+def test_bidireccionales(mapa):
+    env, start, goal, bfs, ucs = mapa
+    assert busquedas.bidirectional_bfs_search(env, start, goal)[1] == bfs[1]
+    assert busquedas.bidirectional_a_star_search_1(env, start, goal)[1] == bfs[1]
+    assert busquedas.bidirectional_a_star_search_2(env, start, goal)[2] == ucs[2]
+
+
+def test_jump_point_search(mapa):
+    env, start, goal, bfs, _ = mapa
+    assert busquedas.jump_point_search(env, start, goal)[1] == bfs[1]
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="sin NumPy")
+def test_backend_numpy(mapa):
+    env, start, goal, bfs, ucs = mapa
+    assert busquedas.bfs_search(env, start, goal, backend="numpy")[1] == bfs[1]
+    assert busquedas.uniform_cost_search(env, start, goal, backend="numpy")[1:] == ucs[1:]
+
+
+@pytest.mark.parametrize("nombre", [
+    "bfs_search", "dfs_search", "iterative_deepening_search", "uniform_cost_search",
+    "a_star_search_1", "a_star_search_2", "bidirectional_bfs_search",
+    "bidirectional_a_star_search_1", "bidirectional_a_star_search_2", "jump_point_search",
+])
+def test_sin_camino(sin_camino, nombre):
+    env, start, goal = sin_camino
+    assert getattr(busquedas, nombre)(env, start, goal) == SIN_CAMINO
+    assert busquedas.limited_dfs_search(env, 10, start, goal) == SIN_CAMINO
+
+
+def test_registran_estadisticas(mapa):
+    import escenarios_experimentos
+
+    env, start, goal, _, _ = mapa
+    for nombre, funcion, _ in escenarios_experimentos.ALGORITHMS:
+        if nombre.startswith("RANDOM"):
+            continue
+        with collecting() as stats:
+            funcion(env, start, goal)
+        assert stats.nodes_expanded is not None, nombre
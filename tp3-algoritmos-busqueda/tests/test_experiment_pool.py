@@ -0,0 +1,37 @@
+import pytest
+
+import experiment_pool
+import referencia
+from map_cache import map_info
+from random_map import FastFrozenLakeEnv, np
+
+pytestmark = pytest.mark.skipif(np is None, reason="el corpus necesita NumPy")
+
+
+def _resultados(corridas, **opciones):
+    return [fila[:3] for fila in experiment_pool.run_jobs("escenarios_experimentos", corridas, workers=1, seed=3, **opciones)]
+
+
+def test_corpus_por_defecto(tmp_path, monkeypatch):
+    monkeypatch.setattr(experiment_pool, "CORPUS_DIR", tmp_path)
+    pocos = _resultados(1)
+    assert (tmp_path / "seed-3" / "meta.json").exists()
+    # Pedir más mapas regenera el corpus; los primeros no cambian
+    assert _resultados(2)[:len(pocos)] == pocos
+    assert len(experiment_pool._abrir_corpus(str(tmp_path / "seed-3"))) == 2
+
+
+def test_corpus_explicito(tmp_path):
+    path = tmp_path / "corpus"
+    assert experiment_pool.resolve_corpus(str(path), 2, seed=1) == str(path)
+    with pytest.raises(ValueError):
+        experiment_pool.resolve_corpus(str(path), 3, seed=1)
+    assert experiment_pool.resolve_corpus("", 3, seed=1) is None
+
+
+def test_corpus_alcanzable(tmp_path):
+    corpus = experiment_pool._abrir_corpus(experiment_pool.resolve_corpus(str(tmp_path / "corpus"), 4, seed=0))
+    for desc_rows, start, goal in corpus:
+        env = FastFrozenLakeEnv(desc_rows, start, goal)
+        alcanzable = referencia.bfs_search(env, start, goal)[0] is not None
+        assert map_info(env).reachable(start, goal) == alcanzable
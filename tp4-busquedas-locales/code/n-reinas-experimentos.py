@@ -0,0 +1,237 @@
+"""Ejecutor de experimentos de búsqueda local para N-reinas (TP4).
+
+Corre cada algoritmo de `n-reinas.py` sobre varias semillas y tamaños de
+tablero, repartiendo las corridas en un pool de procesos. Cada fila se agrega
+al CSV (`--csv`) apenas termina su corrida, así que un barrido largo puede
+interrumpirse: al volver a ejecutarlo se saltean las filas que ya están en el
+CSV. La traza de h de cada corrida se guarda comprimida en `traces/`, con la
+semilla en el nombre del archivo.
+
+Todas las corridas son reproducibles: el tablero inicial depende solo de
+(semilla, n, corrida), así que es el mismo para todos los algoritmos, y cada
+algoritmo siembra `random` con una semilla derivada de la corrida. Cada fila
+guarda su semilla raíz y la reanudación compara también la semilla, así que
+nunca se mezclan corridas de semillas distintas. El CSV por defecto es
+`tp4-Nreinas-seeded.csv`; `tp4-Nreinas.csv` tiene las corridas originales,
+sin semilla, y no se puede continuar.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import importlib.util
+import os
+import random
+import sys
+import time
+from array import array
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # sin NumPy las trazas se guardan como array('i') con gzip
+    np = None
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+CSV_PATH = BASE_DIR / "tp4-Nreinas-seeded.csv"
+TRACES_DIR = BASE_DIR / "traces"
+CAMPOS = ["algorithm_name", "env_n", "size", "best_solution", "H", "states", "time", "seed"]
+
+MODULO_REINAS = Path(__file__).with_name("n-reinas.py")
+spec = importlib.util.spec_from_file_location("n_reinas", MODULO_REINAS)
+if spec is None or spec.loader is None:
+    raise ImportError(f"No se pudo cargar el módulo desde {MODULO_REINAS}")
+n_reinas = importlib.util.module_from_spec(spec)
+sys.modules["n_reinas"] = n_reinas
+spec.loader.exec_module(n_reinas)
+
+ALGORITMOS = {
+    "random": lambda estado, maximo, trace: n_reinas.random_algorithm(estado, maximo, trace=trace),
+    "HC": lambda estado, maximo, trace: n_reinas.hill_climbing(estado, maximo, trace=trace),
+    "SA": lambda estado, maximo, trace: n_reinas.simulated_annealing(estado, maximo, trace=trace),
+    "GA": lambda estado, maximo, trace: n_reinas.genetic_algorithm(estado, maximo, None, trace=trace),
+    "MC": lambda estado, maximo, trace: n_reinas.min_conflicts(estado, maximo, trace=trace),
+}
+if np is not None:
+    ALGORITMOS["GA-NP"] = lambda estado, maximo, trace: n_reinas.genetic_algorithm_numpy(estado, maximo, None, trace=trace)
+
+Clave = Tuple[str, int, int, int]  # (algoritmo, corrida, n, semilla)
+
+
+def derive_seed(*partes: object) -> int:
+    """Entero de 32 bits determinista a partir de las partes dadas."""
+    return random.Random(":".join(str(parte) for parte in partes)).getrandbits(32)
+
+
+def estado_inicial(semilla: int, n: int, corrida: int) -> Tuple[int, ...]:
+    rng = random.Random(derive_seed(semilla, "estado", n, corrida))
+    return tuple(rng.randrange(n) for _ in range(n))
+
+
+def guardar_traza(directorio: Path, clave: Clave, traza: List[int]) -> Path:
+    """Escribe la traza comprimida; primero a un temporal para no dejar archivos a medias."""
+    algoritmo, corrida, n, semilla = clave
+    directorio.mkdir(parents=True, exist_ok=True)
+    if np is not None:
+        destino = directorio / f"{algoritmo}_n{n}_s{semilla}_{corrida}.npz"
+        temporal = destino.with_suffix(".tmp")
+        with temporal.open("wb") as archivo:
+            np.savez_compressed(archivo, trace=np.asarray(traza, dtype=np.int64))
+    else:
+        destino = directorio / f"{algoritmo}_n{n}_s{semilla}_{corrida}.bin.gz"
+        temporal = destino.with_suffix(".tmp")
+        with gzip.open(temporal, "wb") as archivo:
+            archivo.write(array("q", traza).tobytes())
+    os.replace(temporal, destino)
+    return destino
+
+
+def cargar_traza(path: Path) -> List[int]:
+    if path.suffix == ".npz":
+        with np.load(path) as datos:
+            return datos["trace"].tolist()
+    with gzip.open(path, "rb") as archivo:
+        traza = array("q")
+        traza.frombytes(archivo.read())
+        return traza.tolist()
+
+
+def _correr(trabajo: Tuple[str, int, int, int, int, Optional[str]]) -> Dict[str, object]:
+    algoritmo, n, corrida, semilla, maximo, directorio_trazas = trabajo
+    estado = estado_inicial(semilla, n, corrida)
+    random.seed(derive_seed(semilla, algoritmo, n, corrida))
+    traza: List[int] = []
+
+    inicio = time.perf_counter()
+    mejor, h, estados = ALGORITMOS[algoritmo](estado, maximo, traza)
+    tiempo = time.perf_counter() - inicio
+
+    if directorio_trazas is not None:
+        guardar_traza(Path(directorio_trazas), (algoritmo, corrida, n, semilla), traza)
+    return {
+        "algorithm_name": algoritmo,
+        "env_n": corrida,
+        "size": n,
+        "best_solution": str([int(reina) for reina in mejor]),
+        "H": h,
+        "states": estados,
+        "time": tiempo,
+        "seed": semilla,
+    }
+
+
+def filas_existentes(csv_path: Path) -> Set[Clave]:
+    """Claves ya escritas; descarta una última línea cortada por una interrupción.
+
+    Un CSV sin la columna `seed` (como el de las corridas originales) no se
+    puede continuar: las filas nuevas no coincidirían con su encabezado.
+    """
+    if not csv_path.exists():
+        return set()
+    with csv_path.open("rb+") as archivo:
+        contenido = archivo.read()
+        if contenido and not contenido.endswith(b"\n"):
+            archivo.truncate(contenido.rfind(b"\n") + 1)
+
+    hechas: Set[Clave] = set()
+    with csv_path.open(newline="", encoding="utf-8") as archivo:
+        lector = csv.DictReader(archivo)
+        if lector.fieldnames is not None and lector.fieldnames != CAMPOS:
+            raise ValueError(f"{csv_path} tiene otras columnas ({', '.join(lector.fieldnames)}); se necesita otro --csv")
+        for fila in lector:
+            try:
+                # Las filas sin semilla no cuentan como hechas para ninguna semilla
+                hechas.add((fila["algorithm_name"], int(fila["env_n"]), int(fila["size"]), int(fila["seed"])))
+            except (KeyError, TypeError, ValueError):
+                continue
+    return hechas
+
+
+def trabajos_pendientes(
+    algoritmos: List[str],
+    tamanios: List[int],
+    corridas: int,
+    semilla: int,
+    max_estados: Optional[int],
+    directorio_trazas: Optional[Path],
+    hechas: Set[Clave],
+) -> Iterator[Tuple[str, int, int, int, int, Optional[str]]]:
+    for n in tamanios:
+        # Mismo presupuesto que las corridas originales: 8 * n * n estados
+        maximo = max_estados if max_estados is not None else 8 * n * n
+        for algoritmo in algoritmos:
+            for corrida in range(1, corridas + 1):
+                if (algoritmo, corrida, n, semilla) not in hechas:
+                    yield algoritmo, n, corrida, semilla, maximo, str(directorio_trazas) if directorio_trazas else None
+
+
+def ejecutar(
+    algoritmos: List[str],
+    tamanios: List[int],
+    corridas: int = 30,
+    semilla: int = 0,
+    workers: int = 1,
+    max_estados: Optional[int] = None,
+    csv_path: Path = CSV_PATH,
+    directorio_trazas: Optional[Path] = TRACES_DIR,
+) -> int:
+    """Corre las combinaciones que faltan y devuelve cuántas filas se agregaron."""
+    hechas = filas_existentes(csv_path)
+    trabajos = list(trabajos_pendientes(algoritmos, tamanios, corridas, semilla, max_estados, directorio_trazas, hechas))
+    if not trabajos:
+        return 0
+
+    nuevo = not csv_path.exists() or csv_path.stat().st_size == 0
+    with csv_path.open("a", newline="", encoding="utf-8") as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=CAMPOS)
+        if nuevo:
+            escritor.writeheader()
+
+        def escribir(fila: Dict[str, object]) -> None:
+            escritor.writerow(fila)
+            archivo.flush()
+
+        if workers <= 1:
+            for trabajo in trabajos:
+                escribir(_correr(trabajo))
+        else:
+            with Pool(processes=workers) as pool:
+                for fila in pool.imap_unordered(_correr, trabajos):
+                    escribir(fila)
+    return len(trabajos)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Barrido de búsquedas locales para N-reinas.")
+    parser.add_argument("--algorithms", nargs="+", default=list(ALGORITMOS), choices=list(ALGORITMOS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[4, 8, 10], help="Tamaños de tablero.")
+    parser.add_argument("--runs", type=int, default=30, help="Corridas por algoritmo y tamaño.")
+    parser.add_argument("--seed", type=int, default=int(os.environ.get("RUN_SEED", 0)), help="Semilla raíz.")
+    parser.add_argument(
+        "--workers", type=int, default=int(os.environ.get("RUN_WORKERS", os.cpu_count() or 1)), help="Procesos."
+    )
+    parser.add_argument("--max-states", type=int, default=None, help="Presupuesto de estados (por defecto 8*n*n).")
+    parser.add_argument("--csv", type=Path, default=CSV_PATH, help="CSV de salida (se continúa si existe).")
+    parser.add_argument("--traces", type=Path, default=TRACES_DIR, help="Directorio de trazas comprimidas.")
+    parser.add_argument("--no-traces", action="store_true", help="No guardar las trazas.")
+    opciones = parser.parse_args()
+
+    agregadas = ejecutar(
+        opciones.algorithms,
+        opciones.sizes,
+        corridas=opciones.runs,
+        semilla=opciones.seed,
+        workers=opciones.workers,
+        max_estados=opciones.max_states,
+        csv_path=opciones.csv,
+        directorio_trazas=None if opciones.no_traces else opciones.traces,
+    )
+    print(f"{agregadas} corridas nuevas agregadas a {opciones.csv}")
+
+
+if __name__ == "__main__":
+    main()
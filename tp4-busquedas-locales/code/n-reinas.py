@@ -1,81 +1,245 @@
+# Vecindario: mover una reina a otra fila de su columna. Los vecinos se numeran
+# 0 .. n * (n - 1) - 1 por columna y luego por fila, salteando la fila actual,
+# y un movimiento se representa como (columna, fila nueva).
+
+def neighbor_count(s):
+    return len(s) * (len(s) - 1)
+
+def move_at(s, k):
+    # Movimiento número k, en O(1)
+    col, row = divmod(k, len(s) - 1)
+    return col, row if row < s[col] else row + 1
+
+def random_move(s):
+    # Consume el generador igual que random.choice(get_neighbors(s))
+    import random
+
+    return move_at(s, random.randrange(neighbor_count(s)))
+
+def iter_moves(s, limit=None):
+    # Movimientos en orden, de a uno y sin armar la lista; a lo sumo `limit`
+    emitidos = 0
+    for col in range(len(s)):
+        for row in range(len(s)):
+            if s[col] != row:
+                if emitidos == limit:
+                    return
+                emitidos += 1
+                yield col, row
+
+def iter_neighbors(s, limit=None):
+    for col, row in iter_moves(s, limit):
+        neighbor = list(s)
+        neighbor[col] = row
+        yield tuple(neighbor)
+
 def get_neighbors(s):
-        neighbors = []
-        for col in range(len(s)):
-            for row in range(len(s)):
-                if s[col] != row:
-                    neighbor = list(s)
-                    neighbor[col] = row
-                    neighbors.append(tuple(neighbor))
-        return neighbors
+    return list(iter_neighbors(s))
+
+class ConflictCounter:
+    # Tablero con la cantidad de reinas por fila y por diagonal. Dos reinas en la
+    # misma fila o diagonal se atacan, así que h = suma de c * (c - 1) / 2 sobre
+    # todos los contadores, y mover una sola reina cambia h en O(1).
+    __slots__ = ("n", "queens", "rows", "diagonals", "anti_diagonals", "h")
+
+    def __init__(self, s):
+        n = len(s)
+        self.n = n
+        self.queens = list(s)
+        self.rows = [0] * n
+        self.diagonals = [0] * (2 * n - 1)       # índice fila - columna + n - 1
+        self.anti_diagonals = [0] * (2 * n - 1)  # índice fila + columna
+        for col, row in enumerate(s):
+            self.rows[row] += 1
+            self.diagonals[row - col + n - 1] += 1
+            self.anti_diagonals[row + col] += 1
+        self.h = sum(c * (c - 1) // 2 for c in self.rows + self.diagonals + self.anti_diagonals)
+
+    def delta(self, col, row):
+        # Cambio de h al mover la reina de `col` a `row` (distinta de su fila actual)
+        n = self.n
+        old = self.queens[col]
+        leaves = self.rows[old] + self.diagonals[old - col + n - 1] + self.anti_diagonals[old + col] - 3
+        enters = self.rows[row] + self.diagonals[row - col + n - 1] + self.anti_diagonals[row + col]
+        return enters - leaves
+
+    def move(self, col, row):
+        n = self.n
+        old = self.queens[col]
+        self.h += self.delta(col, row)
+        self.rows[old] -= 1
+        self.diagonals[old - col + n - 1] -= 1
+        self.anti_diagonals[old + col] -= 1
+        self.rows[row] += 1
+        self.diagonals[row - col + n - 1] += 1
+        self.anti_diagonals[row + col] += 1
+        self.queens[col] = row
+
+    def best_move(self, limit):
+        # Recorre a lo sumo `limit` vecinos en el orden de iter_moves y devuelve
+        # (movimiento, delta, revisados) del primero con menor delta. Evalúa una
+        # columna por vez, así que no arma la lista de n * (n - 1) vecinos
+        n = self.n
+        rows, diagonals, anti_diagonals = self.rows, self.diagonals, self.anti_diagonals
+        best_move, best_delta, revisados = None, None, 0
+        for col, old in enumerate(self.queens):
+            if revisados >= limit:
+                break
+            offset = n - 1 - col
+            # h que suman las otras reinas en cada fila de esta columna
+            enters = [r + d + a for r, d, a in zip(rows, diagonals[offset:offset + n], anti_diagonals[col:col + n])]
+            leaves = enters[old] - 3
+            enters[old] = 3 * n  # la fila actual no es un vecino
+            candidatos = min(n - 1, limit - revisados)
+            if candidatos < n - 1:
+                enters = enters[:candidatos if candidatos <= old else candidatos + 1]
+            revisados += candidatos
+            if not enters:
+                continue
+            minimo = min(enters)
+            if minimo < 3 * n and (best_delta is None or minimo - leaves < best_delta):
+                best_move, best_delta = (col, enters.index(minimo)), minimo - leaves
+        return best_move, best_delta, revisados
+
+    def state(self):
+        return tuple(self.queens)
 
 def heuristic(s):
-    h = 0
-    for i in range(len(s)):
-        for j in range(i + 1, len(s)):
-            if s[i] == s[j] or abs(s[i] - s[j]) == abs(i - j):
-                h += 1
-    return h
+    return ConflictCounter(s).h
 
 def hill_climbing(state, max_estados_explorados, trace=None):
-    current = state
-    current_h = heuristic(current)
+    current = ConflictCounter(state)
     if trace is not None:
-        trace.append(current_h)
+        trace.append(current.h)
     estados_explorados = 1
 
     while estados_explorados < max_estados_explorados:
-        if current_h == 0:
+        if current.h == 0:
             break
-        neighbors = get_neighbors(current)
-        if not neighbors:
+        # Primer vecino con el menor h, como min(neighbors, key=heuristic)
+        best_move, best_delta, revisados = current.best_move(max_estados_explorados - estados_explorados)
+        if best_move is None:
             break
-        if estados_explorados + len(neighbors) > max_estados_explorados:
-            neighbors = neighbors[:max_estados_explorados - estados_explorados]
-        estados_explorados += len(neighbors)
-        neighbor = min(neighbors, key=heuristic)
-        neighbor_h = heuristic(neighbor)
-        if neighbor_h >= current_h:
+        estados_explorados += revisados
+        if best_delta >= 0:
             break
-        current = neighbor
-        current_h = neighbor_h
+        current.move(*best_move)
         if trace is not None:
-            trace.append(current_h)
+            trace.append(current.h)
 
-    return current, current_h, estados_explorados
+    return current.state(), current.h, estados_explorados
 
 def simulated_annealing(state, max_estados_explorados, initial_temp=1000, cooling_rate=0.99, trace=None):
     import math
     import random
 
-    current = state
-    current_h = heuristic(current)
+    current = ConflictCounter(state)
     if trace is not None:
-        trace.append(current_h)
+        trace.append(current.h)
     temp = initial_temp
     estados_explorados = 1
 
     while estados_explorados < max_estados_explorados and temp > 1:
-        if current_h == 0:
+        if current.h == 0:
             break
-        neighbors = get_neighbors(current)
-        if not neighbors:
+        if not neighbor_count(current.queens):
             break
-        neighbor = random.choice(neighbors)
-        neighbor_h = heuristic(neighbor)
+        col, row = random_move(current.queens)
         estados_explorados += 1
-        delta_e = neighbor_h - current_h
+        delta_e = current.delta(col, row)
 
         if delta_e < 0 or random.uniform(0, 1) < math.exp(-delta_e / temp):
-            current = neighbor
-            current_h = neighbor_h
+            current.move(col, row)
 
         if trace is not None:
-            trace.append(current_h)
+            trace.append(current.h)
         temp *= cooling_rate
 
-    return current, current_h, estados_explorados
+    return current.state(), current.h, estados_explorados
+
+def min_conflicts(state, max_estados_explorados, trace=None, sample_size=16):
+    import random
+
+    current = ConflictCounter(state)
+    if trace is not None:
+        trace.append(current.h)
+    estados_explorados = 1
+    n = current.n
+    rows, diagonals, anti_diagonals, queens = current.rows, current.diagonals, current.anti_diagonals, current.queens
 
-def genetic_algorithm(individual, max_estados_explorados, population_size, mutation_rate = 0.1, trace=None):
+    # Filas sin reinas (con su posición en la lista, para sacarlas en O(1)):
+    # cerca de la solución suelen ser los únicos destinos sin conflictos
+    vacias = [row for row in range(n) if not rows[row]]
+    posicion = {row: i for i, row in enumerate(vacias)}
+    pendientes = []
+
+    while estados_explorados < max_estados_explorados and current.h > 0:
+        if not pendientes:
+            # Nueva ronda: todas las columnas en conflicto, en orden aleatorio
+            pendientes = [
+                col for col, row in enumerate(queens)
+                if rows[row] + diagonals[row - col + n - 1] + anti_diagonals[row + col] > 3
+            ]
+            random.shuffle(pendientes)
+        col = pendientes.pop()
+        old = queens[col]
+        leaves = rows[old] + diagonals[old - col + n - 1] + anti_diagonals[old + col] - 3
+        if not leaves:
+            continue
+
+        # Primero una muestra de filas al azar y de filas vacías (salvo en tableros
+        # chicos, donde la columna entera cuesta lo mismo)...
+        candidatos = []
+        if n - 1 > 2 * sample_size:
+            candidatos = [random.randrange(n) for _ in range(sample_size)]
+            if vacias:
+                candidatos += [vacias[random.randrange(len(vacias))] for _ in range(sample_size)]
+            candidatos = candidatos[:max_estados_explorados - estados_explorados]
+            estados_explorados += len(candidatos)
+        best_row, best = None, None
+        for row in candidatos:
+            if row != old:
+                enters = rows[row] + diagonals[row - col + n - 1] + anti_diagonals[row + col]
+                if best is None or enters < best:
+                    best_row, best = row, enters
+
+        # ...y si ninguna sirve, la columna entera (mínimo con desempate al azar)
+        if best is None or best > leaves:
+            if max_estados_explorados - estados_explorados < n - 1:
+                break
+            estados_explorados += n - 1
+            offset = n - 1 - col
+            conflictos = [r + d + a for r, d, a in zip(rows, diagonals[offset:offset + n], anti_diagonals[col:col + n])]
+            conflictos[old] = 3 * n
+            best = min(conflictos)
+            if best > leaves:
+                if trace is not None:
+                    trace.append(current.h)
+                continue
+            empates = [row for row, valor in enumerate(conflictos) if valor == best]
+            best_row = empates[random.randrange(len(empates))]
+
+        if rows[old] == 1:
+            posicion[old] = len(vacias)
+            vacias.append(old)
+        if rows[best_row] == 0:
+            i = posicion.pop(best_row)
+            ultima = vacias.pop()
+            if ultima != best_row:
+                vacias[i] = ultima
+                posicion[ultima] = i
+        current.move(col, best_row)
+        if trace is not None:
+            trace.append(current.h)
+
+    return current.state(), current.h, estados_explorados
+
+def genetic_algorithm(individual, max_estados_explorados, population_size, mutation_rate = 0.1, trace=None, population=None):
+    # Si se pasa `population` (lista de individuos), se sigue evolucionando esa
+    # población en lugar de crear una nueva: sus estados ya se contaron, así que
+    # no suman a estados_explorados. Una lista vacía crea la población inicial
+    # como siempre. En ambos casos, al terminar la lista queda con la última
+    # generación (así la usa island_search entre épocas)
     import random
 
     def initialize_population(size, n):
@@ -85,10 +249,12 @@ def genetic_algorithm(individual, max_estados_explorados, population_size, mutat
             pop.add(individual)
         return list(pop)
 
-    def select_parents(population):
+    def selection_probabilities(population):
         weights = [1 / (1 + heuristic(ind)) for ind in population]
         total = sum(weights)
-        probabilities = [w / total for w in weights]
+        return [w / total for w in weights]
+
+    def select_parents(population, probabilities):
         return random.choices(population, probabilities, k=2)
 
     def order_crossover(parent1, parent2):
@@ -126,20 +292,27 @@ def genetic_algorithm(individual, max_estados_explorados, population_size, mutat
     if population_size == None:
         population_size = len(individual) * 8
 
-    current_population = initialize_population(population_size - 1, len(individual))
-    current_population.append(individual)
+    continuing = bool(population)
+    if not continuing:
+        current_population = initialize_population(population_size - 1, len(individual))
+        current_population.append(individual)
+        estados_explorados = len(current_population)
+    else:
+        current_population = list(population)
+        estados_explorados = 0
     best_individual = min(current_population, key=heuristic)
     best_h = heuristic(best_individual)
-    if trace is not None:
+    if trace is not None and not continuing:
         trace.append(best_h)
-    estados_explorados = len(current_population)
 
     while estados_explorados < max_estados_explorados:
         if best_h == 0:
             break
         next_population = []
+        # La población no cambia durante la generación: los pesos se calculan una vez
+        probabilities = selection_probabilities(current_population)
         while len(next_population) < len(current_population) and estados_explorados < max_estados_explorados:
-            parent1, parent2 = select_parents(current_population)
+            parent1, parent2 = select_parents(current_population, probabilities)
             child1, child2 = crossover(parent1, parent2)
             next_population.append(mutate(child1))
             estados_explorados += 1
@@ -157,8 +330,117 @@ def genetic_algorithm(individual, max_estados_explorados, population_size, mutat
         if trace is not None:
             trace.append(best_h)
 
+    if population is not None:
+        population[:] = current_population
     return best_individual, best_h, estados_explorados
 
+def population_heuristic(population):
+    # h de cada fila de un arreglo (individuos, n) de NumPy, contando reinas por
+    # fila y diagonal de todos los individuos con un solo bincount por línea
+    import numpy as np
+
+    size, n = population.shape
+    cols = np.arange(n)
+    base = np.arange(size)[:, None]
+    h = np.zeros(size, dtype=np.int64)
+    for lineas, largo in ((population, n), (population - cols + n - 1, 2 * n - 1), (population + cols, 2 * n - 1)):
+        counts = np.bincount((lineas + base * largo).ravel(), minlength=size * largo).reshape(size, largo)
+        h += (counts * (counts - 1) // 2).sum(axis=1)
+    return h
+
+def genetic_algorithm_numpy(individual, max_estados_explorados, population_size, mutation_rate=0.1, trace=None, seed=None, population=None):
+    # Misma dinámica que genetic_algorithm, con la población en un arreglo
+    # (individuos, n), el h de cada individuo calculado una sola vez y cruza y
+    # mutación aplicadas a toda la generación de una vez. `population` funciona
+    # igual que en genetic_algorithm (lista de tuplas que se continúa y actualiza)
+    import random
+
+    import numpy as np
+
+    n = len(individual)
+    if population_size == None:
+        population_size = n * 8
+    # Sin semilla explícita se toma de `random`, así random.seed sigue fijando la corrida
+    rng = np.random.default_rng(random.getrandbits(32) if seed is None else seed)
+    cols = np.arange(n)
+
+    def initialize_population(size):
+        population = np.unique(rng.integers(0, n, size=(size, n)), axis=0)
+        while len(population) < size:
+            extra = rng.integers(0, n, size=(size - len(population), n))
+            population = np.unique(np.concatenate((population, extra)), axis=0)
+        return population[rng.permutation(size)]
+
+    def two_positions(k):
+        # k pares de posiciones distintas y ordenadas, como sorted(random.sample(range(n), 2))
+        first = rng.integers(0, n, size=(k, 1))
+        second = rng.integers(0, n - 1, size=(k, 1))
+        second += second >= first
+        return np.minimum(first, second), np.maximum(first, second)
+
+    def select_parents(h, k):
+        # Ruleta con pesos 1 / (1 + h): una búsqueda binaria por padre sobre la suma acumulada
+        cumulative = np.cumsum(1 / (1 + h))
+        draws = rng.random(2 * k) * cumulative[-1]
+        indices = np.minimum(np.searchsorted(cumulative, draws, side="right"), len(h) - 1)
+        return indices[:k], indices[k:]
+
+    def order_crossover(parents1, parents2):
+        # Igual que en genetic_algorithm: el tramo [i, j) viene del primer padre y
+        # el resto de posiciones, en orden, de parent2[j:] + parent2[:j]
+        i, j = two_positions(len(parents1))
+        inside = (cols >= i) & (cols < j)
+        rank = np.where(cols < i, cols, cols - (j - i))
+        return np.where(inside, parents1, np.take_along_axis(parents2, (j + rank) % n, axis=1))
+
+    def mutate(children):
+        # Invierte el tramo [start, end] de cada hijo con probabilidad mutation_rate
+        mutan = np.flatnonzero(rng.random(len(children)) < mutation_rate) if n > 1 else np.empty(0, dtype=int)
+        if mutan.size:
+            start, end = two_positions(mutan.size)
+            inside = (cols >= start) & (cols <= end)
+            source = np.where(inside, start + end - cols, cols)
+            children[mutan] = np.take_along_axis(children[mutan], source, axis=1)
+        return children
+
+    output = population
+    if not output:
+        population = np.concatenate((initialize_population(population_size - 1), np.array([individual])))
+        estados_explorados = len(population)
+    else:
+        population = np.array(output, dtype=np.int64)
+        estados_explorados = 0
+    h = population_heuristic(population)
+    best = int(np.argmin(h))
+    best_individual, best_h = population[best], int(h[best])
+    if trace is not None and not output:
+        trace.append(best_h)
+
+    while estados_explorados < max_estados_explorados:
+        if best_h == 0:
+            break
+        k = min(len(population), max_estados_explorados - estados_explorados)
+        pairs = (k + 1) // 2
+        parents1, parents2 = select_parents(h, pairs)
+        p1, p2 = population[parents1], population[parents2]
+        # Hijos intercalados (hijo1, hijo2) por pareja, recortados al presupuesto
+        children = np.empty((2 * pairs, n), dtype=population.dtype)
+        children[0::2] = order_crossover(p1, p2)
+        children[1::2] = order_crossover(p2, p1)
+        children = mutate(children[:k])
+        estados_explorados += k
+
+        child_h = population_heuristic(children)
+        order = np.argsort(child_h, kind="stable")
+        population, h = children[order], child_h[order]
+        best_individual, best_h = population[0], int(h[0])
+        if trace is not None:
+            trace.append(best_h)
+
+    if output is not None:
+        output[:] = [tuple(int(queen) for queen in row) for row in population]
+    return tuple(int(queen) for queen in best_individual), best_h, estados_explorados
+
 def random_algorithm(state, max_estados_explorados, trace=None):
     import random
 
@@ -0,0 +1,304 @@
+"""Búsquedas locales de n-reinas repartidas en un pool de procesos.
+
+- `parallel_hill_climbing`: hill climbing con reinicios aleatorios, un
+  reinicio por tarea.
+- `island_search`: modelo de islas para el genético o el recocido simulado.
+  Cada isla corre por épocas y al final de cada época recibe individuos de
+  la isla anterior (migración en anillo); en el genético cada isla conserva
+  su población de una época a la otra.
+
+Las dos funciones respetan la convención de `n-reinas.py`:
+`(state, max_estados_explorados, trace=None, ...)` y devuelven
+`(mejor, h, estados_explorados)`. El presupuesto de estados es global: cada
+tarea reserva una parte antes de lanzarse y devuelve lo que no usó. Cuando
+una tarea llega a h = 0 se termina el pool y se descartan las demás. Cada
+tarea usa una semilla derivada de `seed` y de su número, así que cada
+reinicio o época es reproducible aunque cambie la cantidad de procesos.
+"""
+
+import importlib.util
+import os
+import queue
+import random
+from multiprocessing import Pool
+from pathlib import Path
+
+WORKERS = int(os.environ.get("RUN_WORKERS", os.cpu_count() or 1))
+
+_reinas = None
+
+
+def _modulo_reinas():
+    # n-reinas.py no es importable por nombre (tiene un guion)
+    global _reinas
+    if _reinas is None:
+        path = Path(__file__).with_name("n-reinas.py")
+        spec = importlib.util.spec_from_file_location("n_reinas", path)
+        _reinas = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(_reinas)
+    return _reinas
+
+
+def derive_seed(*parts):
+    """Entero de 32 bits determinista a partir de las partes dadas."""
+    return random.Random(":".join(str(part) for part in parts)).getrandbits(32)
+
+
+def _random_state(n, seed):
+    rng = random.Random(seed)
+    return tuple(rng.randrange(n) for _ in range(n))
+
+
+def _run_task(task):
+    """Corre una tarea en un proceso del pool y devuelve (id, mejor, h, estados, trace, extra)."""
+    kind, task_id, seed, state, budget, options = task
+    reinas = _modulo_reinas()
+    random.seed(seed)
+    trace = []
+    extra = None
+
+    if kind == "hc":
+        best, h, estados = reinas.hill_climbing(state, budget, trace=trace)
+    elif kind == "sa":
+        temp, cooling_rate = options["temp"], options["cooling_rate"]
+        best, h, estados = reinas.simulated_annealing(
+            state, budget, initial_temp=temp, cooling_rate=cooling_rate, trace=trace
+        )
+        # Una iteración de enfriamiento por estado explorado después del inicial
+        extra = temp * cooling_rate ** (estados - 1)
+    elif kind == "ga":
+        genetic = reinas.genetic_algorithm_numpy if options["numpy"] else reinas.genetic_algorithm
+        kwargs = {"seed": seed} if options["numpy"] else {}
+        # La población de la isla viaja con la tarea: None en la primera época
+        population = options["population"]
+        best, h, estados = genetic(state, budget, options["population_size"], trace=trace, population=population, **kwargs)
+        extra = population
+    else:
+        raise ValueError(f"Tipo de tarea desconocido: {kind}")
+
+    return task_id, tuple(best), h, estados, trace, extra
+
+
+class _Coordinator:
+    """Lanza tareas con apply_async y recibe los resultados a medida que terminan."""
+
+    def __init__(self, pool, max_estados_explorados):
+        self.pool = pool
+        self.resultados = queue.Queue()
+        self.en_vuelo = 0
+        self.usados = 0
+        self.reservados = 0
+        self.max_estados_explorados = max_estados_explorados
+
+    @property
+    def disponibles(self):
+        return self.max_estados_explorados - self.usados - self.reservados
+
+    def lanzar(self, task):
+        self.reservados += task[4]
+        self.en_vuelo += 1
+        self.pool.apply_async(_run_task, (task,), callback=self.resultados.put, error_callback=self.resultados.put)
+
+    def esperar(self, reservas):
+        """Próximo resultado; `reservas` mapea id de tarea -> presupuesto reservado."""
+        resultado = self.resultados.get()
+        self.en_vuelo -= 1
+        if isinstance(resultado, BaseException):
+            raise resultado
+        task_id, _, _, estados, _, _ = resultado
+        reservado = reservas.pop(task_id)
+        # Si ninguna tarea pasa de su reserva, el total nunca pasa de max_estados_explorados
+        if estados > reservado:
+            raise RuntimeError(f"La tarea {task_id} exploró {estados} estados con {reservado} reservados")
+        self.reservados -= reservado
+        self.usados += estados
+        return resultado
+
+
+def _merge_traces(traces):
+    """Mínimo elemento a elemento; las trazas cortas se extienden con su último valor."""
+    largo = max(len(trace) for trace in traces)
+    return [min(trace[min(i, len(trace) - 1)] for trace in traces) for i in range(largo)]
+
+
+def parallel_hill_climbing(state, max_estados_explorados, trace=None, workers=None, seed=0, restart_budget=None):
+    """Hill climbing con reinicios: el primero parte de `state` y el resto de estados al azar.
+
+    `restart_budget` acota los estados de cada reinicio (por defecto n**3).
+    La traza es la concatenación de las trazas de los reinicios en orden.
+    """
+    workers = workers or WORKERS
+    n = len(state)
+    restart_budget = restart_budget or max(n ** 3, 1)
+
+    mejor = (_modulo_reinas().heuristic(state), 0, tuple(state))
+    trazas = {}
+    with Pool(processes=workers) as pool:
+        coordinador = _Coordinator(pool, max_estados_explorados)
+        reservas = {}
+        siguiente = 0
+
+        def lanzar_reinicio():
+            nonlocal siguiente
+            budget = min(restart_budget, coordinador.disponibles)
+            if budget <= 0:
+                return False
+            task_seed = derive_seed(seed, "hc", siguiente)
+            inicio = tuple(state) if siguiente == 0 else _random_state(n, task_seed)
+            reservas[siguiente] = budget
+            coordinador.lanzar(("hc", siguiente, task_seed, inicio, budget, None))
+            siguiente += 1
+            return True
+
+        for _ in range(workers):
+            if not lanzar_reinicio():
+                break
+        while coordinador.en_vuelo:
+            task_id, best, h, _, task_trace, _ = coordinador.esperar(reservas)
+            trazas[task_id] = task_trace
+            mejor = min(mejor, (h, task_id, best))
+            if h == 0:
+                break  # al salir del with se terminan los procesos que siguen corriendo
+            lanzar_reinicio()
+        usados = coordinador.usados
+
+    if usados > max_estados_explorados:
+        raise RuntimeError(f"Se exploraron {usados} estados con un presupuesto de {max_estados_explorados}")
+    if trace is not None:
+        for task_id in sorted(trazas):
+            trace.extend(trazas[task_id])
+    h, _, best = mejor
+    return best, h, usados
+
+
+def island_search(
+    state,
+    max_estados_explorados,
+    trace=None,
+    algorithm="ga",
+    islands=None,
+    epoch_budget=None,
+    workers=None,
+    seed=0,
+    population_size=None,
+    initial_temp=1000,
+    cooling_rate=0.99,
+    migration_size=None,
+):
+    """Modelo de islas para `algorithm` ("ga" o "sa").
+
+    La isla 0 parte de `state` y las demás de estados al azar. Cada época
+    corre todas las islas con `epoch_budget` estados (por defecto una décima
+    parte de lo que le toca a cada isla) y al final hay migración en anillo.
+    La traza tiene, por época, el mínimo elemento a elemento de las trazas
+    de las islas.
+
+    En el genético cada isla conserva su población entre épocas (viaja con
+    cada tarea) y recibe los `migration_size` mejores individuos de la isla
+    anterior (por defecto un décimo de la población) en lugar de sus peores.
+    Las épocas son de generaciones completas: `epoch_budget` se redondea a un
+    múltiplo del tamaño de población y la primera época suma la población
+    inicial. Si el presupuesto no alcanza para una población por isla, se
+    usan menos islas (y, con una sola, una población más chica).
+
+    En el recocido cada isla adopta el mejor estado de la anterior si es
+    mejor que el propio, conserva su temperatura entre épocas y deja de
+    correr cuando se enfría.
+    """
+    if algorithm not in ("ga", "sa"):
+        raise ValueError(f"Algoritmo desconocido: {algorithm}")
+    workers = workers or WORKERS
+    islands = islands or workers
+    n = len(state)
+
+    options = {"cooling_rate": cooling_rate, "population_size": population_size}
+    if algorithm == "ga":
+        try:
+            import numpy  # noqa: F401
+        except ModuleNotFoundError:
+            options["numpy"] = False
+        else:
+            options["numpy"] = True
+        population_size = min(population_size or n * 8, max(max_estados_explorados, 1))
+        islands = max(min(islands, max_estados_explorados // population_size), 1)
+        options["population_size"] = population_size
+        migration_size = min(migration_size or max(population_size // 10, 1), population_size)
+        # Generaciones por época; cada una explora exactamente population_size estados
+        generaciones = max((epoch_budget or max_estados_explorados // (islands * 10)) // population_size, 1)
+    else:
+        epoch_budget = epoch_budget or max(max_estados_explorados // (islands * 10), 1)
+
+    estados = [tuple(state)] + [_random_state(n, derive_seed(seed, "isla", isla)) for isla in range(1, islands)]
+    heuristic = _modulo_reinas().heuristic
+    hs = [heuristic(estado) for estado in estados]
+    temps = [initial_temp] * islands
+    poblaciones = [[] for _ in range(islands)]
+    mejor = min((h, isla, estado) for isla, (h, estado) in enumerate(zip(hs, estados)))
+    if trace is not None:
+        trace.append(mejor[0])
+
+    with Pool(processes=min(workers, islands)) as pool:
+        coordinador = _Coordinator(pool, max_estados_explorados)
+        epoca = 0
+        while mejor[0] > 0:
+            activas = [isla for isla in range(islands) if algorithm == "ga" or temps[isla] > 1]
+            if not activas:
+                break
+            disponibles = coordinador.disponibles // len(activas)
+            if algorithm == "ga":
+                # La primera época también paga la población inicial
+                inicial = 0 if epoca else population_size
+                por_isla = inicial + min(generaciones, (disponibles - inicial) // population_size) * population_size
+                if por_isla <= 0 or por_isla > disponibles:
+                    break
+            else:
+                por_isla = min(epoch_budget, disponibles)
+                if por_isla <= 0:
+                    break
+
+            reservas = {}
+            for isla in activas:
+                task_options = dict(options, temp=temps[isla], population=poblaciones[isla])
+                reservas[isla] = por_isla
+                coordinador.lanzar((algorithm, isla, derive_seed(seed, algorithm, isla, epoca), estados[isla], por_isla, task_options))
+
+            trazas = []
+            while coordinador.en_vuelo:
+                isla, best, h, _, task_trace, extra = coordinador.esperar(reservas)
+                estados[isla], hs[isla] = best, h
+                if algorithm == "ga":
+                    poblaciones[isla] = extra
+                elif extra is not None:
+                    temps[isla] = extra
+                trazas.append(task_trace)
+                mejor = min(mejor, (h, isla, best))
+                if h == 0:
+                    break
+            if trace is not None:
+                trace.extend(_merge_traces(trazas))
+            if mejor[0] == 0:
+                break
+
+            if algorithm == "ga":
+                # Migración en anillo: los mejores de cada isla reemplazan a los peores de la siguiente
+                ordenadas = [sorted(poblacion, key=heuristic) for poblacion in poblaciones]
+                for isla in range(islands):
+                    propia = ordenadas[isla]
+                    presentes = set(propia)
+                    migrantes = [ind for ind in ordenadas[isla - 1][:migration_size] if ind not in presentes]
+                    if migrantes and islands > 1:
+                        poblaciones[isla] = propia[:len(propia) - len(migrantes)] + migrantes
+            else:
+                # Migración en anillo: cada isla recibe el mejor estado de la anterior
+                migrantes = list(zip(hs, estados))
+                for isla in range(islands):
+                    h_migrante, migrante = migrantes[isla - 1]
+                    if h_migrante < hs[isla]:
+                        estados[isla], hs[isla] = migrante, h_migrante
+            epoca += 1
+        usados = coordinador.usados
+
+    if usados > max_estados_explorados:
+        raise RuntimeError(f"Se exploraron {usados} estados con un presupuesto de {max_estados_explorados}")
+    h, _, best = mejor
+    return best, h, usados
@@ -0,0 +1,31 @@
+"""Carga los módulos de `code/`, que tienen guiones en el nombre."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+TESTS_DIR = Path(__file__).resolve().parent
+CODE_DIR = TESTS_DIR.parent / "code"
+sys.path.insert(0, str(CODE_DIR))
+sys.path.insert(0, str(TESTS_DIR))
+
+
+def cargar(nombre: str, archivo: str):
+    if nombre not in sys.modules:
+        spec = importlib.util.spec_from_file_location(nombre, CODE_DIR / archivo)
+        modulo = importlib.util.module_from_spec(spec)
+        sys.modules[nombre] = modulo
+        spec.loader.exec_module(modulo)
+    return sys.modules[nombre]
+
+
+@pytest.fixture(scope="session")
+def reinas():
+    return cargar("n_reinas", "n-reinas.py")
+
+
+@pytest.fixture(scope="session")
+def experimentos():
+    return cargar("n_reinas_experimentos", "n-reinas-experimentos.py")
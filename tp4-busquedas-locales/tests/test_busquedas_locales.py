@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+import referencia
+
+CASOS = [(semilla, n) for semilla in range(4) for n in (4, 8, 10)]
+
+
+def _estado(semilla, n):
+    rng = random.Random(f"estado:{semilla}:{n}")
+    return tuple(rng.randrange(n) for _ in range(n))
+
+
+def _correr(funcion, semilla, n, *args):
+    random.seed(semilla)
+    traza = []
+    mejor, h, estados = funcion(_estado(semilla, n), 8 * n * n, *args, trace=traza)
+    return tuple(mejor), h, estados, traza
+
+
+@pytest.mark.parametrize("nombre, args", [
+    ("hill_climbing", ()),
+    ("simulated_annealing", ()),
+    ("random_algorithm", ()),
+    ("genetic_algorithm", (None,)),
+])
+@pytest.mark.parametrize("semilla, n", CASOS)
+def test_igual_a_la_version_original(reinas, nombre, args, semilla, n):
+    assert _correr(getattr(reinas, nombre), semilla, n, *args) == _correr(getattr(referencia, nombre), semilla, n, *args)
+
+
+@pytest.mark.parametrize("semilla, n", CASOS)
+def test_heuristica(reinas, semilla, n):
+    estado = _estado(semilla, n)
+    assert reinas.heuristic(estado) == referencia.heuristic(estado)
+
+
+@pytest.mark.parametrize("semilla, n", CASOS)
+def test_min_conflicts(reinas, semilla, n):
+    mejor, h, estados, traza = _correr(reinas.min_conflicts, semilla, n)
+    assert h == referencia.heuristic(mejor) == traza[-1]
+    assert estados <= 8 * n * n
+
+
+@pytest.mark.parametrize("semilla, n", CASOS)
+def test_genetico_continua_la_poblacion(reinas, semilla, n):
+    random.seed(semilla)
+    poblacion = []
+    reinas.genetic_algorithm(_estado(semilla, n), 4 * n * n, None, population=poblacion)
+    # Queda la última generación, que puede estar cortada por el presupuesto
+    assert 0 < len(poblacion) <= 8 * n
+    # La población que se continúa ya está contada: solo suman los hijos
+    mejor, h, estados = reinas.genetic_algorithm(_estado(semilla, n), 2 * n * n, None, population=poblacion)
+    assert estados <= 2 * n * n
+    assert h == referencia.heuristic(mejor)
+    assert 0 < len(poblacion) <= 8 * n
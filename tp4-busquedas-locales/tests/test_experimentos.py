@@ -0,0 +1,64 @@
+import csv
+
+import pytest
+
+
+def _filas(path):
+    with path.open(newline="", encoding="utf-8") as archivo:
+        return list(csv.DictReader(archivo))
+
+
+def _sin_tiempo(filas):
+    return sorted(tuple(v for k, v in fila.items() if k != "time") for fila in filas)
+
+
+def test_reanuda_sin_repetir(experimentos, tmp_path):
+    csv_path = tmp_path / "runs.csv"
+    assert experimentos.ejecutar(["HC", "MC"], [6], corridas=3, semilla=1, csv_path=csv_path, directorio_trazas=None) == 6
+    assert experimentos.ejecutar(["HC", "MC"], [6], corridas=3, semilla=1, csv_path=csv_path, directorio_trazas=None) == 0
+    # Más corridas: solo se agregan las que faltan
+    assert experimentos.ejecutar(["HC", "MC"], [6], corridas=4, semilla=1, csv_path=csv_path, directorio_trazas=None) == 2
+    assert len(_filas(csv_path)) == 8
+
+
+def test_descarta_la_ultima_linea_cortada(experimentos, tmp_path):
+    csv_path = tmp_path / "runs.csv"
+    experimentos.ejecutar(["HC"], [6], corridas=3, semilla=1, csv_path=csv_path, directorio_trazas=None)
+    completo = csv_path.read_bytes()
+    csv_path.write_bytes(completo[:-10])
+    assert experimentos.ejecutar(["HC"], [6], corridas=3, semilla=1, csv_path=csv_path, directorio_trazas=None) == 1
+    assert _sin_tiempo(_filas(csv_path)) == _sin_tiempo(list(csv.DictReader(completo.decode().splitlines())))
+
+
+def test_la_semilla_separa_las_corridas(experimentos, tmp_path):
+    csv_path = tmp_path / "runs.csv"
+    experimentos.ejecutar(["SA"], [8], corridas=3, semilla=1, csv_path=csv_path, directorio_trazas=None)
+    # Otra semilla no cuenta las filas de la primera como hechas
+    assert experimentos.ejecutar(["SA"], [8], corridas=3, semilla=2, csv_path=csv_path, directorio_trazas=None) == 3
+    filas = _filas(csv_path)
+    assert sorted(fila["seed"] for fila in filas) == ["1"] * 3 + ["2"] * 3
+
+
+def test_resultados_reproducibles(experimentos, tmp_path):
+    for nombre, workers in (("uno.csv", 1), ("dos.csv", 2)):
+        experimentos.ejecutar(["HC", "SA", "GA"], [6], corridas=2, semilla=5, workers=workers,
+                              csv_path=tmp_path / nombre, directorio_trazas=None)
+    assert _sin_tiempo(_filas(tmp_path / "uno.csv")) == _sin_tiempo(_filas(tmp_path / "dos.csv"))
+
+
+def test_no_continua_un_csv_sin_semilla(experimentos, tmp_path):
+    csv_path = tmp_path / "viejo.csv"
+    csv_path.write_text("algorithm_name,env_n,size,best_solution,H,states,time\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        experimentos.ejecutar(["HC"], [6], corridas=1, semilla=0, csv_path=csv_path, directorio_trazas=None)
+
+
+def test_trazas_con_semilla_en_el_nombre(experimentos, tmp_path):
+    trazas = tmp_path / "traces"
+    for semilla in (1, 2):
+        experimentos.ejecutar(["HC"], [6], corridas=2, semilla=semilla, csv_path=tmp_path / "runs.csv", directorio_trazas=trazas)
+    archivos = sorted(path.name.split(".")[0] for path in trazas.iterdir())
+    assert archivos == ["HC_n6_s1_1", "HC_n6_s1_2", "HC_n6_s2_1", "HC_n6_s2_2"]
+    for path in trazas.iterdir():
+        traza = experimentos.cargar_traza(path)
+        assert traza and all(h >= 0 for h in traza)
@@ -0,0 +1,33 @@
+import pytest
+
+import parallel_search
+import referencia
+
+
+@pytest.mark.parametrize("maximo", [30, 200, 2000])
+def test_hill_climbing_paralelo_respeta_el_presupuesto(maximo):
+    estado = (0,) * 8
+    mejor, h, usados = parallel_search.parallel_hill_climbing(estado, maximo, workers=1, seed=3)
+    assert usados <= maximo
+    assert h == referencia.heuristic(mejor)
+
+
+@pytest.mark.parametrize("algoritmo", ["ga", "sa"])
+@pytest.mark.parametrize("maximo", [40, 500, 5000])
+def test_islas_respetan_el_presupuesto(algoritmo, maximo):
+    estado = (0,) * 10
+    traza = []
+    mejor, h, usados = parallel_search.island_search(estado, maximo, trace=traza, algorithm=algoritmo, islands=3, workers=1, seed=1)
+    assert usados <= maximo
+    assert h == referencia.heuristic(mejor)
+    assert traza
+
+
+@pytest.mark.parametrize("algoritmo", ["ga", "sa"])
+def test_islas_reproducibles_con_otra_cantidad_de_procesos(algoritmo):
+    estado = (0,) * 10
+    resultados = [
+        parallel_search.island_search(estado, 3000, algorithm=algoritmo, islands=3, workers=workers, seed=2)
+        for workers in (1, 2)
+    ]
+    assert resultados[0] == resultados[1]
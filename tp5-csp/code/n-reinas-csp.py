@@ -4,6 +4,13 @@ Se implementan dos variantes:
     a) Backtracking clásico verificando restricciones.
     b) Forward checking manteniendo los dominios actualizados.
 
+Las dos tienen además una versión con bits (tableros y dominios como enteros)
+que recorre el mismo árbol de búsqueda sin copiar estructuras.
+
+`n_reinas_csp` junta todo en un solo solver con estrategias intercambiables:
+orden de variables (fijo, MRV, grado), orden de valores (LCV), propagación
+(ninguna, forward checking o MAC con AC-3) y conflict-directed backjumping.
+
 La idea es que el código quede sencillo de leer y en línea con el estilo del TP.
 """
 
@@ -11,7 +18,7 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 # Una solución se guarda como tupla donde el índice es la columna y el valor la fila.
 Solution = Tuple[int, ...]
@@ -107,6 +114,72 @@ def n_reinas_backtracking(
     return soluciones
 
 
+def n_reinas_backtracking_bits(
+    n: int,
+    buscar_todas: bool = True,
+    rng: Optional[random.Random] = None,
+    stats: Optional[BusquedaStats] = None,
+) -> List[Solution]:
+    """Backtracking puro con las filas y diagonales ocupadas guardadas como bits.
+
+    Recorre las filas en el mismo orden que `n_reinas_backtracking` (y consume
+    `rng` igual), así que devuelve las mismas soluciones y registra la misma
+    cantidad de nodos. Cada chequeo de consistencia es una operación de bits y
+    deshacer una asignación no cuesta nada: las máscaras se pasan por valor.
+    """
+    completo = (1 << n) - 1
+    tablero: List[int] = [0] * n
+    soluciones: List[Solution] = []
+    contador = stats or BusquedaStats()
+
+    def backtrack(columna: int, filas: int, diagonales_bajan: int, diagonales_suben: int) -> bool:
+        if columna == n:
+            soluciones.append(tuple(tablero))
+            return not buscar_todas
+
+        # Filas atacadas por las reinas ya puestas; al avanzar una columna las
+        # diagonales se corren una fila
+        libres = completo & ~(filas | diagonales_bajan | diagonales_suben)
+
+        if rng is None:
+            # Solo se visitan las filas libres, de menor a mayor; los nodos de las
+            # filas descartadas se cuentan de una vez al salir
+            while libres:
+                bit = libres & -libres
+                libres ^= bit
+                tablero[columna] = bit.bit_length() - 1
+                if backtrack(
+                    columna + 1,
+                    filas | bit,
+                    ((diagonales_bajan | bit) << 1) & completo,
+                    (diagonales_suben | bit) >> 1,
+                ):
+                    contador.nodos_explorados += tablero[columna] + 1
+                    return True
+            contador.nodos_explorados += n
+            return False
+
+        orden = list(range(n))
+        rng.shuffle(orden)
+        for fila in orden:
+            contador.registrar_nodo()
+            bit = 1 << fila
+            if not libres & bit:
+                continue
+            tablero[columna] = fila
+            if backtrack(
+                columna + 1,
+                filas | bit,
+                ((diagonales_bajan | bit) << 1) & completo,
+                (diagonales_suben | bit) >> 1,
+            ):
+                return True
+        return False
+
+    backtrack(0, 0, 0, 0)
+    return soluciones
+
+
 # ---------------------------------------------------------------------------
 # Forward checking
 # ---------------------------------------------------------------------------
@@ -155,10 +228,9 @@ def n_reinas_forward_checking(
             soluciones.append(guardar_solucion(tablero, n))
             return not buscar_todas
 
-        filas = list(dominios[columna])
-        if rng is None:
-            filas.sort()
-        else:
+        # Con `rng` se baraja partiendo del dominio ordenado, no del orden del set
+        filas = sorted(dominios[columna])
+        if rng is not None:
             rng.shuffle(filas)
 
         for fila in filas:
@@ -184,6 +256,410 @@ def n_reinas_forward_checking(
     return soluciones
 
 
+def n_reinas_forward_checking_bits(
+    n: int,
+    buscar_todas: bool = True,
+    rng: Optional[random.Random] = None,
+    stats: Optional[BusquedaStats] = None,
+) -> List[Solution]:
+    """Forward checking con dominios como bits y un rastro para deshacer.
+
+    Cada dominio es un entero (bit i = fila i disponible). Al asignar se quitan
+    las filas amenazadas solo de las columnas futuras y se anota qué se quitó
+    de cada una; al volver atrás se reponen en el lugar, sin copiar dominios.
+    Explora los mismos nodos que `n_reinas_forward_checking`.
+
+    Con `rng` las dos versiones barajan las filas del dominio partiendo del
+    orden ascendente, así que también coinciden con la misma semilla;
+    `verificar_forward_checking_bits` compara los nodos con la versión original.
+    """
+    dominios: List[int] = [(1 << n) - 1] * n
+    tablero: List[int] = [0] * n
+    soluciones: List[Solution] = []
+    contador = stats or BusquedaStats()
+    rastro: List[int] = []  # columnas futuras tocadas, en orden
+    bajas: List[List[int]] = [[] for _ in range(n)]  # por columna: filas quitadas por cada asignación
+
+    def propagar(columna: int, fila: int) -> bool:
+        bit = 1 << fila
+        for futura in range(columna + 1, n):
+            distancia = futura - columna
+            # Fila actual y diagonales amenazadas; los bits fuera del tablero se pierden
+            quitadas = dominios[futura] & (bit | bit << distancia | bit >> distancia)
+            if quitadas:
+                dominios[futura] ^= quitadas
+                rastro.append(futura)
+                bajas[futura].append(quitadas)
+                if not dominios[futura]:
+                    return False
+        return True
+
+    def deshacer(marca: int) -> None:
+        while len(rastro) > marca:
+            futura = rastro.pop()
+            dominios[futura] |= bajas[futura].pop()
+
+    def forward(columna: int) -> bool:
+        if columna == n:
+            soluciones.append(tuple(tablero))
+            return not buscar_todas
+
+        dominio = dominios[columna]
+        filas = [fila for fila in range(n) if dominio >> fila & 1]
+        if rng is not None:
+            rng.shuffle(filas)
+
+        for fila in filas:
+            # Las filas del dominio ya son consistentes con el tablero
+            contador.registrar_nodo()
+
+            marca = len(rastro)
+            if propagar(columna, fila):
+                tablero[columna] = fila
+                if forward(columna + 1):
+                    return True
+            deshacer(marca)
+
+        return False
+
+    forward(0)
+    return soluciones
+
+
+def verificar_forward_checking_bits(n: int, semillas: Tuple[int, ...] = (0, 1, 2, 3, 4), buscar_todas: bool = False) -> None:
+    """Compara soluciones y nodos de las dos versiones de forward checking.
+
+    Lanza AssertionError si alguna semilla (o la corrida sin semilla) difiere.
+    """
+    for semilla in (None, *semillas):
+        resultados = []
+        for forward_checking in (n_reinas_forward_checking, n_reinas_forward_checking_bits):
+            stats = BusquedaStats()
+            rng = None if semilla is None else random.Random(semilla)
+            soluciones = forward_checking(n, buscar_todas=buscar_todas, rng=rng, stats=stats)
+            resultados.append((soluciones, stats.nodos_explorados))
+        if resultados[0] != resultados[1]:
+            raise AssertionError(
+                f"Forward checking con bits difiere del original para n={n}, semilla={semilla}: "
+                f"{resultados[1][1]} nodos contra {resultados[0][1]}"
+            )
+
+
+# ---------------------------------------------------------------------------
+# Solver con estrategias intercambiables
+# ---------------------------------------------------------------------------
+
+DETENER = -1  # valor de retorno de la búsqueda cuando no hay que seguir
+
+
+def _cantidad(mascara: int) -> int:
+    return bin(mascara).count("1")
+
+
+def _filas_de(mascara: int) -> List[int]:
+    filas = []
+    while mascara:
+        bit = mascara & -mascara
+        mascara ^= bit
+        filas.append(bit.bit_length() - 1)
+    return filas
+
+
+def _amenazas(fila: int, distancia: int) -> int:
+    """Filas que una reina en `fila` ataca en una columna a `distancia` de la suya."""
+    bit = 1 << fila
+    return bit | bit << distancia | bit >> distancia
+
+
+class EstadoCSP:
+    """Estado que comparten el solver y las estrategias.
+
+    Los dominios son enteros (bit i = fila i posible) y las columnas sin
+    asignar, una máscara. Las bajas de dominio se anotan en `rastro` para
+    deshacerlas en el lugar; `culpables[c]` es la máscara de columnas asignadas
+    que quitaron filas del dominio de c (lo usa el backjumping). Además se
+    llevan las filas y diagonales ocupadas para chequear consistencia en O(1)
+    cuando no se propaga.
+    """
+
+    __slots__ = (
+        "n",
+        "dominios",
+        "culpables",
+        "tablero",
+        "sin_asignar",
+        "filas",
+        "diagonales_bajan",
+        "diagonales_suben",
+        "rastro",
+    )
+
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self.dominios: List[int] = [(1 << n) - 1] * n
+        self.culpables: List[int] = [0] * n
+        self.tablero: List[int] = [-1] * n
+        self.sin_asignar = (1 << n) - 1
+        self.filas = 0
+        self.diagonales_bajan = 0  # bit fila - columna + n - 1
+        self.diagonales_suben = 0  # bit fila + columna
+        self.rastro: List[Tuple[int, int, int]] = []  # (columna, filas quitadas, culpables previos)
+
+    def columnas_sin_asignar(self) -> List[int]:
+        return _filas_de(self.sin_asignar)
+
+    def vivos(self, columna: int) -> int:
+        """Filas del dominio de `columna` compatibles con las reinas ya puestas."""
+        ocupadas = self.filas | self.diagonales_bajan >> (self.n - 1 - columna) | self.diagonales_suben >> columna
+        return self.dominios[columna] & ~ocupadas
+
+    def consistente(self, columna: int, fila: int) -> bool:
+        return (
+            not self.filas >> fila & 1
+            and not self.diagonales_bajan >> (fila - columna + self.n - 1) & 1
+            and not self.diagonales_suben >> (fila + columna) & 1
+        )
+
+    def atacantes(self, columna: int, fila: int) -> int:
+        """Máscara de columnas asignadas que atacan (columna, fila)."""
+        mascara = 0
+        for otra, otra_fila in enumerate(self.tablero):
+            if otra_fila >= 0 and (otra_fila == fila or abs(otra_fila - fila) == abs(otra - columna)):
+                mascara |= 1 << otra
+        return mascara
+
+    def colocar(self, columna: int, fila: int) -> None:
+        self.tablero[columna] = fila
+        self.sin_asignar ^= 1 << columna
+        self.filas |= 1 << fila
+        self.diagonales_bajan |= 1 << (fila - columna + self.n - 1)
+        self.diagonales_suben |= 1 << (fila + columna)
+
+    def retirar(self, columna: int, fila: int) -> None:
+        self.tablero[columna] = -1
+        self.sin_asignar |= 1 << columna
+        self.filas ^= 1 << fila
+        self.diagonales_bajan ^= 1 << (fila - columna + self.n - 1)
+        self.diagonales_suben ^= 1 << (fila + columna)
+
+    def quitar(self, columna: int, quitadas: int, culpables: int) -> bool:
+        """Saca `quitadas` del dominio; devuelve False si el dominio quedó vacío."""
+        self.rastro.append((columna, quitadas, self.culpables[columna]))
+        self.dominios[columna] ^= quitadas
+        self.culpables[columna] |= culpables
+        return bool(self.dominios[columna])
+
+    def deshacer(self, marca: int) -> None:
+        rastro = self.rastro
+        while len(rastro) > marca:
+            columna, quitadas, culpables = rastro.pop()
+            self.dominios[columna] |= quitadas
+            self.culpables[columna] = culpables
+
+
+# Orden de variables: reciben el estado y devuelven la próxima columna a asignar.
+
+def variable_fija(estado: EstadoCSP) -> int:
+    """Columnas de izquierda a derecha, como `n_reinas_backtracking`."""
+    sin_asignar = estado.sin_asignar
+    return (sin_asignar & -sin_asignar).bit_length() - 1
+
+
+def grado(estado: EstadoCSP, columna: int) -> int:
+    """Pares de filas prohibidos entre `columna` y las demás columnas sin asignar.
+
+    El grafo de restricciones de N-reinas es completo, así que contar vecinos no
+    distingue columnas; contar pares prohibidos (n por fila más n - d por cada
+    diagonal, a distancia d) sí: las columnas centrales restringen más.
+    """
+    n = estado.n
+    return sum(3 * n - 2 * abs(otra - columna) for otra in estado.columnas_sin_asignar() if otra != columna)
+
+
+def variable_mrv(estado: EstadoCSP) -> int:
+    """Mínimos valores restantes; empata la columna más a la izquierda."""
+    return min(estado.columnas_sin_asignar(), key=lambda columna: _cantidad(estado.vivos(columna)))
+
+
+def variable_grado(estado: EstadoCSP) -> int:
+    """Mayor grado (ver `grado`); empata la columna más a la izquierda."""
+    return max(estado.columnas_sin_asignar(), key=lambda columna: (grado(estado, columna), -columna))
+
+
+def variable_mrv_grado(estado: EstadoCSP) -> int:
+    """MRV desempatando por grado."""
+    return min(
+        estado.columnas_sin_asignar(),
+        key=lambda columna: (_cantidad(estado.vivos(columna)), -grado(estado, columna), columna),
+    )
+
+
+# Orden de valores: filas del dominio de la columna en el orden a probar.
+
+def valores_en_orden(estado: EstadoCSP, columna: int, rng: Optional[random.Random]) -> List[int]:
+    """Filas de menor a mayor, o mezcladas si hay `rng`."""
+    filas = _filas_de(estado.dominios[columna])
+    if rng is not None:
+        rng.shuffle(filas)
+    return filas
+
+
+def valores_lcv(estado: EstadoCSP, columna: int, rng: Optional[random.Random]) -> List[int]:
+    """Menos restrictivo primero: las filas que quitan menos valores a las columnas sin asignar."""
+    filas = valores_en_orden(estado, columna, rng)
+    vivos = [(otra, estado.vivos(otra)) for otra in estado.columnas_sin_asignar() if otra != columna]
+
+    def quitaria(fila: int) -> int:
+        return sum(_cantidad(dominio & _amenazas(fila, abs(otra - columna))) for otra, dominio in vivos)
+
+    return sorted(filas, key=quitaria)
+
+
+# Propagación: se llama después de colocar (columna, fila). Devuelve None si no
+# vació ningún dominio, o los culpables del dominio vaciado.
+
+def sin_propagacion(estado: EstadoCSP, columna: int, fila: int) -> Optional[int]:
+    return None
+
+
+def propagar_forward_checking(estado: EstadoCSP, columna: int, fila: int) -> Optional[int]:
+    """Quita de cada columna sin asignar las filas que ataca la reina nueva."""
+    causa = 1 << columna
+    dominios = estado.dominios
+    for futura in estado.columnas_sin_asignar():
+        quitadas = dominios[futura] & _amenazas(fila, abs(futura - columna))
+        if quitadas and not estado.quitar(futura, quitadas, causa):
+            return estado.culpables[futura]
+    return None
+
+
+def propagar_mac(estado: EstadoCSP, columna: int, fila: int) -> Optional[int]:
+    """Forward checking y después AC-3 entre las columnas sin asignar (MAC).
+
+    Una fila de la columna i pierde todo soporte en la columna j solo si el
+    dominio de j tiene 3 filas o menos (cada reina ataca a lo sumo 3 filas de
+    otra columna), así que solo esas columnas entran a la cola. La explicación
+    de cada baja son los culpables del dominio de j.
+    """
+    marca = len(estado.rastro)
+    fallo = propagar_forward_checking(estado, columna, fila)
+    if fallo is not None:
+        return fallo
+
+    dominios = estado.dominios
+    cola = [tocada for tocada, _, _ in estado.rastro[marca:] if _cantidad(dominios[tocada]) <= 3]
+    en_cola = set(cola)
+    while cola:
+        j = cola.pop()
+        en_cola.discard(j)
+        soporte = dominios[j]
+        if _cantidad(soporte) > 3 or estado.tablero[j] >= 0:
+            continue
+        for i in estado.columnas_sin_asignar():
+            if i == j:
+                continue
+            distancia = abs(i - j)
+            quitadas = 0
+            for valor in _filas_de(dominios[i]):
+                if not soporte & ~_amenazas(valor, distancia):
+                    quitadas |= 1 << valor
+            if not quitadas:
+                continue
+            if not estado.quitar(i, quitadas, estado.culpables[j]):
+                return estado.culpables[i]
+            if i not in en_cola and _cantidad(dominios[i]) <= 3:
+                cola.append(i)
+                en_cola.add(i)
+    return None
+
+
+ORDENES_VARIABLE: Dict[str, Callable[[EstadoCSP], int]] = {
+    "fija": variable_fija,
+    "mrv": variable_mrv,
+    "grado": variable_grado,
+    "mrv_grado": variable_mrv_grado,
+}
+ORDENES_VALOR: Dict[str, Callable[[EstadoCSP, int, Optional[random.Random]], List[int]]] = {
+    "orden": valores_en_orden,
+    "lcv": valores_lcv,
+}
+PROPAGACIONES: Dict[str, Callable[[EstadoCSP, int, int], Optional[int]]] = {
+    "ninguna": sin_propagacion,
+    "fc": propagar_forward_checking,
+    "mac": propagar_mac,
+}
+
+
+def n_reinas_csp(
+    n: int,
+    buscar_todas: bool = True,
+    rng: Optional[random.Random] = None,
+    stats: Optional[BusquedaStats] = None,
+    variables: str = "fija",
+    valores: str = "orden",
+    propagacion: str = "fc",
+    backjumping: bool = False,
+) -> List[Solution]:
+    """Búsqueda en profundidad con las estrategias elegidas por nombre.
+
+    `variables`, `valores` y `propagacion` son claves de `ORDENES_VARIABLE`,
+    `ORDENES_VALOR` y `PROPAGACIONES`; con `backjumping` se usa
+    conflict-directed backjumping: cada nivel devuelve su conjunto de conflicto
+    y, si la columna de arriba no está en él, se la saltea. Cada fila probada
+    cuenta un nodo, así que con las opciones por defecto (y sin `rng`) los
+    conteos coinciden con `n_reinas_forward_checking`, y con
+    `propagacion="ninguna"` con `n_reinas_backtracking`.
+    """
+    elegir_variable = ORDENES_VARIABLE[variables]
+    ordenar_valores = ORDENES_VALOR[valores]
+    propagar = PROPAGACIONES[propagacion]
+
+    estado = EstadoCSP(n)
+    soluciones: List[Solution] = []
+    contador = stats or BusquedaStats()
+
+    def buscar() -> int:
+        """DETENER, o la máscara de columnas asignadas que explican el fracaso."""
+        if not estado.sin_asignar:
+            soluciones.append(tuple(estado.tablero))
+            # Después de una solución se vuelve atrás de a un nivel
+            return DETENER if not buscar_todas else (1 << n) - 1
+
+        columna = elegir_variable(estado)
+        bit_columna = 1 << columna
+        conflicto = estado.culpables[columna]
+        for fila in ordenar_valores(estado, columna, rng):
+            contador.registrar_nodo()
+
+            if not estado.consistente(columna, fila):
+                if backjumping:
+                    conflicto |= estado.atacantes(columna, fila)
+                continue
+
+            marca = len(estado.rastro)
+            estado.colocar(columna, fila)
+            fallo = propagar(estado, columna, fila)
+            if fallo is None:
+                resultado = buscar()
+                if resultado == DETENER:
+                    return DETENER
+                if backjumping and not resultado & bit_columna:
+                    # Esta columna no participa del conflicto: saltar por encima
+                    estado.retirar(columna, fila)
+                    estado.deshacer(marca)
+                    return resultado
+                conflicto |= resultado
+            else:
+                conflicto |= fallo
+            estado.retirar(columna, fila)
+            estado.deshacer(marca)
+
+        return conflicto & ~bit_columna
+
+    buscar()
+    return soluciones
+
+
 # ---------------------------------------------------------------------------
 # Pequeño ejecutable
 # ---------------------------------------------------------------------------
@@ -214,10 +690,26 @@ if __name__ == "__main__":
         action="store_true",
         help="Encuentra todas las soluciones en lugar de detenerse en la primera.",
     )
+    parser.add_argument(
+        "--bits",
+        action="store_true",
+        help="Usa las versiones con bits (recomendado para --all con n grande).",
+    )
+    parser.add_argument(
+        "--verificar",
+        action="store_true",
+        help="Compara nodos y soluciones de forward checking con y sin bits para varias semillas.",
+    )
     opciones = parser.parse_args()
 
-    soluciones_backtracking = n_reinas_backtracking(opciones.n, buscar_todas=opciones.all)
-    soluciones_forward = n_reinas_forward_checking(opciones.n, buscar_todas=opciones.all)
+    if opciones.verificar:
+        verificar_forward_checking_bits(opciones.n, buscar_todas=opciones.all)
+        print(f"Forward checking con bits coincide con el original para n={opciones.n}.")
+
+    backtracking = n_reinas_backtracking_bits if opciones.bits else n_reinas_backtracking
+    soluciones_backtracking = backtracking(opciones.n, buscar_todas=opciones.all)
+    forward_checking = n_reinas_forward_checking_bits if opciones.bits else n_reinas_forward_checking
+    soluciones_forward = forward_checking(opciones.n, buscar_todas=opciones.all)
 
     print(f"Backtracking encontró {len(soluciones_backtracking)} solución(es).")
     if soluciones_backtracking:
@@ -6,18 +6,25 @@ Genera:
     - Un CSV con todos los resultados en `tp5-Nreinas.csv`.
     - Estadísticas resumidas impresas por consola.
     - Boxplots de tiempos y nodos guardados en `images/`.
+
+Con `--combinations` se agrega una entrada por cada combinación de estrategias
+de `n_reinas_csp` (orden de variables, orden de valores, propagación y
+backjumping); `--sizes` y `--seeds` permiten llevar el barrido a n = 30 o más.
 """
 
 from __future__ import annotations
 
+import argparse
 import csv
+import functools
 import importlib.util
+import itertools
 import random
 import statistics
 import sys
 import time
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Callable, Dict, Iterable, List, Tuple
 
 try:
     import matplotlib.pyplot as plt
@@ -41,20 +48,51 @@ spec.loader.exec_module(n_reinas_csp)
 
 BusquedaStats = n_reinas_csp.BusquedaStats
 n_reinas_backtracking = n_reinas_csp.n_reinas_backtracking
+n_reinas_backtracking_bits = n_reinas_csp.n_reinas_backtracking_bits
 n_reinas_forward_checking = n_reinas_csp.n_reinas_forward_checking
+n_reinas_forward_checking_bits = n_reinas_csp.n_reinas_forward_checking_bits
+n_reinas_csp_solver = n_reinas_csp.n_reinas_csp
 
 ALGORITMOS = {
     "backtracking": n_reinas_backtracking,
+    "backtracking_bits": n_reinas_backtracking_bits,
     "forward_checking": n_reinas_forward_checking,
+    "forward_checking_bits": n_reinas_forward_checking_bits,
 }
 
-
-def ejecutar_experimentos() -> List[Dict[str, object]]:
+Algoritmo = Callable[..., List[Tuple[int, ...]]]
+
+
+def combinaciones_csp() -> Dict[str, Algoritmo]:
+    """Una entrada por combinación de estrategias de `n_reinas_csp`."""
+    algoritmos: Dict[str, Algoritmo] = {}
+    for variables, valores, propagacion, backjumping in itertools.product(
+        n_reinas_csp.ORDENES_VARIABLE,
+        n_reinas_csp.ORDENES_VALOR,
+        n_reinas_csp.PROPAGACIONES,
+        (False, True),
+    ):
+        nombre = f"csp_{variables}_{valores}_{propagacion}" + ("_cbj" if backjumping else "")
+        algoritmos[nombre] = functools.partial(
+            n_reinas_csp_solver,
+            variables=variables,
+            valores=valores,
+            propagacion=propagacion,
+            backjumping=backjumping,
+        )
+    return algoritmos
+
+
+def ejecutar_experimentos(
+    algoritmos: Dict[str, Algoritmo] = ALGORITMOS,
+    tamanios: List[int] = TAMANIOS,
+    semillas: List[int] = SEEDS,
+) -> List[Dict[str, object]]:
     resultados: List[Dict[str, object]] = []
 
-    for n in TAMANIOS:
-        for nombre, funcion in ALGORITMOS.items():
-            for seed in SEEDS:
+    for n in tamanios:
+        for nombre, funcion in algoritmos.items():
+            for seed in semillas:
                 rng = random.Random(seed)
                 stats = BusquedaStats()
 
@@ -90,11 +128,15 @@ def guardar_csv(resultados: Iterable[Dict[str, object]]) -> None:
             escritor.writerow(fila)
 
 
-def resumen_estadistico(resultados: List[Dict[str, object]]) -> None:
+def resumen_estadistico(
+    resultados: List[Dict[str, object]],
+    algoritmos: Iterable[str] = ALGORITMOS,
+    tamanios: List[int] = TAMANIOS,
+) -> None:
     print("\n=== Estadísticas por algoritmo y tamaño ===")
-    for n in TAMANIOS:
+    for n in tamanios:
         print(f"\nTablero de {n} reinas")
-        for nombre in ALGORITMOS:
+        for nombre in algoritmos:
             datos = [r for r in resultados if r["n"] == n and r["algoritmo"] == nombre]
             if not datos:
                 continue
@@ -128,19 +170,23 @@ def _promedio_y_std(valores: List[float]) -> Tuple[float, float]:
     return statistics.mean(valores), statistics.stdev(valores)
 
 
-def generar_boxplots(resultados: List[Dict[str, object]]) -> None:
+def generar_boxplots(
+    resultados: List[Dict[str, object]],
+    algoritmos: Iterable[str] = ALGORITMOS,
+    tamanios: List[int] = TAMANIOS,
+) -> None:
     if plt is None:
         print("\nNo se generaron boxplots: matplotlib no está disponible.")
         return
 
     IMAGES_DIR.mkdir(exist_ok=True)
 
-    for n in TAMANIOS:
+    for n in tamanios:
         datos_n = [r for r in resultados if r["n"] == n]
         if not datos_n:
             continue
 
-        etiquetas = list(ALGORITMOS.keys())
+        etiquetas = list(algoritmos)
 
         # Boxplot de tiempos
         fig, ax = plt.subplots()
@@ -149,6 +195,7 @@ def generar_boxplots(resultados: List[Dict[str, object]]) -> None:
             for nombre in etiquetas
         ]
         ax.boxplot(series_tiempos, labels=etiquetas)
+        ax.tick_params(axis="x", labelrotation=90 if len(etiquetas) > 4 else 0)
         ax.set_title(f"Tiempos de ejecución - {n} reinas")
         ax.set_ylabel("Tiempo (segundos)")
         fig.tight_layout()
@@ -162,6 +209,7 @@ def generar_boxplots(resultados: List[Dict[str, object]]) -> None:
             for nombre in etiquetas
         ]
         ax.boxplot(series_nodos, labels=etiquetas)
+        ax.tick_params(axis="x", labelrotation=90 if len(etiquetas) > 4 else 0)
         ax.set_title(f"Nodos explorados - {n} reinas")
         ax.set_ylabel("Cantidad de nodos")
         fig.tight_layout()
@@ -170,11 +218,25 @@ def generar_boxplots(resultados: List[Dict[str, object]]) -> None:
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Experimentos de N-reinas con CSP.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=TAMANIOS, help="Tamaños de tablero.")
+    parser.add_argument("--seeds", type=int, default=len(SEEDS), help="Cantidad de semillas por algoritmo.")
+    parser.add_argument(
+        "--combinations",
+        action="store_true",
+        help="Agrega todas las combinaciones de estrategias de n_reinas_csp.",
+    )
+    opciones = parser.parse_args()
+
+    algoritmos = dict(ALGORITMOS)
+    if opciones.combinations:
+        algoritmos.update(combinaciones_csp())
+
     IMAGES_DIR.mkdir(exist_ok=True)
-    resultados = ejecutar_experimentos()
+    resultados = ejecutar_experimentos(algoritmos, opciones.sizes, list(range(opciones.seeds)))
     guardar_csv(resultados)
-    resumen_estadistico(resultados)
-    generar_boxplots(resultados)
+    resumen_estadistico(resultados, algoritmos, opciones.sizes)
+    generar_boxplots(resultados, algoritmos, opciones.sizes)
     print(f"\nResultados guardados en: {CSV_PATH}")
     print(f"Gráficos disponibles en: {IMAGES_DIR}")
 
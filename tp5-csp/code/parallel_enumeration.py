@@ -0,0 +1,228 @@
+"""Enumeración de todas las soluciones de N-reinas repartida en un pool de procesos.
+
+El árbol se parte por prefijos: cada tarea fija las filas de las primeras
+columnas y recorre el resto con tableros de bits. La simetría de espejo
+(fila r -> n - 1 - r) divide el trabajo a la mitad: solo se exploran los
+prefijos con la reina de la columna 0 en la mitad superior (y, si n es impar
+y esa reina está en la fila del medio, con la de la columna 1 en la mitad
+superior); cada solución encontrada cuenta también por su espejo.
+
+- `contar_soluciones`: solo cuenta, sin armar ninguna solución.
+- `iterar_soluciones`: generador; las tareas devuelven bloques empaquetados
+  y las soluciones se desempaquetan a medida que se consumen.
+- `guardar_soluciones` / `leer_soluciones`: archivo binario compacto con cada
+  solución empaquetada en ceil(n * bits / 8) bytes.
+
+Las soluciones salen como tuplas (índice = columna, valor = fila), igual que
+en `n-reinas-csp.py`, agrupadas por prefijo.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+Solution = Tuple[int, ...]
+Tarea = Tuple[int, Tuple[int, ...], bool]  # (n, prefijo, contar el espejo)
+
+WORKERS = int(os.environ.get("RUN_WORKERS", os.cpu_count() or 1))
+PROFUNDIDAD = 2  # columnas fijadas por tarea
+MAGIA = b"NQS1"
+
+
+def _bits_por_fila(n: int) -> int:
+    return max((n - 1).bit_length(), 1)
+
+
+def _ancho(n: int) -> int:
+    """Bytes por solución empaquetada."""
+    return (n * _bits_por_fila(n) + 7) // 8
+
+
+def empaquetar(solucion: Solution, n: int) -> bytes:
+    bits = _bits_por_fila(n)
+    valor = 0
+    for fila in reversed(solucion):
+        valor = valor << bits | fila
+    return valor.to_bytes(_ancho(n), "little")
+
+
+def desempaquetar(bloque: bytes, n: int) -> Iterator[Solution]:
+    bits, ancho = _bits_por_fila(n), _ancho(n)
+    mascara = (1 << bits) - 1
+    for inicio in range(0, len(bloque), ancho):
+        valor = int.from_bytes(bloque[inicio:inicio + ancho], "little")
+        yield tuple((valor >> (bits * columna)) & mascara for columna in range(n))
+
+
+def _mascaras(n: int, prefijo: Tuple[int, ...]) -> Tuple[int, int, int]:
+    """Filas y diagonales atacadas en la columna siguiente al prefijo."""
+    completo = (1 << n) - 1
+    filas = bajan = suben = 0
+    for fila in prefijo:
+        bit = 1 << fila
+        filas |= bit
+        bajan = ((bajan | bit) << 1) & completo
+        suben = (suben | bit) >> 1
+    return filas, bajan, suben
+
+
+def _contar(completo: int, filas: int, bajan: int, suben: int) -> int:
+    if filas == completo:
+        return 1
+    total = 0
+    libres = completo & ~(filas | bajan | suben)
+    while libres:
+        bit = libres & -libres
+        libres ^= bit
+        total += _contar(completo, filas | bit, ((bajan | bit) << 1) & completo, (suben | bit) >> 1)
+    return total
+
+
+def _contar_tarea(tarea: Tarea) -> int:
+    n, prefijo, espejo = tarea
+    cantidad = _contar((1 << n) - 1, *_mascaras(n, prefijo))
+    return cantidad * 2 if espejo else cantidad
+
+
+def _bloque_tarea(tarea: Tarea) -> bytes:
+    """Soluciones de la tarea (y sus espejos) empaquetadas una detrás de otra."""
+    n, prefijo, espejo = tarea
+    completo = (1 << n) - 1
+    tablero = list(prefijo) + [0] * (n - len(prefijo))
+    salida = bytearray()
+
+    def extender(columna: int, filas: int, bajan: int, suben: int) -> None:
+        if columna == n:
+            solucion = tuple(tablero)
+            salida.extend(empaquetar(solucion, n))
+            if espejo:
+                salida.extend(empaquetar(tuple(n - 1 - fila for fila in solucion), n))
+            return
+        libres = completo & ~(filas | bajan | suben)
+        while libres:
+            bit = libres & -libres
+            libres ^= bit
+            tablero[columna] = bit.bit_length() - 1
+            extender(columna + 1, filas | bit, ((bajan | bit) << 1) & completo, (suben | bit) >> 1)
+
+    extender(len(prefijo), *_mascaras(n, prefijo))
+    return bytes(salida)
+
+
+def tareas(n: int, profundidad: int = PROFUNDIDAD) -> List[Tarea]:
+    """Prefijos consistentes de `profundidad` columnas que cubren la mitad del árbol."""
+    if n <= 1:
+        return [(n, tuple(range(n)), False)]
+    profundidad = min(max(profundidad, 2), n)
+    medio = n // 2
+    resultado: List[Tarea] = []
+
+    def extender(prefijo: Tuple[int, ...]) -> None:
+        if len(prefijo) == profundidad:
+            resultado.append((n, prefijo, True))
+            return
+        columna = len(prefijo)
+        for fila in range(n):
+            if any(f == fila or abs(f - fila) == columna - c for c, f in enumerate(prefijo)):
+                continue
+            extender(prefijo + (fila,))
+
+    for fila in range(medio):
+        extender((fila,))
+    if n % 2:
+        # Reina de la columna 0 en el medio: el espejo cambia la mitad de la columna 1
+        for fila in range(medio):
+            if abs(fila - medio) > 1:
+                extender((medio, fila))
+    return resultado
+
+
+def _mapear(funcion, n: int, workers: Optional[int], profundidad: int) -> Iterator:
+    trabajos = tareas(n, profundidad)
+    workers = workers or WORKERS
+    if workers <= 1:
+        for trabajo in trabajos:
+            yield funcion(trabajo)
+        return
+    with Pool(processes=workers) as pool:
+        # imap respeta el orden de los prefijos; salir antes termina el pool
+        yield from pool.imap(funcion, trabajos)
+
+
+def contar_soluciones(n: int, workers: Optional[int] = None, profundidad: int = PROFUNDIDAD) -> int:
+    """Cantidad de soluciones sin construir ninguna."""
+    return sum(_mapear(_contar_tarea, n, workers, profundidad))
+
+
+def iterar_soluciones(
+    n: int,
+    workers: Optional[int] = None,
+    profundidad: int = PROFUNDIDAD,
+) -> Iterator[Solution]:
+    """Genera todas las soluciones; en memoria solo hay un bloque por tarea a la vez."""
+    for bloque in _mapear(_bloque_tarea, n, workers, profundidad):
+        yield from desempaquetar(bloque, n)
+
+
+def guardar_soluciones(
+    path: Path,
+    n: int,
+    workers: Optional[int] = None,
+    profundidad: int = PROFUNDIDAD,
+) -> int:
+    """Escribe todas las soluciones en `path` y devuelve cuántas son.
+
+    Formato: `MAGIA`, un byte con n y después las soluciones empaquetadas
+    (`bits_por_fila` bits por columna, little endian). Se escribe a un
+    temporal para no dejar archivos a medias.
+    """
+    path = Path(path)
+    temporal = path.with_name(path.name + ".tmp")
+    ancho = _ancho(n)
+    cantidad = 0
+    with temporal.open("wb") as archivo:
+        archivo.write(MAGIA + bytes((n,)))
+        for bloque in _mapear(_bloque_tarea, n, workers, profundidad):
+            archivo.write(bloque)
+            cantidad += len(bloque) // ancho
+    os.replace(temporal, path)
+    return cantidad
+
+
+def leer_soluciones(path: Path, bloque: int = 1 << 16) -> Iterator[Solution]:
+    """Lee un archivo de `guardar_soluciones` de a `bloque` soluciones."""
+    with Path(path).open("rb") as archivo:
+        encabezado = archivo.read(len(MAGIA) + 1)
+        if len(encabezado) != len(MAGIA) + 1 or encabezado[:len(MAGIA)] != MAGIA:
+            raise ValueError(f"{path} no es un archivo de soluciones de N-reinas")
+        n = encabezado[-1]
+        ancho = _ancho(n)
+        while True:
+            datos = archivo.read(ancho * bloque)
+            if not datos:
+                return
+            yield from desempaquetar(datos, n)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Enumera todas las soluciones de N-reinas en paralelo.")
+    parser.add_argument("n", type=int, help="Tamaño del tablero (número de reinas).")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="Procesos.")
+    parser.add_argument("--depth", type=int, default=PROFUNDIDAD, help="Columnas fijadas por tarea.")
+    parser.add_argument("--output", type=Path, default=None, help="Guarda las soluciones en un archivo binario.")
+    opciones = parser.parse_args()
+
+    if opciones.output is None:
+        cantidad = contar_soluciones(opciones.n, opciones.workers, opciones.depth)
+        print(f"{opciones.n}-reinas tiene {cantidad} solución(es).")
+    else:
+        cantidad = guardar_soluciones(opciones.output, opciones.n, opciones.workers, opciones.depth)
+        print(f"{cantidad} solución(es) guardadas en {opciones.output}")
+
+
+if __name__ == "__main__":
+    main()
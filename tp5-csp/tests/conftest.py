@@ -0,0 +1,25 @@
+"""Carga los módulos de `code/`, que tienen guiones en el nombre."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+CODE_DIR = Path(__file__).resolve().parents[1] / "code"
+sys.path.insert(0, str(CODE_DIR))
+
+
+def cargar(nombre: str, archivo: str):
+    if nombre not in sys.modules:
+        spec = importlib.util.spec_from_file_location(nombre, CODE_DIR / archivo)
+        modulo = importlib.util.module_from_spec(spec)
+        # Registrado antes de ejecutarlo: las dataclasses buscan su módulo en sys.modules
+        sys.modules[nombre] = modulo
+        spec.loader.exec_module(modulo)
+    return sys.modules[nombre]
+
+
+@pytest.fixture(scope="session")
+def csp():
+    return cargar("n_reinas_csp", "n-reinas-csp.py")
@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+import parallel_enumeration
+
+# Cantidad de soluciones de N-reinas para n = 1..10
+SOLUCIONES = {1: 1, 2: 0, 3: 0, 4: 2, 5: 10, 6: 4, 7: 40, 8: 92, 9: 352, 10: 724}
+
+
+def _es_solucion(solucion):
+    n = len(solucion)
+    return all(
+        solucion[i] != solucion[j] and abs(solucion[i] - solucion[j]) != j - i
+        for i in range(n)
+        for j in range(i + 1, n)
+    )
+
+
+@pytest.mark.parametrize("algoritmo", [
+    "n_reinas_backtracking",
+    "n_reinas_backtracking_bits",
+    "n_reinas_forward_checking",
+    "n_reinas_forward_checking_bits",
+    "n_reinas_csp",
+])
+@pytest.mark.parametrize("n", sorted(SOLUCIONES))
+def test_todas_las_soluciones(csp, algoritmo, n):
+    soluciones = getattr(csp, algoritmo)(n, buscar_todas=True)
+    assert len(soluciones) == SOLUCIONES[n]
+    assert len(set(soluciones)) == len(soluciones)
+    assert all(_es_solucion(solucion) for solucion in soluciones)
+
+
+@pytest.mark.parametrize("variables", ["fija", "mrv", "grado", "mrv_grado"])
+@pytest.mark.parametrize("valores", ["orden", "lcv"])
+@pytest.mark.parametrize("propagacion", ["ninguna", "fc", "mac"])
+@pytest.mark.parametrize("backjumping", [False, True])
+def test_combinaciones_csp(csp, variables, valores, propagacion, backjumping):
+    for n in (6, 8):
+        soluciones = csp.n_reinas_csp(
+            n, variables=variables, valores=valores, propagacion=propagacion, backjumping=backjumping
+        )
+        assert sorted(soluciones) == sorted(csp.n_reinas_backtracking(n))
+
+
+@pytest.mark.parametrize("n", range(4, 11))
+def test_forward_checking_bits_igual_al_original(csp, n):
+    # Mismos nodos y soluciones con y sin semilla; lanza AssertionError si difieren
+    csp.verificar_forward_checking_bits(n, semillas=tuple(range(10)))
+
+
+@pytest.mark.parametrize("n", [4, 6, 8])
+def test_forward_checking_bits_todas_con_semilla(csp, n):
+    csp.verificar_forward_checking_bits(n, semillas=(0, 1, 2), buscar_todas=True)
+
+
+@pytest.mark.parametrize("semilla", range(5))
+def test_backtracking_bits_igual_al_original(csp, semilla):
+    for n in (8, 10):
+        resultados = []
+        for backtracking in (csp.n_reinas_backtracking, csp.n_reinas_backtracking_bits):
+            stats = csp.BusquedaStats()
+            soluciones = backtracking(n, buscar_todas=False, rng=random.Random(semilla), stats=stats)
+            resultados.append((soluciones, stats.nodos_explorados))
+        assert resultados[0] == resultados[1]
+
+
+@pytest.mark.parametrize("n", sorted(SOLUCIONES))
+def test_enumeracion_paralela(csp, n):
+    assert parallel_enumeration.contar_soluciones(n, workers=1) == SOLUCIONES[n]
+    assert sorted(parallel_enumeration.iterar_soluciones(n, workers=1)) == sorted(csp.n_reinas_backtracking(n))
+
+
+def test_enumeracion_paralela_archivo(tmp_path):
+    path = tmp_path / "soluciones.bin"
+    assert parallel_enumeration.guardar_soluciones(path, 8, workers=2) == SOLUCIONES[8]
+    assert sorted(parallel_enumeration.leer_soluciones(path, bloque=7)) == sorted(parallel_enumeration.iterar_soluciones(8, workers=1))
@@ -10,6 +10,17 @@ import sys
 import netaddr
 import ipaddress
 import ast
+import struct
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
 
 
 @dataclass(frozen=True, eq=True, order=True)
@@ -47,22 +58,61 @@ class IP():
     """
     Immutable object representing an IPv4 address in the NetSecGame.
 
+    Instances are interned: building an IP from an address string that was
+    already seen returns the shared instance, so the address is parsed once
+    and equal IPs are usually the same object. The parsed address is kept as
+    an integer (the packed 32-bit value for IPv4, see `as_int`) and the
+    private flag is computed at the same time. Equality, hashing and ordering
+    all use the address string, as before: "::1" and "0::1" are different IPs.
+
     Attributes:
         ip (str): The IP address in dot-decimal notation.
     """
     ip: str
 
+    def __new__(cls, ip: str | None = None):
+        """
+        Return the shared instance for `ip` if there is one.
+        """
+        cached = _INTERNED_IPS.get(ip)
+        if cached is not None:
+            return cached
+        return super().__new__(cls)
+
     def __post_init__(self):
         """
-        Verify if the provided IP is valid.
+        Verify if the provided IP is valid and cache its integer value and private flag.
 
         Raises:
             ValueError: If the IP address is invalid.
         """
+        if "_int" in self.__dict__:
+            # Shared instance, already validated
+            return
         try:
-            ipaddress.ip_address(self.ip)
+            address = ipaddress.ip_address(self.ip)
         except ValueError:
             raise ValueError(f"Invalid IP address provided: {self.ip}")
+        # IPv6 addresses are moved above the IPv4 range so they never compare equal to one
+        value = int(address) if address.version == 4 else (1 << 32) + int(address)
+        object.__setattr__(self, "_int", value)
+        object.__setattr__(self, "_private", _ip_is_private(self.ip))
+        if len(_INTERNED_IPS) < MAX_INTERNED_IPS:
+            _INTERNED_IPS.setdefault(self.ip, self)
+
+    def __reduce__(self):
+        """
+        Pickle (and copy) through the constructor so the interning cache is used.
+        """
+        return (IP, (self.ip,))
+
+    def __setstate__(self, state: dict):
+        """
+        Restore IPs pickled with their full `__dict__` and rebuild the cached values.
+        """
+        for key, value in state.items():
+            object.__setattr__(self, key, value)
+        self.__post_init__()
 
     def __repr__(self)->str:
         """
@@ -85,23 +135,26 @@ class IP():
         """
         if not isinstance(other, IP):
             return NotImplemented
-        return self.ip == other.ip
-        
+        return self is other or self.ip == other.ip
+
+    @property
+    def as_int(self)->int:
+        """
+        Return the address as an integer (the packed 32-bit value for IPv4).
+
+        Returns:
+            int: The integer value of the address.
+        """
+        return self._int
+
     def is_private(self)->bool:
         """
-        Check if the IP address is private. Uses ipaddress module.
+        Check if the IP address is private. Computed once with the ipaddress module.
 
         Returns:
             is_private: True if the IP is private, False otherwise.
         """
-        try:
-            return ipaddress.IPv4Network(self.ip).is_private
-        except ipaddress.AddressValueError:
-            # The IP is a string 
-            # In the concepts, 'external' is the string used for external hosts.
-            if self.ip != 'external':
-                return True
-            return False
+        return self._private
     
     @classmethod
     def from_dict(cls, data: dict)->"IP":
@@ -125,6 +178,33 @@ class IP():
         """
         return hash(self.ip)
 
+
+# Shared IP instances, keyed by address string. A game only sees the hosts of
+# its scenario, but a long-lived process could parse arbitrary addresses, so the
+# cache stops growing at MAX_INTERNED_IPS; later addresses are plain instances.
+MAX_INTERNED_IPS = 1 << 16
+_INTERNED_IPS: Dict[str, IP] = {}
+
+
+def _ip_is_private(ip: str)->bool:
+    """
+    Check if an address string is private. Uses ipaddress module.
+
+    Args:
+        ip (str): The address.
+
+    Returns:
+        is_private: True if the IP is private, False otherwise.
+    """
+    try:
+        return ipaddress.IPv4Network(ip).is_private
+    except ipaddress.AddressValueError:
+        # The IP is a string 
+        # In the concepts, 'external' is the string used for external hosts.
+        if ip != 'external':
+            return True
+        return False
+
 @dataclass(frozen=True, eq=True)
 class Network():
     """
@@ -455,6 +535,11 @@ class Action:
                         params[k] = v
                     else:
                         params[k] = ast.literal_eval(v)
+                case "wire_formats":
+                    if isinstance(v, list):
+                        params[k] = v
+                    else:
+                        params[k] = ast.literal_eval(v)
                 case _:
                     raise ValueError(f"Unsupported value in {k}: {v}")
         return cls(action_type=action_type, parameters=params)
@@ -473,6 +558,32 @@ class Action:
         data_dict = json.loads(json_string)
         return cls.from_dict(data_dict)
 
+    def to_binary(self, wire_format: str = "msgpack") -> bytes:
+        """
+        Serialize the Action (its `as_dict` form) with a binary wire format.
+
+        Args:
+            wire_format (str): One of `available_wire_formats()`.
+
+        Returns:
+            bytes: The encoded action.
+        """
+        return encode_binary(self.as_dict, wire_format)
+
+    @classmethod
+    def from_binary(cls, data: bytes, wire_format: str = "msgpack") -> "Action":
+        """
+        Create an Action from its binary encoding.
+
+        Args:
+            data (bytes): The encoded action.
+            wire_format (str): The format used by `to_binary`.
+
+        Returns:
+            Action: The created Action object.
+        """
+        return cls.from_dict(decode_binary(data, wire_format))
+
     def __repr__(self) -> str:
         """
         Return the string representation of the Action.
@@ -669,6 +780,32 @@ class GameState():
                 )
         return state
 
+    def as_binary(self, wire_format: str = "msgpack") -> bytes:
+        """
+        Return the binary encoding of the GameState (its `as_dict` form).
+
+        Args:
+            wire_format (str): One of `available_wire_formats()`.
+
+        Returns:
+            bytes: The encoded game state.
+        """
+        return encode_binary(self.as_dict, wire_format)
+
+    @classmethod
+    def from_binary(cls, data: bytes, wire_format: str = "msgpack")->"GameState":
+        """
+        Create a GameState from its binary encoding.
+
+        Args:
+            data (bytes): The encoded game state.
+            wire_format (str): The format used by `as_binary`.
+
+        Returns:
+            GameState: The created GameState object.
+        """
+        return cls.from_dict(decode_binary(data, wire_format))
+
     @classmethod
     def from_json(cls, json_string)->"GameState":
         """
@@ -693,6 +830,213 @@ class GameState():
         return state
 
 
+class GameStateDecoder():
+    """
+    Decodes GameState dictionaries reusing the objects built in previous calls.
+
+    Meant to live as long as one connection. Services, Networks and Data are
+    frozen, so one instance per distinct dictionary is shared by every state
+    that contains it (IPs are already interned). Each section of the state is
+    also compared with the raw value received in the previous call and, if it
+    did not change, its decoded objects are reused. The decoder also applies
+    delta messages sent instead of a full state:
+
+        {"added": {section: items}, "removed": {section: items}}
+
+    where `items` has the same format as in `GameState.as_dict`. In the
+    sections keyed by host, a host mapped to `None` in "removed" drops the
+    whole entry. See `game_state_delta` for the encoder.
+
+    Attributes:
+        max_cached_objects (int): Size at which a cache of decoded objects is cleared.
+    """
+    SET_SECTIONS = ("known_networks", "known_hosts", "controlled_hosts")
+    HOST_SECTIONS = ("known_services", "known_data", "known_blocks")
+
+    def __init__(self, max_cached_objects: int = 100_000)->None:
+        self.max_cached_objects = max_cached_objects
+        self._networks = {}
+        self._services = {}
+        self._data = {}
+        self.reset()
+
+    def reset(self)->None:
+        """
+        Forget the previous state (the caches of decoded objects are kept).
+        """
+        self._raw = {}
+        self._sections = {}
+
+    def _cached(self, cache: dict, key: tuple, factory)->Any:
+        obj = cache.get(key)
+        if obj is None:
+            if len(cache) >= self.max_cached_objects:
+                cache.clear()
+            obj = cache[key] = factory(*key)
+        return obj
+
+    def _decode_item(self, section: str, item: dict)->Any:
+        match section:
+            case "known_networks":
+                return self._cached(self._networks, (item["ip"], item["mask"]), Network)
+            case "known_hosts" | "controlled_hosts" | "known_blocks":
+                return IP(item["ip"])
+            case "known_services":
+                return self._cached(self._services, (item["name"], item["type"], item["version"], item["is_local"]), Service)
+            case "known_data":
+                return self._cached(self._data, (item["owner"], item["id"], item["size"], item["type"], item["content"]), Data)
+        raise ValueError(f"Unknown GameState section: {section}")
+
+    def _decode_items(self, section: str, items: list)->frozenset:
+        return frozenset(self._decode_item(section, item) for item in items)
+
+    def _decode_section(self, section: str, raw)->Any:
+        previous_raw = self._raw.get(section)
+        if raw == previous_raw:
+            return self._sections[section]
+        if section in self.SET_SECTIONS:
+            return self._decode_items(section, raw)
+        # Sections keyed by host: only the hosts whose list changed are decoded again
+        previous_raw = previous_raw or {}
+        previous = self._sections.get(section, {})
+        decoded = {}
+        for host, items in raw.items():
+            if host in previous_raw and previous_raw[host] == items:
+                decoded[host] = previous[host]
+            else:
+                decoded[host] = self._decode_items(section, items)
+        return decoded
+
+    def _build(self)->GameState:
+        sections = self._sections
+        return GameState(
+            known_networks=set(sections["known_networks"]),
+            known_hosts=set(sections["known_hosts"]),
+            controlled_hosts=set(sections["controlled_hosts"]),
+            known_services={IP(host): set(items) for host, items in sections["known_services"].items()},
+            known_data={IP(host): set(items) for host, items in sections["known_data"].items()},
+            known_blocks={IP(host): set(items) for host, items in sections["known_blocks"].items()},
+        )
+
+    def decode(self, state_dict: dict)->GameState:
+        """
+        Decode a full state dictionary (same format as `GameState.from_dict`).
+
+        Args:
+            state_dict (dict): The game state as a dictionary.
+
+        Returns:
+            GameState: The decoded GameState object.
+        """
+        for section in self.SET_SECTIONS + self.HOST_SECTIONS:
+            raw = state_dict.get(section, {}) if section == "known_blocks" else state_dict[section]
+            self._sections[section] = self._decode_section(section, raw)
+            self._raw[section] = raw
+        return self._build()
+
+    def apply_delta(self, delta: dict)->GameState:
+        """
+        Apply a delta message to the last decoded state.
+
+        Args:
+            delta (dict): Dictionary with optional "added" and "removed" parts.
+
+        Returns:
+            GameState: The updated GameState object.
+
+        Raises:
+            ValueError: If there is no previous state to apply the delta to.
+        """
+        if not self._sections:
+            raise ValueError("Received a GameState delta before any full state.")
+        added, removed = delta.get("added", {}), delta.get("removed", {})
+        for section in self.SET_SECTIONS:
+            if section in added or section in removed:
+                current = self._sections[section]
+                current = current - self._decode_items(section, removed.get(section, []))
+                self._sections[section] = current | self._decode_items(section, added.get(section, []))
+                # The raw value no longer describes the section
+                self._raw[section] = None
+        for section in self.HOST_SECTIONS:
+            if section in added or section in removed:
+                current = dict(self._sections[section])
+                for host, items in removed.get(section, {}).items():
+                    if items is None:
+                        current.pop(host, None)
+                    elif host in current:
+                        current[host] = current[host] - self._decode_items(section, items)
+                for host, items in added.get(section, {}).items():
+                    current[host] = current.get(host, frozenset()) | self._decode_items(section, items)
+                self._sections[section] = current
+                self._raw[section] = None
+        return self._build()
+
+    def from_observation(self, observation_dict: dict)->GameState:
+        """
+        Decode the state of an observation dictionary, full ("state") or delta ("state_delta").
+
+        Args:
+            observation_dict (dict): The observation as received from the server.
+
+        Returns:
+            GameState: The decoded GameState object.
+        """
+        if "state_delta" in observation_dict:
+            return self.apply_delta(observation_dict["state_delta"])
+        return self.decode(observation_dict["state"])
+
+
+def game_state_delta(old: GameState, new: GameState)->dict:
+    """
+    Build the delta message that turns `old` into `new` (see `GameStateDecoder`).
+
+    Data objects compare equal by owner, id and type only; one whose size or
+    content changed is sent as removed and added again.
+
+    Args:
+        old (GameState): The state known by the receiver.
+        new (GameState): The new state.
+
+    Returns:
+        dict: Dictionary with the "added" and "removed" parts.
+    """
+    added, removed = {}, {}
+    for section in GameStateDecoder.SET_SECTIONS:
+        old_items, new_items = getattr(old, section), getattr(new, section)
+        if new_items - old_items:
+            added[section] = [dataclasses.asdict(x) for x in new_items - old_items]
+        if old_items - new_items:
+            removed[section] = [dataclasses.asdict(x) for x in old_items - new_items]
+    for section in GameStateDecoder.HOST_SECTIONS:
+        old_hosts, new_hosts = getattr(old, section), getattr(new, section)
+        section_added, section_removed = {}, {}
+        for host, items in new_hosts.items():
+            old_host_items = old_hosts.get(host)
+            if old_host_items is None:
+                section_added[str(host)] = [dataclasses.asdict(x) for x in items]
+                continue
+            host_added, host_removed = items - old_host_items, old_host_items - items
+            previous, changed = {}, set()
+            if section == "known_data":
+                # Only Data has fields outside equality; compare them field by field
+                previous = {x: x for x in old_host_items}
+                changed = {
+                    x for x in items
+                    if x in previous and (x.size != previous[x].size or x.content != previous[x].content)
+                }
+            if host_added or changed:
+                section_added[str(host)] = [dataclasses.asdict(x) for x in host_added | changed]
+            if host_removed or changed:
+                section_removed[str(host)] = [dataclasses.asdict(previous.get(x, x)) for x in host_removed | changed]
+        for host in old_hosts.keys() - new_hosts.keys():
+            section_removed[str(host)] = None
+        if section_added:
+            added[section] = section_added
+        if section_removed:
+            removed[section] = section_removed
+    return {"added": added, "removed": removed}
+
+
 # Observation - given to agent after taking an action
 """
 Observations are given when making a step in the environment.
@@ -826,6 +1170,68 @@ class ProtocolConfig:
     Attributes:
         END_OF_MESSAGE (bytes): End-of-message marker.
         BUFFER_SIZE (int): Buffer size for messages.
+        WIRE_FORMATS (tuple): Length-prefixed wire formats, in order of preference. "json" needs no extra library.
+        LENGTH_HEADER (struct.Struct): Length prefix of each message in a length-prefixed wire format.
     """
     END_OF_MESSAGE = b"EOF"
-    BUFFER_SIZE = 8192 
\ No newline at end of file
+    BUFFER_SIZE = 8192 
+    WIRE_FORMATS = ("msgpack", "cbor", "json")
+    LENGTH_HEADER = struct.Struct("!I")
+
+
+def available_wire_formats()->list:
+    """
+    Return the length-prefixed wire formats whose library is installed, in order of preference.
+
+    Returns:
+        list: Names of the usable wire formats.
+    """
+    installed = {"msgpack": msgpack is not None, "cbor": cbor2 is not None, "json": True}
+    return [wire_format for wire_format in ProtocolConfig.WIRE_FORMATS if installed[wire_format]]
+
+
+def encode_binary(obj: Any, wire_format: str)->bytes:
+    """
+    Encode a JSON-like object (dicts, lists, strings, numbers, bools) with a length-prefixed wire format.
+
+    Args:
+        obj (Any): The object to encode.
+        wire_format (str): "msgpack", "cbor" or "json".
+
+    Returns:
+        bytes: The encoded object.
+
+    Raises:
+        ValueError: If the wire format is unknown or its library is not installed.
+    """
+    if wire_format == "msgpack" and msgpack is not None:
+        return msgpack.packb(obj, use_bin_type=True)
+    if wire_format == "cbor" and cbor2 is not None:
+        return cbor2.dumps(obj)
+    if wire_format == "json":
+        return json.dumps(obj).encode()
+    raise ValueError(f"Unavailable wire format: {wire_format}")
+
+
+def decode_binary(data: bytes, wire_format: str)->Any:
+    """
+    Decode an object encoded with `encode_binary`.
+
+    Args:
+        data (bytes): The encoded object, or any buffer holding it (e.g. a memoryview of a receive buffer).
+        wire_format (str): "msgpack", "cbor" or "json".
+
+    Returns:
+        Any: The decoded object.
+
+    Raises:
+        ValueError: If the wire format is unknown or its library is not installed.
+    """
+    if wire_format == "msgpack" and msgpack is not None:
+        return msgpack.unpackb(data, raw=False)
+    if wire_format == "cbor" and cbor2 is not None:
+        return cbor2.loads(data)
+    if wire_format == "json":
+        # str() decodes straight from the buffer, without an intermediate bytes copy
+        return json.loads(str(data, "utf-8"))
+    raise ValueError(f"Unavailable wire format: {wire_format}")
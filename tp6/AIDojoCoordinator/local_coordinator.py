@@ -0,0 +1,320 @@
+# Local stand-in for the NetSecGame coordinator
+"""
+Small coordinator that speaks the same protocol as the NetSecGame server over a
+built-in scenario, so agents and the protocol code can be exercised without the
+real game (e.g. in tests or benchmarks):
+
+    with LocalCoordinator() as coordinator:
+        agent = RandomAttackerAgent("127.0.0.1", coordinator.port, "Attacker", seed=42)
+        observation = agent.register()
+
+Requests are JSON, answers are JSON terminated by `ProtocolConfig.END_OF_MESSAGE`.
+If the JoinGame action offers binary wire formats ("wire_formats") and one of
+them is enabled here, the answer names it in "wire_format" and every later
+message, in both directions, uses that format with a length prefix.
+
+The scenario: two /24 networks, a few hosts with services in each, the agent
+starts controlling one local host and one external host, and wins by
+exfiltrating the goal data to the external host. Every step costs -1, winning
+gives `GOAL_REWARD` and the episode ends after `max_steps` steps.
+"""
+import ipaddress
+import json
+import random
+import socketserver
+import threading
+
+from AIDojoCoordinator.game_components import (
+    Action, ActionType, Data, GameState, GameStatus, IP, Network, ProtocolConfig, Service,
+    available_wire_formats, decode_binary, encode_binary, game_state_delta,
+)
+
+GOAL_REWARD = 100
+STEP_REWARD = -1
+EXTERNAL_HOST = IP("213.47.23.195")
+GOAL_DATA = Data("User1", "DataFromServer1")
+SERVICE_CATALOG = (
+    Service("22/tcp, openssh", "passive", "8.1", False),
+    Service("80/tcp, http", "passive", "2.4", False),
+    Service("3389/tcp, rdp", "passive", "10.0", False),
+    Service("53/udp, dns", "passive", "9.16", True),
+)
+
+
+class LocalGame():
+    """
+    Game played by one connection of the LocalCoordinator.
+
+    Attributes:
+        seed (int): Seed of the topology (hosts, services and where the goal data is).
+        hosts_per_network (int): Hosts in each network, besides the gateway.
+        max_steps (int): Steps before the episode ends by timeout.
+    """
+    NETWORKS = (Network("192.168.1.0", 24), Network("192.168.2.0", 24))
+
+    def __init__(self, seed: int = 0, hosts_per_network: int = 5, max_steps: int = 100)->None:
+        self.seed = seed
+        self.hosts_per_network = hosts_per_network
+        self.max_steps = max_steps
+        self._rng = random.Random(seed)
+        self.new_topology()
+
+    def new_topology(self)->None:
+        """
+        Draw hosts, services and the location of the goal data, then start a new episode.
+        """
+        self.hosts = {}
+        for network in self.NETWORKS:
+            base = ipaddress.IPv4Network(str(network))
+            self.hosts[network] = [IP(str(base[i])) for i in range(2, 2 + self.hosts_per_network)]
+        self.services = {
+            host: set(self._rng.sample(SERVICE_CATALOG, self._rng.randint(1, 3)))
+            for hosts in self.hosts.values() for host in hosts
+        }
+        self.start_host = self.hosts[self.NETWORKS[0]][0]
+        self.goal_host = self._rng.choice(self.hosts[self.NETWORKS[-1]])
+        self.data = {self.goal_host: {GOAL_DATA}}
+        self.reset()
+
+    def reset(self)->None:
+        """
+        Start a new episode on the current topology.
+        """
+        self.steps = 0
+        self.end = False
+        self.state = GameState(
+            controlled_hosts={self.start_host, EXTERNAL_HOST},
+            known_hosts={self.start_host, EXTERNAL_HOST},
+            known_networks=set(self.NETWORKS),
+        )
+
+    def step(self, action: Action)->tuple:
+        """
+        Apply an action and return (reward, end, info).
+        """
+        state = self.state
+        params = action.parameters
+        source = params.get("source_host")
+        reward = STEP_REWARD
+        info = {}
+        self.steps += 1
+
+        if source in state.controlled_hosts:
+            match action.type:
+                case ActionType.ScanNetwork:
+                    for host in self.hosts.get(params["target_network"], []):
+                        state.known_hosts.add(host)
+                case ActionType.FindServices:
+                    target = params["target_host"]
+                    if target in state.known_hosts and target in self.services:
+                        state.known_services.setdefault(target, set()).update(self.services[target])
+                case ActionType.ExploitService:
+                    target = params["target_host"]
+                    if params["target_service"] in state.known_services.get(target, ()):
+                        state.controlled_hosts.add(target)
+                case ActionType.FindData:
+                    target = params["target_host"]
+                    if target in state.controlled_hosts:
+                        state.known_data.setdefault(target, set()).update(self.data.get(target, ()))
+                case ActionType.ExfiltrateData:
+                    target, data = params["target_host"], params["data"]
+                    if target in state.controlled_hosts and data in state.known_data.get(source, ()):
+                        state.known_data.setdefault(target, set()).add(data)
+                        if target == EXTERNAL_HOST and data == GOAL_DATA:
+                            reward += GOAL_REWARD
+                            self.end = True
+                            info["end_reason"] = "goal_reached"
+
+        if not self.end and self.steps >= self.max_steps:
+            self.end = True
+            info["end_reason"] = "max_steps"
+        return reward, self.end, info
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    """
+    Serves one agent connection.
+    """
+
+    def setup(self)->None:
+        coordinator = self.server.coordinator
+        self.game = LocalGame(coordinator.next_seed(), coordinator.hosts_per_network, coordinator.max_steps)
+        self.wire_format = None
+        self.buffer = bytearray()
+        self.sent_state = None
+
+    def handle(self)->None:
+        while True:
+            request = self._receive()
+            if request is None:
+                return
+            action = Action.from_dict(request)
+            if action.type is ActionType.QuitGame:
+                return
+            self._send(self._answer(action))
+
+    def _answer(self, action: Action)->dict:
+        game = self.game
+        wire_format = None
+        match action.type:
+            case ActionType.JoinGame:
+                game.reset()
+                status, reward, end, info = GameStatus.CREATED, 0, False, {}
+                message = f"Welcome {action.parameters['agent_info'].name}, registration successful!"
+                offered = action.parameters.get("wire_formats", [])
+                wire_format = next((f for f in offered if f in self.server.coordinator.wire_formats), None)
+                self.sent_state = None
+            case ActionType.ResetGame:
+                if action.parameters.get("randomize_topology", True):
+                    game.new_topology()
+                else:
+                    game.reset()
+                status, reward, end, info = GameStatus.RESET_DONE, 0, False, {}
+                message = "Resetting Game and starting again."
+                self.sent_state = None
+            case _:
+                if game.end:
+                    status, reward, end, info = GameStatus.BAD_REQUEST, 0, True, {}
+                    message = "Episode ended, request a reset."
+                else:
+                    reward, end, info = game.step(action)
+                    status, message = GameStatus.OK, None
+
+        observation = {"reward": reward, "end": end, "info": info}
+        if self.sent_state is not None and self.server.coordinator.send_deltas:
+            observation["state_delta"] = game_state_delta(self.sent_state, game.state)
+        else:
+            observation["state"] = game.state.as_dict
+        # Snapshot of what the agent knows, game.state keeps changing in place
+        self.sent_state = GameState.from_dict(game.state.as_dict)
+
+        answer = {"status": str(status), "observation": observation, "message": message}
+        if wire_format:
+            answer["wire_format"] = wire_format
+            # The answer itself still goes as JSON; the switch applies afterwards
+            self._send(answer)
+            self.wire_format = wire_format
+            return None
+        return answer
+
+    def _send(self, answer: dict)->None:
+        if answer is None:
+            return
+        if self.wire_format:
+            payload = encode_binary(answer, self.wire_format)
+            self.request.sendall(ProtocolConfig.LENGTH_HEADER.pack(len(payload)) + payload)
+        else:
+            self.request.sendall(json.dumps(answer).encode() + ProtocolConfig.END_OF_MESSAGE)
+
+    def _receive(self)->dict:
+        """
+        Next request as a dict, None when the agent closed the connection.
+        """
+        decoder = json.JSONDecoder()
+        while True:
+            if self.wire_format:
+                header = ProtocolConfig.LENGTH_HEADER
+                if len(self.buffer) >= header.size:
+                    (size,) = header.unpack_from(self.buffer)
+                    if len(self.buffer) >= header.size + size:
+                        payload = bytes(self.buffer[header.size:header.size + size])
+                        del self.buffer[:header.size + size]
+                        return decode_binary(payload, self.wire_format)
+            elif self.buffer:
+                # Agents do not terminate their JSON messages: read until one parses
+                try:
+                    request, end = decoder.raw_decode(self.buffer.decode())
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    pass
+                else:
+                    del self.buffer[:len(self.buffer.decode()[:end].encode())]
+                    return request
+            chunk = self.request.recv(ProtocolConfig.BUFFER_SIZE)
+            if not chunk:
+                return None
+            self.buffer += chunk
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class LocalCoordinator():
+    """
+    Threaded TCP server playing the LocalGame scenario, one game per connection.
+
+    Attributes:
+        host (str): Address to listen on.
+        port (int): Port to listen on, 0 picks a free one (see `port` after `start`).
+        wire_formats (tuple): Binary wire formats the server accepts (default: all installed).
+        send_deltas (bool): Send "state_delta" messages instead of full states after the first one.
+        seed (int): Seed of the first connection's topology; each new connection uses the next one.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, wire_formats: tuple = None, send_deltas: bool = False,
+                 seed: int = 0, hosts_per_network: int = 5, max_steps: int = 100)->None:
+        self.host = host
+        self.wire_formats = tuple(available_wire_formats() if wire_formats is None else wire_formats)
+        self.send_deltas = send_deltas
+        self.hosts_per_network = hosts_per_network
+        self.max_steps = max_steps
+        self._seed = seed
+        self._lock = threading.Lock()
+        self._requested_port = port
+        self._server = None
+        self._thread = None
+
+    def next_seed(self)->int:
+        with self._lock:
+            seed = self._seed
+            self._seed += 1
+        return seed
+
+    @property
+    def port(self)->int:
+        return self._server.server_address[1] if self._server else self._requested_port
+
+    def start(self)->"LocalCoordinator":
+        """
+        Start serving in a background thread.
+        """
+        self._server = _Server((self.host, self._requested_port), _Handler)
+        self._server.coordinator = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self)->None:
+        """
+        Stop serving and close the listening socket.
+        """
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self)->"LocalCoordinator":
+        return self.start()
+
+    def __exit__(self, *exc_info)->None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local stand-in for the NetSecGame coordinator.")
+    parser.add_argument("--host", default="127.0.0.1", type=str)
+    parser.add_argument("--port", default=9000, type=int)
+    parser.add_argument("--deltas", action="store_true", help="Send state deltas instead of full states.")
+    parser.add_argument("--seed", default=0, type=int)
+    args = parser.parse_args()
+
+    coordinator = LocalCoordinator(args.host, args.port, send_deltas=args.deltas, seed=args.seed).start()
+    print(f"Local coordinator listening on {args.host}:{coordinator.port} (wire formats: {coordinator.wire_formats})")
+    try:
+        coordinator._thread.join()
+    except KeyboardInterrupt:
+        coordinator.stop()
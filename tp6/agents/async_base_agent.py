@@ -0,0 +1,206 @@
+# Basic asyncio agent class, the counterpart of BaseAgent for running many game sessions from one event loop
+import asyncio
+import json
+import logging
+from abc import ABC
+
+from AIDojoCoordinator.game_components import Action, GameStateDecoder, Observation, ActionType, GameStatus, AgentInfo, ProtocolConfig, available_wire_formats, decode_binary
+
+class AsyncBaseAgent(ABC):
+    """
+    Basic agent for the network based NetSecGame environment on asyncio streams.
+
+    Same protocol and API as `BaseAgent` (`register`, `make_step`, `request_game_reset`, ...), but the
+    methods are coroutines, so a single event loop can keep many connections (e.g. one per coordinator)
+    waiting for the server at the same time. See `run_sessions` for a driver.
+
+    The connection is opened by `connect()` (or `async with agent:`), not in `__init__`.
+    """
+
+    def __init__(self, host, port, role:str, wire_formats:tuple=(), max_message_size:int=2**26)->None:
+        self._connection_details = (host, port)
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._role = role
+        self._offered_wire_formats = [f for f in available_wire_formats() if f in wire_formats]
+        # None means JSON messages terminated by ProtocolConfig.END_OF_MESSAGE
+        self._wire_format = None
+        # Largest message accepted from the server, in both framings
+        self._max_message_size = max_message_size
+        # Reuses the objects of previous observations received on this connection
+        self._state_decoder = GameStateDecoder()
+        self._reader = None
+        self._writer = None
+
+    async def connect(self)->None:
+        "Open the connection to the game server."
+        host, port = self._connection_details
+        self._reader, self._writer = await asyncio.open_connection(host, port, limit=self._max_message_size)
+        self._logger.info("Agent connected")
+
+    async def terminate_connection(self)->None:
+        "Method for graceful termination of connection. Should be used by any class extending the AsyncBaseAgent."
+        if self._writer:
+            try:
+                self._writer.close()
+                await self._writer.wait_closed()
+                self._logger.info("Connection closed")
+            except (ConnectionError, OSError) as e:
+                self._logger.error(f"Error closing connection: {e}")
+            self._reader = self._writer = None
+
+    async def __aenter__(self)->"AsyncBaseAgent":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info)->None:
+        await self.terminate_connection()
+
+    @property
+    def role(self)->str:
+        return self._role
+
+    @property
+    def logger(self)->logging.Logger:
+        return self._logger
+
+    @property
+    def wire_format(self)->str:
+        "Length-prefixed wire format negotiated with the server, None when using EOF-terminated JSON."
+        return self._wire_format
+
+    def _observation(self, observation_dict:dict, info)->Observation:
+        return Observation(self._state_decoder.from_observation(observation_dict), observation_dict["reward"], observation_dict["end"], info)
+
+    async def make_step(self, action: Action) -> Observation:
+        """
+        Executes a single step in the environment by sending the agent's action to the server and receiving the resulting observation.
+
+        Args:
+            action (Action): The action to be performed by the agent.
+
+        Returns:
+            Observation: The new observation, or None if the server sent no observation.
+        """
+        _, observation_dict, _ = await self.communicate(action)
+        if observation_dict:
+            return self._observation(observation_dict, observation_dict["info"])
+        else:
+            return None
+
+    async def communicate(self, data:Action)-> tuple:
+        """
+        Exchanges data with the server and returns the server's response, like `BaseAgent.communicate`.
+
+        Args:
+            data (Action): The action to send to the server. Must be an instance of `Action`.
+        Returns:
+            tuple: (status, observation, message) of the server response.
+        Raises:
+            ValueError: If `data` is not of type `Action`.
+            ConnectionError: If the connection is closed before the whole response arrived or the
+                response is larger than `max_message_size`.
+        """
+        if not isinstance(data, Action):
+            raise ValueError("Incorrect data type! Data should be ONLY of type Action")
+        try:
+            if self._wire_format:
+                header = ProtocolConfig.LENGTH_HEADER
+                payload = data.to_binary(self._wire_format)
+                self._writer.write(header.pack(len(payload)) + payload)
+                await self._writer.drain()
+                (size,) = header.unpack(await self._reader.readexactly(header.size))
+                if size > self._max_message_size:
+                    raise ConnectionError(f"Message of {size} bytes is larger than {self._max_message_size} bytes.")
+                data_dict = decode_binary(await self._reader.readexactly(size), self._wire_format)
+            else:
+                self._writer.write(data.to_json().encode())
+                await self._writer.drain()
+                message = await self._reader.readuntil(ProtocolConfig.END_OF_MESSAGE)
+                data_dict = json.loads(str(memoryview(message)[:-len(ProtocolConfig.END_OF_MESSAGE)], "utf-8"))
+                wire_format = data_dict.get("wire_format")
+                if wire_format:
+                    # The server accepted one of the offered formats for the rest of the connection
+                    if wire_format not in self._offered_wire_formats:
+                        raise ConnectionError(f"Server selected a wire format that was not offered: {wire_format}")
+                    self._logger.info(f"Using the {wire_format} wire format")
+                    self._wire_format = wire_format
+        except asyncio.IncompleteReadError as e:
+            raise ConnectionError("Unfinished connection.") from e
+        except asyncio.LimitOverrunError as e:
+            raise ConnectionError(f"Message larger than {self._max_message_size} bytes.") from e
+
+        status = data_dict["status"] if "status" in data_dict else {}
+        observation = data_dict["observation"] if "observation" in data_dict else {}
+        message = data_dict["message"] if "message" in data_dict else None
+        return GameStatus.from_string(status), observation, message
+
+    async def register(self)->Observation:
+        """
+        Method for registering agent to the game server.
+        Classname is used as agent name and the role is based on the 'role' argument.
+
+        Returns:
+            Observation: Initial observation if registration was successful, None otherwise.
+        """
+        try:
+            self._logger.info(f'Registering agent as {self.role}')
+            parameters = {"agent_info":AgentInfo(self.__class__.__name__,self.role)}
+            if self._offered_wire_formats:
+                parameters["wire_formats"] = self._offered_wire_formats
+            status, observation_dict, message = await self.communicate(Action(ActionType.JoinGame, parameters=parameters))
+            if status is GameStatus.CREATED:
+                self._logger.info(f"\tRegistration successful! {message}")
+                return self._observation(observation_dict, message)
+            else:
+                self._logger.error(f'\tRegistration failed! (status: {status}, msg:{message}')
+                return None
+        except Exception as e:
+            self._logger.error(f'Exception in register(): {e}')
+
+    async def request_game_reset(self, request_trajectory=False, randomize_topology=True) -> Observation:
+        """
+        Requests a game reset from the server. Optionally requests a trajectory and/or topology randomization.
+
+        Args:
+            request_trajectory (bool): If True, requests the server to provide a trajectory of the last episode.
+            randomize_topology (bool): If True, requests the server to randomize the network topology for the next episode. Defaults to True.
+        Returns:
+            Observation: The initial observation after the reset if successful, None otherwise.
+        """
+        self._logger.debug("Requesting game reset")
+        status, observation_dict, message = await self.communicate(Action(ActionType.ResetGame, parameters={"request_trajectory": request_trajectory, "randomize_topology": randomize_topology}))
+        if status:
+            self._logger.debug('\tReset successful')
+            return self._observation(observation_dict, message)
+        else:
+            self._logger.error(f'\rReset failed! (status: {status}, msg:{message}')
+            return None
+
+
+async def run_sessions(agents:list, play, max_concurrent:int=None)->list:
+    """
+    Run one game session per agent concurrently on the current event loop.
+
+    Each session connects the agent, registers it, awaits `play(agent, observation)` and closes the
+    connection. Agents usually point to different coordinators (hosts/ports); everything runs in
+    one thread, so the `play` coroutines can share state (e.g. a Q-table) without locks.
+
+    Args:
+        agents (list): AsyncBaseAgent instances, not connected yet.
+        play (coroutine function): Called as `await play(agent, observation)` with the registration observation.
+        max_concurrent (int): Maximum number of sessions open at the same time (default: all of them).
+
+    Returns:
+        list: Result of `play` for each agent, in the same order, or the exception that ended the session.
+    """
+    limit = asyncio.Semaphore(max_concurrent or max(len(agents), 1))
+
+    async def session(agent:AsyncBaseAgent):
+        async with limit:
+            async with agent:
+                observation = await agent.register()
+                if observation is None:
+                    raise ConnectionError(f"Registration of {agent.__class__.__name__} at {agent._connection_details} failed")
+                return await play(agent, observation)
+
+    return await asyncio.gather(*(session(agent) for agent in agents), return_exceptions=True)
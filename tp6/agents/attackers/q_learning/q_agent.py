@@ -22,8 +22,8 @@ from agents.agent_utils import generate_valid_actions, state_as_ordered_string
 
 class QAgent(BaseAgent):
 
-    def __init__(self, host, port, role="Attacker", alpha=0.1, gamma=0.6, epsilon_start=0.9, epsilon_end=0.1, epsilon_max_episodes=5000, apm_limit:int=None) -> None:
-        super().__init__(host, port, role)
+    def __init__(self, host, port, role="Attacker", alpha=0.1, gamma=0.6, epsilon_start=0.9, epsilon_end=0.1, epsilon_max_episodes=5000, apm_limit:int=None, wire_formats:tuple=()) -> None:
+        super().__init__(host, port, role, wire_formats=wire_formats)
         self.alpha = alpha
         self.gamma = gamma
         self.q_values = {}
@@ -280,6 +280,7 @@ if __name__ == '__main__':
     parser.add_argument("--env_conf", help="Configuration file of the env. Only for logging purposes.", required=False, default='./env/netsecenv_conf.yaml', type=str)
     parser.add_argument("--early_stop_threshold", help="Threshold for win rate for testing. If the value goes over this threshold, the training is stopped. Defaults to 95 (mean 95%% perc)", required=False, default=95, type=float)
     parser.add_argument("--apm", help="Actions per minute", default=10000, type=int, required=False)
+    parser.add_argument("--wire_format", help="Offer a length-prefixed wire format to the server", default=None, choices=["msgpack", "cbor", "json"])
     args = parser.parse_args()
 
     if not path.exists(args.logdir):
@@ -287,7 +288,7 @@ if __name__ == '__main__':
     logging.basicConfig(filename=path.join(args.logdir, "q_agent.log"), filemode='w', format='%(asctime)s %(name)s %(levelname)s %(message)s', datefmt='%H:%M:%S',level=logging.INFO)
 
     # Create agent
-    agent = QAgent(args.host, args.port, alpha=args.alpha, gamma=args.gamma, epsilon_start=args.epsilon_start, epsilon_end=args.epsilon_end, epsilon_max_episodes=args.epsilon_max_episodes, apm_limit=args.apm)
+    agent = QAgent(args.host, args.port, alpha=args.alpha, gamma=args.gamma, epsilon_start=args.epsilon_start, epsilon_end=args.epsilon_end, epsilon_max_episodes=args.epsilon_max_episodes, apm_limit=args.apm, wire_formats=(args.wire_format,) if args.wire_format else ())
 
     # Log for Actions. After agent creation
     actions_logger = logging.getLogger('QAgentActions')
@@ -0,0 +1,82 @@
+# Random attacker on asyncio: plays sessions on many coordinators (ports) at once from one process
+import asyncio
+import logging
+import argparse
+import random
+import numpy as np
+from os import path, makedirs
+from AIDojoCoordinator.game_components import Action, Observation
+from agents.async_base_agent import AsyncBaseAgent, run_sessions
+from agents.agent_utils import generate_valid_actions
+
+class AsyncRandomAttackerAgent(AsyncBaseAgent):
+
+    def __init__(self, host, port, role, seed, wire_formats:tuple=()) -> None:
+        super().__init__(host, port, role, wire_formats=wire_formats)
+        self._rng = random.Random(seed)
+
+    async def play_game(self, observation, num_episodes=1):
+        """
+        Play `num_episodes` episodes and return the list of (return, steps, end_reason) of each one.
+        """
+        episodes = []
+        for episode in range(num_episodes):
+            self._logger.info(f"Playing episode {episode}")
+            episodic_return, num_steps = 0, 0
+            while observation and not observation.end:
+                action = self.select_action(observation)
+                observation = await self.make_step(action)
+                episodic_return += observation.reward
+                num_steps += 1
+            end_reason = observation.info.get("end_reason") if observation and observation.info else None
+            self._logger.info(f"Episode {episode} ended with return {episodic_return} after {num_steps} steps")
+            episodes.append((episodic_return, num_steps, end_reason))
+            observation = await self.request_game_reset()
+        return episodes
+
+    def select_action(self, observation:Observation)->Action:
+        valid_actions = generate_valid_actions(observation.state)
+        return self._rng.choice(valid_actions)
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", help="Host where the game servers are", default="127.0.0.1", action='store', required=False)
+    parser.add_argument("--ports", help="Ports of the game servers, one or more sessions are played on each", default=[9000], type=int, nargs="+")
+    parser.add_argument("--sessions_per_port", help="Concurrent sessions on each game server", default=1, type=int)
+    parser.add_argument("--episodes", help="Episodes to play in each session", default=100, type=int)
+    parser.add_argument("--seed", help="Seed of the first session, the next sessions use the following ones", default=42, type=int)
+    parser.add_argument("--wire_format", help="Offer a length-prefixed wire format to the servers", default=None, choices=["msgpack", "cbor", "json"])
+    parser.add_argument("--logdir", help="Folder to store logs", default=path.join(path.dirname(path.abspath(__file__)), "logs"))
+    args = parser.parse_args()
+
+    if not path.exists(args.logdir):
+        makedirs(args.logdir)
+    logging.basicConfig(filename=path.join(args.logdir, "async_random_agent.log"), filemode='w', format='%(asctime)s %(name)s %(levelname)s %(message)s', datefmt='%H:%M:%S',level=logging.INFO)
+
+    wire_formats = (args.wire_format,) if args.wire_format else ()
+    agents = [
+        AsyncRandomAttackerAgent(args.host, port, "Attacker", seed=args.seed + i, wire_formats=wire_formats)
+        for i, port in enumerate(p for p in args.ports for _ in range(args.sessions_per_port))
+    ]
+
+    async def play(agent, observation):
+        return await agent.play_game(observation, args.episodes)
+
+    results = asyncio.run(run_sessions(agents, play))
+
+    episodes = []
+    for agent, result in zip(agents, results):
+        if isinstance(result, BaseException):
+            print(f"Session on port {agent._connection_details[1]} failed: {result}")
+        else:
+            episodes.extend(result)
+    if episodes:
+        returns = [episode[0] for episode in episodes]
+        steps = [episode[1] for episode in episodes]
+        text = f'''Final results of {len(episodes)} episodes in {len(agents) - sum(isinstance(r, BaseException) for r in results)} sessions.
+            average_returns={np.mean(returns):.3f} +- {np.std(returns):.3f},
+            average_episode_steps={np.mean(steps):.3f} +- {np.std(steps):.3f},
+            '''
+        logging.getLogger(AsyncRandomAttackerAgent.__name__).info(text)
+        print(text)
@@ -11,8 +11,8 @@ from agents.agent_utils import generate_valid_actions
 
 class RandomAttackerAgent(BaseAgent):
 
-    def __init__(self, host, port,role, seed) -> None:
-        super().__init__(host, port, role)
+    def __init__(self, host, port,role, seed, wire_formats:tuple=()) -> None:
+        super().__init__(host, port, role, wire_formats=wire_formats)
     
 
     def play_game(self, observation, num_episodes=1):
@@ -57,6 +57,7 @@ if __name__ == '__main__':
     parser.add_argument("--test_each", help="Evaluate performance during testing every this number of episodes.", default=10, type=int)
     parser.add_argument("--logdir", help="Folder to store logs", default=path.join(path.dirname(path.abspath(__file__)), "logs"))
     parser.add_argument("--evaluate", help="Evaluate the agent and report, instead of playing the game only once.", default=True)
+    parser.add_argument("--wire_format", help="Offer a length-prefixed wire format to the server", default=None, choices=["msgpack", "cbor", "json"])
     args = parser.parse_args()
 
     if not path.exists(args.logdir):
@@ -64,7 +65,7 @@ if __name__ == '__main__':
     logging.basicConfig(filename=path.join(args.logdir, "random_agent.log"), filemode='w', format='%(asctime)s %(name)s %(levelname)s %(message)s', datefmt='%H:%M:%S',level=logging.INFO)
 
     # Create agent
-    agent = RandomAttackerAgent(args.host, args.port,"Attacker", seed=42)
+    agent = RandomAttackerAgent(args.host, args.port,"Attacker", seed=42, wire_formats=(args.wire_format,) if args.wire_format else ())
 
     if not args.evaluate:
         # Play the normal game
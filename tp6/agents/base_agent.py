@@ -5,18 +5,34 @@ import socket
 import json
 from abc import ABC 
 
-from AIDojoCoordinator.game_components import Action, GameState, Observation, ActionType, GameStatus, AgentInfo, ProtocolConfig
+from AIDojoCoordinator.game_components import Action, GameStateDecoder, Observation, ActionType, GameStatus, AgentInfo, ProtocolConfig, available_wire_formats, decode_binary
 
 class BaseAgent(ABC):
     """
     Author: Ondrej Lukas, ondrej.lukas@aic.cvut.cz
     Basic agent for the network based NetSecGame environment. Implemenets communication with the game server.
+
+    Messages are JSON terminated by `ProtocolConfig.END_OF_MESSAGE` by default. If `wire_formats` lists
+    length-prefixed formats (see `ProtocolConfig.WIRE_FORMATS`, "json" needs no extra library), the installed
+    ones are offered when registering and, if the server picks one, every later message is sent and received
+    in that format with a length prefix. Both framings receive into one reusable buffer and decode each
+    message once. Messages larger than `max_message_size` bytes close the exchange with a `ConnectionError`
+    instead of growing the buffer without limit.
     """
 
-    def __init__(self, host, port, role:str)->None:
+    def __init__(self, host, port, role:str, wire_formats:tuple=(), max_message_size:int=2**26)->None:
         self._connection_details = (host, port)
         self._logger = logging.getLogger(self.__class__.__name__)
         self._role = role
+        self._offered_wire_formats = [f for f in available_wire_formats() if f in wire_formats]
+        # None means JSON messages terminated by ProtocolConfig.END_OF_MESSAGE
+        self._wire_format = None
+        # Largest message accepted from the server, the length header is not trusted beyond it
+        self._max_message_size = max_message_size
+        # Reused by every message received on this connection, grows with the largest one
+        self._receive_buffer = bytearray(ProtocolConfig.BUFFER_SIZE)
+        # Reuses the objects of previous observations received on this connection
+        self._state_decoder = GameStateDecoder()
         try:
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self._socket.connect((host, port))
@@ -43,6 +59,23 @@ class BaseAgent(ABC):
                 self._logger.info("Socket closed")
             except socket.error as e:
                 print(f"Error closing socket: {e}")
+    def _receive_view(self, size:int, keep:int=0)->memoryview:
+        """
+        Return a writable view of at least `size` bytes over the receive buffer, growing the buffer if needed.
+
+        Args:
+            size (int): Number of bytes needed.
+            keep (int): Number of bytes at the start of the buffer that must survive the growth.
+
+        Returns:
+            memoryview: View over the whole receive buffer.
+        """
+        if size > len(self._receive_buffer):
+            buffer = bytearray(max(size, 2 * len(self._receive_buffer)))
+            buffer[:keep] = memoryview(self._receive_buffer)[:keep]
+            self._receive_buffer = buffer
+        return memoryview(self._receive_buffer)
+
     @property
     def socket(self)->socket.socket:
         return self._socket
@@ -55,9 +88,15 @@ class BaseAgent(ABC):
     def logger(self)->logging.Logger:
         return self._logger
 
+    @property
+    def wire_format(self)->str:
+        "Binary wire format negotiated with the server, None when using JSON."
+        return self._wire_format
+
     def make_step(self, action: Action) -> Observation:
         """
         Executes a single step in the environment by sending the agent's action to the server and receiving the resulting observation.
+        The state is decoded with the connection's GameStateDecoder, so it can be a full state or a delta.
 
         Args:
             action (Action): The action to be performed by the agent.
@@ -71,7 +110,7 @@ class BaseAgent(ABC):
         """
         _, observation_dict, _ = self.communicate(action)
         if observation_dict:
-            return Observation(GameState.from_dict(observation_dict["state"]), observation_dict["reward"], observation_dict["end"], observation_dict["info"])
+            return Observation(self._state_decoder.from_observation(observation_dict), observation_dict["reward"], observation_dict["end"], observation_dict["info"])
         else:
             return None
     
@@ -79,7 +118,8 @@ class BaseAgent(ABC):
         """
         Exchanges data with the server and returns the server's response.
         This method sends an `Action` object to the server and waits for a response.
-        The response is expected to be a JSON-encoded string containing status, observation, and message fields.
+        The response is expected to be a JSON-encoded string containing status, observation, and message fields
+        (or the same fields in the negotiated binary wire format, once the server selected one).
         The method returns a tuple containing the parsed status, observation, and message.
         Args:
             data (Action): The action to send to the server. Must be an instance of `Action`.
@@ -90,39 +130,70 @@ class BaseAgent(ABC):
                 - message (str or None): An optional message from the server.
         Raises:
             ValueError: If `data` is not of type `Action`.
-            ConnectionError: If the server response is incomplete or missing the end-of-message marker.
+            ConnectionError: If the server response is incomplete, missing the end-of-message marker or
+                larger than `max_message_size`.
             Exception: If there is an error sending data to the server.
         """
 
-        def _send_data(socket, data:str)->None:
+        def _send_data(socket, data:bytes)->None:
             try:
                 self._logger.debug(f'Sending: {data}')
-                socket.sendall(data.encode())
+                socket.sendall(data)
             except Exception as e:
                 self._logger.error(f'Exception in _send_data(): {e}')
                 raise e
+
+        def _receive_into(socket, view:memoryview)->int:
+            received = socket.recv_into(view)
+            if not received:
+                raise ConnectionError("Unfinished connection.")
+            return received
+
+        def _receive_framed(socket)->dict:
+            """
+            Receive one length-prefixed message in the negotiated wire format
+            """
+            header = ProtocolConfig.LENGTH_HEADER
+            view = self._receive_view(header.size)
+            received = 0
+            while received < header.size:
+                received += _receive_into(socket, view[received:header.size])
+            (size,) = header.unpack_from(view)
+            if size > self._max_message_size:
+                raise ConnectionError(f"Message of {size} bytes is larger than {self._max_message_size} bytes.")
+            view = self._receive_view(size)
+            received = 0
+            while received < size:
+                received += _receive_into(socket, view[received:size])
+            # Decoded straight from the receive buffer
+            return decode_binary(view[:size], self._wire_format)
             
-        def _receive_data(socket)->tuple:
+        def _receive_data(socket)->dict:
             """
-            Receive data from server
+            Receive data from server (JSON terminated by the end-of-message marker)
             """
-            # Receive data from the server
-            data = b""  # Initialize an empty byte string
-
+            marker = ProtocolConfig.END_OF_MESSAGE
+            view = self._receive_view(ProtocolConfig.BUFFER_SIZE)
+            received = 0
             while True:
-                chunk = socket.recv(ProtocolConfig.BUFFER_SIZE)  # Receive a chunk
-                if not chunk:  # If no more data, break (connection closed)
-                    break
-                data += chunk
-                if ProtocolConfig.END_OF_MESSAGE in data:  # Check if EOF marker is present
+                if received == len(view):
+                    if received >= self._max_message_size:
+                        raise ConnectionError(f"Message larger than {self._max_message_size} bytes.")
+                    view = self._receive_view(2 * len(view), keep=received)
+                chunk = socket.recv_into(view[received:])
+                if not chunk:  # Connection closed
+                    raise ConnectionError("Unfinished connection.")
+                # Only the new bytes (and a possibly split marker) need to be searched
+                end = self._receive_buffer.find(marker, max(received - len(marker) + 1, 0), received + chunk)
+                received += chunk
+                if end >= 0:
                     break
-            if ProtocolConfig.END_OF_MESSAGE not in data:
-                raise ConnectionError("Unfinished connection.")
-            data = data.replace(ProtocolConfig.END_OF_MESSAGE, b"")  # Remove EOF marker
-            data = data.decode() 
+            data = str(view[:end], "utf-8")
             self._logger.debug(f"Data received from env: {data}")
             # extract data from string representation
-            data_dict = json.loads(data)
+            return json.loads(data)
+
+        def _parse_response(data_dict:dict)->tuple:
             # Add default values if dict keys are missing
             status = data_dict["status"] if "status" in data_dict else {}
             observation = data_dict["observation"] if "observation" in data_dict else {}
@@ -130,13 +201,24 @@ class BaseAgent(ABC):
 
             return GameStatus.from_string(status), observation, message
         
-        if isinstance(data, Action):
-            data = data.to_json()
-        else:
+        if not isinstance(data, Action):
             raise ValueError("Incorrect data type! Data should be ONLY of type Action")
-        
-        _send_data(self._socket, data)
-        return _receive_data(self._socket)
+
+        if self._wire_format:
+            payload = data.to_binary(self._wire_format)
+            _send_data(self._socket, ProtocolConfig.LENGTH_HEADER.pack(len(payload)) + payload)
+            return _parse_response(_receive_framed(self._socket))
+
+        _send_data(self._socket, data.to_json().encode())
+        data_dict = _receive_data(self._socket)
+        wire_format = data_dict.get("wire_format")
+        if wire_format:
+            # The server accepted one of the offered formats for the rest of the connection
+            if wire_format not in self._offered_wire_formats:
+                raise ConnectionError(f"Server selected a wire format that was not offered: {wire_format}")
+            self._logger.info(f"Using the {wire_format} wire format")
+            self._wire_format = wire_format
+        return _parse_response(data_dict)
     
     def register(self)->Observation:
         """
@@ -151,11 +233,13 @@ class BaseAgent(ABC):
         """
         try:
             self._logger.info(f'Registering agent as {self.role}')
-            status, observation_dict, message = self.communicate(Action(ActionType.JoinGame,
-                                                                         parameters={"agent_info":AgentInfo(self.__class__.__name__,self.role)}))
+            parameters = {"agent_info":AgentInfo(self.__class__.__name__,self.role)}
+            if self._offered_wire_formats:
+                parameters["wire_formats"] = self._offered_wire_formats
+            status, observation_dict, message = self.communicate(Action(ActionType.JoinGame, parameters=parameters))
             if status is GameStatus.CREATED:
                 self._logger.info(f"\tRegistration successful! {message}")
-                return Observation(GameState.from_dict(observation_dict["state"]), observation_dict["reward"], observation_dict["end"], message)
+                return Observation(self._state_decoder.from_observation(observation_dict), observation_dict["reward"], observation_dict["end"], message)
             else:
                 self._logger.error(f'\tRegistration failed! (status: {status}, msg:{message}')
                 return None
@@ -175,7 +259,7 @@ class BaseAgent(ABC):
         status, observation_dict, message = self.communicate(Action(ActionType.ResetGame, parameters={"request_trajectory": request_trajectory, "randomize_topology": randomize_topology}))
         if status:
             self._logger.debug('\tReset successful')
-            return Observation(GameState.from_dict(observation_dict["state"]), observation_dict["reward"], observation_dict["end"], message)
+            return Observation(self._state_decoder.from_observation(observation_dict), observation_dict["reward"], observation_dict["end"], message)
         else:
             self._logger.error(f'\rReset failed! (status: {status}, msg:{message}')
             return None
\ No newline at end of file
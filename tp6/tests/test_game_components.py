@@ -0,0 +1,103 @@
+"""Tests of the GameState decoder, the delta messages and the wire formats."""
+import json
+import random
+
+import pytest
+
+pytest.importorskip("netaddr")
+
+from AIDojoCoordinator.game_components import (
+    IP, Data, GameState, GameStateDecoder, Network, Service, available_wire_formats, decode_binary,
+    encode_binary, game_state_delta,
+)
+
+HOSTS = [IP(f"192.168.{net}.{host}") for net in (1, 2) for host in range(2, 12)]
+NETWORKS = [Network("192.168.1.0", 24), Network("192.168.2.0", 24), Network("10.0.0.0", 16)]
+SERVICES = [Service(f"{port}/tcp", "passive", "1.0", port == 22) for port in (22, 80, 443, 3389)]
+
+
+def _data_content(state: GameState)->dict:
+    # Data equality ignores size and content, so compare them explicitly
+    return {host: sorted((d.owner, d.id, d.type, d.size, d.content) for d in items) for host, items in state.known_data.items()}
+
+
+def _random_step(state: GameState, rng: random.Random)->GameState:
+    """
+    A copy of `state` with a few random additions, removals and Data updates.
+    """
+    state = GameState.from_dict(state.as_dict)
+    for _ in range(rng.randint(1, 4)):
+        host = rng.choice(HOSTS)
+        match rng.randrange(8):
+            case 0:
+                state.known_hosts.add(host)
+            case 1:
+                state.controlled_hosts.add(host)
+            case 2:
+                network = rng.choice(NETWORKS)
+                if network in state.known_networks:
+                    state.known_networks.discard(network)
+                else:
+                    state.known_networks.add(network)
+            case 3:
+                state.known_services.setdefault(host, set()).add(rng.choice(SERVICES))
+            case 4:
+                data = Data("User1", f"File{rng.randrange(3)}", rng.randrange(100), "", f"content{rng.randrange(5)}")
+                items = state.known_data.setdefault(host, set())
+                # Replaces an equal Data with other size or content
+                items.discard(data)
+                items.add(data)
+            case 5:
+                state.known_blocks.setdefault(host, set()).add(rng.choice(HOSTS))
+            case 6:
+                state.known_hosts.discard(host)
+                state.controlled_hosts.discard(host)
+            case 7:
+                for section in (state.known_services, state.known_data, state.known_blocks):
+                    section.pop(host, None)
+    return state
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_delta_matches_full_decode(seed):
+    rng = random.Random(seed)
+    state = GameState(known_networks={NETWORKS[0]}, known_hosts={HOSTS[0]}, controlled_hosts={HOSTS[0]})
+    delta_decoder, full_decoder = GameStateDecoder(), GameStateDecoder()
+    delta_decoder.from_observation({"state": state.as_dict})
+    for _ in range(60):
+        new_state = _random_step(state, rng)
+        # The delta travels as JSON, like the agents receive it
+        delta = json.loads(json.dumps(game_state_delta(state, new_state)))
+        from_delta = delta_decoder.from_observation({"state_delta": delta})
+        from_full = full_decoder.from_observation({"state": json.loads(json.dumps(new_state.as_dict))})
+        assert from_delta == from_full == new_state
+        assert _data_content(from_delta) == _data_content(from_full) == _data_content(new_state)
+        state = new_state
+
+
+def test_unchanged_state_has_empty_delta():
+    state = _random_step(GameState(), random.Random(0))
+    assert game_state_delta(state, GameState.from_dict(state.as_dict)) == {"added": {}, "removed": {}}
+
+
+def test_delta_before_full_state_is_rejected():
+    with pytest.raises(ValueError):
+        GameStateDecoder().from_observation({"state_delta": {"added": {}, "removed": {}}})
+
+
+def test_ip_interning_keeps_string_semantics():
+    assert IP("192.168.1.2") is IP("192.168.1.2")
+    assert IP("::1") != IP("0::1")
+    assert len({IP("::1"), IP("0::1")}) == 2
+    assert sorted([IP("10.0.0.2"), IP("10.0.0.10")]) == [IP("10.0.0.10"), IP("10.0.0.2")]
+    assert IP("192.168.1.2").as_int == (192 << 24) + (168 << 16) + (1 << 8) + 2
+
+
+@pytest.mark.parametrize("wire_format", ["json", "msgpack", "cbor"])
+def test_wire_format_round_trip(wire_format):
+    if wire_format not in available_wire_formats():
+        pytest.skip(f"{wire_format} is not installed")
+    state = _random_step(_random_step(GameState(), random.Random(1)), random.Random(2))
+    message = {"status": "GameStatus.OK", "observation": {"state": state.as_dict, "reward": -1, "end": False, "info": {}}}
+    decoded = decode_binary(encode_binary(message, wire_format), wire_format)
+    assert GameStateDecoder().from_observation(decoded["observation"]) == state
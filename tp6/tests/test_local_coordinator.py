@@ -0,0 +1,78 @@
+"""End-to-end tests of the agents against the LocalCoordinator."""
+import random
+
+import pytest
+
+pytest.importorskip("netaddr")
+pytest.importorskip("numpy")
+
+from AIDojoCoordinator.game_components import Action, ActionType, available_wire_formats
+from AIDojoCoordinator.local_coordinator import EXTERNAL_HOST, GOAL_DATA, GOAL_REWARD, STEP_REWARD, LocalCoordinator
+from agents.agent_utils import generate_valid_actions
+from agents.attackers.random.random_agent import RandomAttackerAgent
+
+
+def _winning_actions(agent, observation):
+    """
+    Play the scripted exfiltration of the goal data and return the last observation.
+    """
+    source = next(iter(observation.state.controlled_hosts - {EXTERNAL_HOST}))
+    for network in sorted(observation.state.known_networks):
+        observation = agent.make_step(Action(ActionType.ScanNetwork, {"source_host": source, "target_network": network}))
+    for host in sorted(observation.state.known_hosts - {EXTERNAL_HOST}):
+        observation = agent.make_step(Action(ActionType.FindServices, {"source_host": source, "target_host": host}))
+    for host, services in sorted(observation.state.known_services.items()):
+        service = min(services, key=str)
+        observation = agent.make_step(Action(ActionType.ExploitService, {"source_host": source, "target_host": host, "target_service": service}))
+    for host in sorted(observation.state.controlled_hosts - {EXTERNAL_HOST}):
+        observation = agent.make_step(Action(ActionType.FindData, {"source_host": source, "target_host": host}))
+    owner = next(host for host, data in observation.state.known_data.items() if GOAL_DATA in data)
+    return agent.make_step(Action(ActionType.ExfiltrateData, {"source_host": owner, "target_host": EXTERNAL_HOST, "data": GOAL_DATA}))
+
+
+@pytest.mark.parametrize("wire_formats", [(), ("json",), ("msgpack",), ("cbor",)])
+def test_register_steps_and_reset(wire_formats):
+    if wire_formats and wire_formats[0] not in available_wire_formats():
+        pytest.skip(f"{wire_formats[0]} is not installed")
+    with LocalCoordinator(port=0, seed=1) as coordinator:
+        agent = RandomAttackerAgent("127.0.0.1", coordinator.port, "Attacker", seed=42, wire_formats=wire_formats)
+        try:
+            observation = agent.register()
+            assert observation is not None
+            assert agent.wire_format == (wire_formats[0] if wire_formats else None)
+            initial_state = observation.state
+
+            observation = _winning_actions(agent, observation)
+            assert observation.end
+            assert observation.reward == GOAL_REWARD + STEP_REWARD
+            assert observation.info["end_reason"] == "goal_reached"
+            assert GOAL_DATA in observation.state.known_data[EXTERNAL_HOST]
+
+            observation = agent.request_game_reset(randomize_topology=False)
+            assert not observation.end
+            assert observation.state == initial_state
+        finally:
+            agent.terminate_connection()
+
+
+@pytest.mark.parametrize("wire_formats", [(), ("json",)])
+def test_deltas_match_full_states(wire_formats):
+    states = []
+    for send_deltas in (False, True):
+        with LocalCoordinator(port=0, seed=7, send_deltas=send_deltas) as coordinator:
+            agent = RandomAttackerAgent("127.0.0.1", coordinator.port, "Attacker", seed=0, wire_formats=wire_formats)
+            rng = random.Random(0)
+            try:
+                observation = agent.register()
+                played = [observation.state]
+                for _ in range(30):
+                    action = rng.choice(sorted(generate_valid_actions(observation.state), key=str))
+                    observation = agent.make_step(action)
+                    played.append(observation.state)
+                observation = agent.request_game_reset()
+                played.append(observation.state)
+                played.append(agent.make_step(rng.choice(sorted(generate_valid_actions(observation.state), key=str))).state)
+            finally:
+                agent.terminate_connection()
+        states.append(played)
+    assert states[0] == states[1]